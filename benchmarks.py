@@ -0,0 +1,195 @@
+"""Benchmarks for the performance sensitive puzzles.
+
+Run with: `python benchmarks.py`
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from timeit import timeit
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+import functional
+import graphs
+import grid
+import patterns
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def edit_distance(s: str, t: str, memo: Callable[[Callable], Callable]) -> int:
+    """Return the edit distance of `s` and `t` with `dist` memoized by `memo`.
+
+    The prefixes are visited in order, so the recursion is one level deep.
+    """
+
+    @memo
+    def dist(i: int, j: int) -> int:
+        return (
+            min(
+                dist(i - 1, j) + 1,
+                dist(i, j - 1) + 1,
+                dist(i - 1, j - 1) + int(s[i - 1] != t[j - 1]),
+            )
+            if i and j
+            else i + j
+        )
+
+    for i in range(len(s) + 1):
+        for j in range(len(t) + 1):
+            dist(i, j)
+    return dist(len(s), len(t))
+
+
+def find_loop(text: str, p: str) -> list[int]:
+    """Return positions of (overlapping) occurrences of `p` using a `str.find` loop."""
+    o = []
+    i = text.find(p)
+    while i >= 0:
+        o.append(i)
+        i = text.find(p, i + 1)
+    return o
+
+
+def bench_find_all(n: int = 1 << 20, number: int = 3) -> dict[str, dict[str, float]]:
+    """Compare `patterns.find_all` and `patterns.kmp_search` to `str.find` loops.
+
+    Returns seconds per run for a random and for a periodic text.
+    """
+    text = np.random.default_rng(0).choice(list("acgt"), n)
+    texts = {
+        "random": ("".join(text), "acgtacgt"),
+        "periodic": ("a" * n, "a" * 64),
+    }
+    o = {}
+    for name, (text, p) in texts.items():
+        o[name] = {
+            "find_loop": timeit(lambda: find_loop(text, p), number=number) / number,
+            "find_all": timeit(lambda: patterns.find_all(text, p), number=number)
+            / number,
+            "kmp_search": timeit(
+                lambda: list(patterns.kmp_search(text, p)), number=number
+            )
+            / number,
+        }
+    return o
+
+
+def bench_breadth_first(
+    n: int = 1 << 20, m: int = 1 << 23, number: int = 3
+) -> dict[str, dict[str, float]]:
+    """Compare `graphs.frontier_breadth_first` to `graphs.breadth_first`.
+
+    Returns seconds per run for a random graph with `n` nodes and `m` edges.
+    """
+    edges = np.random.default_rng(0).integers(0, n, (m, 2))
+    gr = graphs.Graph.from_edges(edges, n)
+    return {
+        "random": {
+            "breadth_first": timeit(lambda: graphs.breadth_first(gr), number=number)
+            / number,
+            "frontier_breadth_first": timeit(
+                lambda: graphs.frontier_breadth_first(gr), number=number
+            )
+            / number,
+        }
+    }
+
+
+def bench_biconnected(
+    n: int = 1 << 20, m: int = 1 << 22, number: int = 1
+) -> dict[str, dict[str, float]]:
+    """Time `graphs.biconnected` relative to a `graphs.breadth_first` traversal.
+
+    Returns seconds per run for a random graph with `n` nodes and `m` edges,
+    and for a path-like graph with `m` edges: a path with random chords,
+    which makes the DFS as deep as the graph. Edges are stored both ways,
+    so the graphs hold `2 * m` (up to 10^7) directed edges.
+    """
+    rng = np.random.default_rng(0)
+    chords = rng.integers(0, m, (m >> 4, 2))
+    path = np.arange(m - len(chords))
+    cases = {
+        "random": graphs.Graph.from_edges(
+            rng.integers(0, n, (m, 2)), n, undirected=True
+        ),
+        "path": graphs.Graph.from_edges(
+            np.concatenate((np.c_[path[:-1], path[1:]], chords % len(path))),
+            undirected=True,
+        ),
+    }
+    return {
+        name: {
+            "breadth_first": timeit(lambda: graphs.breadth_first(gr), number=number)
+            / number,
+            "biconnected": timeit(lambda: graphs.biconnected(gr), number=number)
+            / number,
+        }
+        for name, gr in cases.items()
+    }
+
+
+def bench_cost_grid(
+    n: int = 2000, m: int = 4000, number: int = 1
+) -> dict[str, dict[str, float]]:
+    """Time `grid.CostGrid` searches on an `n` by `m` grid of random costs 1-9.
+
+    Returns seconds per run for a full search from a corner, and for an A* search
+    between the opposite corners, with 4 and 8 moves per cell. The float case
+    has uniform costs in `[0.001, 1)` and a single cell of cost 1e-6.
+    """
+    rng = np.random.default_rng(0)
+    costs = rng.integers(1, 10, (n, m))
+    floats = rng.uniform(0.001, 1, (n, m))
+    floats[n // 2, m // 2] = 1e-6
+    cases = {
+        "4-way": grid.CostGrid(costs),
+        "8-way": grid.CostGrid(costs, diagonal=True),
+        "float": grid.CostGrid(floats),
+    }
+    return {
+        name: {
+            "search": timeit(lambda: gr.search([(0, 0)]), number=number) / number,
+            "shortest_path": timeit(
+                lambda: gr.shortest_path((0, 0), (n - 1, m - 1)), number=number
+            )
+            / number,
+        }
+        for name, gr in cases.items()
+    }
+
+
+def bench_memo(n: int = 1000, number: int = 1) -> dict[str, dict[str, float]]:
+    """Compare `functional.memoize` tables to `functools.lru_cache`.
+
+    Returns seconds per run for the edit distance of two random `n`-long strings.
+    """
+    s, t = ("".join(np.random.default_rng(k).choice(list("acgt"), n)) for k in (0, 1))
+    memos = {
+        "lru_cache": lru_cache(None),
+        "memo": functional.memoize(None),
+        "dense_memo": functional.memoize(shape=(n + 1, n + 1)),
+    }
+    return {
+        "random": {
+            name: timeit(lambda: edit_distance(s, t, memo), number=number) / number
+            for name, memo in memos.items()
+        }
+    }
+
+
+if __name__ == "__main__":
+    benches = (
+        bench_find_all,
+        bench_breadth_first,
+        bench_biconnected,
+        bench_cost_grid,
+        bench_memo,
+    )
+    for bench in benches:
+        print(bench.__name__)  # noqa: T201
+        for case, timings in bench().items():
+            print(f"  {case}:", *(f"{k}={v:.4f}s" for k, v in timings.items()))  # noqa: T201
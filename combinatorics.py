@@ -2,10 +2,18 @@
 
 from __future__ import annotations
 
-from functools import lru_cache
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from itertools import pairwise
+from math import comb, factorial
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+
 DD = np.longdouble
 
 LOG2_GOLDEN_RATIO = np.log2(1.0 + np.sqrt(5.0, dtype=DD), dtype=DD) - 1.0
@@ -109,3 +117,271 @@ def sum_of_456_numbers(x: int, y: int, z: int, mod: int = 10**9 + 7) -> int:
     s = 0
     f(x, y, z)
     return s
+
+
+def next_permutation(a: list) -> bool:
+    """Rearrange `a` in place into the next lexicographic permutation.
+
+    Return False, and reset `a` to the first permutation, if `a` was the last one.
+    Repeated elements produce each distinct permutation once.
+    """
+    # Find the longest non-increasing suffix `a[i + 1:]`.
+    i = len(a) - 2
+    while i >= 0 and a[i] >= a[i + 1]:
+        i -= 1
+    if i >= 0:
+        # Swap the pivot with the rightmost element greater than the pivot.
+        j = len(a) - 1
+        while a[j] <= a[i]:
+            j -= 1
+        a[i], a[j] = a[j], a[i]
+    # The suffix is now non-increasing. Reverse to get the lowest order.
+    a[i + 1 :] = reversed(a[i + 1 :])
+    return i >= 0
+
+
+def permutation_count(iterable: Iterable) -> int:
+    """Return the number of distinct permutations of the (multi-)set `iterable`."""
+    c = Counter(iterable).values()
+    o = factorial(sum(c))
+    for v in c:
+        o //= factorial(v)
+    return o
+
+
+def permutation_rank(seq: Sequence) -> int:
+    """Return the index of `seq` in the lexicographic order of its permutations."""
+    # For each position count the permutations starting with a smaller element.
+    c = Counter(seq)
+    total, n, rank = permutation_count(seq), len(seq), 0
+    for x in seq:
+        rank += sum(total * v // n for k, v in c.items() if k < x)
+        total = total * c[x] // n
+        n -= 1
+        c[x] -= 1
+    return rank
+
+
+def permutation_unrank(iterable: Iterable, k: int) -> tuple:
+    """Return the `k`-th distinct lexicographic permutation of `iterable`."""
+    c = Counter(iterable)
+    keys = sorted(c)
+    n = c.total()
+    total = permutation_count(c.elements())
+    if not 0 <= k < total:
+        raise IndexError(k)
+    o = []
+    while n:
+        for x in keys:
+            # Number of permutations starting with `x`.
+            sub = total * c[x] // n
+            if k < sub:
+                break
+            k -= sub
+        o.append(x)
+        c[x] -= 1
+        total, n = sub, n - 1
+    return tuple(o)
+
+
+def permutations(
+    iterable: Iterable, start: int = 0, stop: int | None = None
+) -> Iterator[tuple]:
+    """Generate distinct permutations of `iterable` in lexicographic order.
+
+    Only the permutations with ranks in `[start, stop)` are generated.
+    """
+    a = sorted(iterable)
+    total = permutation_count(a)
+    stop = total if stop is None else min(stop, total)
+    if start >= stop:
+        return
+    if start:
+        a = list(permutation_unrank(a, start))
+    yield tuple(a)
+    for _ in range(start + 1, stop):
+        next_permutation(a)
+        yield tuple(a)
+
+
+def subset_rank(indexes: Sequence[int], n: int) -> int:
+    """Return the rank of the sorted `indexes` among the subsets of `range(n)`.
+
+    The subsets are ordered by size first and lexicographically second,
+    like: `(), (0,), (1,), (0, 1)` for `n = 2`.
+    """
+    s = len(indexes)
+    # Skip all the smaller subsets.
+    rank = sum(comb(n, t) for t in range(s))
+    prev = -1
+    for i, c in enumerate(indexes):
+        # Skip the combinations with a smaller element on position `i`.
+        rank += sum(comb(n - 1 - v, s - 1 - i) for v in range(prev + 1, c))
+        prev = c
+    return rank
+
+
+def subset_unrank(n: int, k: int) -> tuple[int, ...]:
+    """Return the `k`-th subset of `range(n)` in the order of `subset_rank`."""
+    if not 0 <= k < 1 << n:
+        raise IndexError(k)
+    s = 0
+    while k >= comb(n, s):
+        k -= comb(n, s)
+        s += 1
+    o = []
+    v = 0
+    for i in range(s):
+        # Skip the combinations with `v` on position `i` until `k` fits.
+        while k >= (c := comb(n - 1 - v, s - 1 - i)):
+            k -= c
+            v += 1
+        o.append(v)
+        v += 1
+    return tuple(o)
+
+
+def next_subset(c: list[int], n: int) -> bool:
+    """Advance `c` in place to the next subset of `range(n)` as in `subset_rank`.
+
+    Return False, and reset `c` to the empty subset, if `c` was the full set.
+    """
+    s = len(c)
+    # Find the rightmost index that can be incremented.
+    i = s - 1
+    while i >= 0 and c[i] == n - s + i:
+        i -= 1
+    if i >= 0:
+        c[i:] = range(c[i] + 1, c[i] + 1 + s - i)
+        return True
+    # Continue with the first subset of the next size.
+    c[:] = range(s + 1) if s < n else ()
+    return s < n
+
+
+def subsets(
+    iterable: Iterable, start: int = 0, stop: int | None = None
+) -> Iterator[tuple]:
+    """Generate the subsets of `iterable` ordered by size and position.
+
+    Only the subsets with ranks in `[start, stop)` are generated.
+    """
+    items = tuple(iterable)
+    n = len(items)
+    stop = 1 << n if stop is None else min(stop, 1 << n)
+    if start >= stop:
+        return
+    c = list(subset_unrank(n, start))
+    yield tuple(items[i] for i in c)
+    for _ in range(start + 1, stop):
+        next_subset(c, n)
+        yield tuple(items[i] for i in c)
+
+
+def lyndon_words(k: int, n: int) -> Iterator[bytearray]:
+    """Generate the Lyndon words of length up to `n` over the alphabet `range(k)`.
+
+    The words are generated in lexicographic order (FKM algorithm).
+    Each word is a fresh `bytearray`, so `k <= 256`.
+    """
+    if k <= 0 or n <= 0:
+        return
+    w = bytearray(1)
+    while True:
+        yield w[:]
+        # Repeat the word up to length `n`, then find the next prefix to increment.
+        w = (w * (n // len(w) + 1))[:n]
+        while w and w[-1] == k - 1:
+            w.pop()
+        if not w:
+            return
+        w[-1] += 1
+
+
+def de_bruijn(k: int, n: int) -> Iterator[bytearray]:
+    """Generate the cyclic de Bruijn sequence `B(k, n)` in chunks.
+
+    Every string of length `n` over `range(k)` appears exactly once
+    as a cyclic substring of the concatenated chunks.
+    """
+    # Runs in O(k^n): the concatenation of the Lyndon words,
+    # with length dividing `n`, in lexicographic order.
+    return (w for w in lyndon_words(k, n) if n % len(w) == 0)
+
+
+def de_bruijn_bytes(k: int, n: int, alphabet: bytes | None = None) -> bytearray:
+    """Return the shortest string containing all `n`-length strings over `k` symbols.
+
+    This is the de Bruijn sequence `B(k, n)` followed by its first `n - 1` symbols.
+    The symbols are `range(k)`, or the first `k` bytes of `alphabet`.
+    """
+    if k > 256 or (alphabet is not None and k > len(alphabet)):
+        msg = f"alphabet too small for {k} symbols"
+        raise ValueError(msg)
+    o = bytearray()
+    for w in de_bruijn(k, n):
+        o += w
+    o += o[: n - 1] if k > 1 else o * (n - 1)
+    if alphabet is not None:
+        o = o.translate(bytes.maketrans(bytes(range(k)), alphabet[:k]))
+    return o
+
+
+def chunks(size: int, parts: int) -> list[range]:
+    """Split `range(size)` into at most `parts` contiguous ranges of similar length."""
+    parts = max(1, min(parts, size))
+    q, r = divmod(size, parts)
+    bounds = [i * q + min(i, r) for i in range(parts + 1)]
+    return [range(a, b) for a, b in pairwise(bounds) if a < b]
+
+
+def _apply_chunk(func: Callable, space: Callable, r: range) -> Any:
+    return func(space(start=r.start, stop=r.stop))
+
+
+def map_chunks(
+    func: Callable[[Iterator], Any],
+    space: Callable[..., Iterator],
+    size: int,
+    workers: int | None = None,
+    parts: int | None = None,
+) -> Iterator:
+    """Apply `func` to chunks of the enumeration `space` in worker processes.
+
+    `space(start=..., stop=...)` generates the elements with ranks in `[start, stop)`,
+    e.g.: `partial(permutations, items)`. `size` is the total number of elements.
+    The results of `func` are generated in the order of the chunks.
+    The `func` and `space` must be picklable, i.e. no lambdas.
+    With `workers == 1` the chunks are processed in this process.
+    """
+    rs = chunks(size, parts or 4 * (workers or 8))
+    if workers == 1:
+        yield from (_apply_chunk(func, space, r) for r in rs)
+        return
+    ex = ProcessPoolExecutor(workers)
+    try:
+        yield from ex.map(partial(_apply_chunk, func, space), rs)
+    finally:
+        # Do not wait for the remaining chunks if the consumer stopped early.
+        ex.shutdown(cancel_futures=True)
+
+
+def _first(pred: Callable, it: Iterator) -> Any:
+    return next(filter(pred, it), None)
+
+
+def parallel_find_if(
+    pred: Callable,
+    space: Callable[..., Iterator],
+    size: int,
+    workers: int | None = None,
+    parts: int | None = None,
+) -> Any:
+    """Return the first element of `space` satisfying `pred` or None.
+
+    The search is split across worker processes, see `map_chunks`.
+    """
+    for x in map_chunks(partial(_first, pred), space, size, workers, parts):
+        if x is not None:
+            return x
+    return None
@@ -4,6 +4,14 @@ from __future__ import annotations
 
 from collections import Counter
 from functools import lru_cache
+from itertools import accumulate
+from typing import TYPE_CHECKING
+
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 
 def stack_boxes(dims: list[tuple[int, int, int]]) -> int:
@@ -121,3 +129,121 @@ def divide_number_into_groups(n: int, k: int) -> int:
         return j == 1 or sum(r(j - 1, v, s - v) for v in range(p, s // j + 1))
 
     return int(r(k, 1, n))
+
+
+def interval_fill(n: int, cell: Callable, start: int = 1) -> list[list]:
+    """Fill an interval DP table bottom-up, one diagonal at a time.
+
+    The table `dp[i][j]` covers the intervals `[i, j)` for `0 <= i < j <= n`.
+    Diagonals are filled in the order of interval length from `start` to `n`,
+    calling: `dp[i][j] = cell(dp, i, j)`. So `cell` may access all
+    `dp[i][k]` and `dp[k][j]` for `i < k < j`.
+    """
+    dp: list[list] = [[None] * (n + 1) for _ in range(n + 1)]
+    for d in range(start, n + 1):
+        for i in range(n - d + 1):
+            dp[i][i + d] = cell(dp, i, i + d)
+    return dp
+
+
+def int_dtype(high: int) -> type:
+    """Return `np.int64` if it holds integers up to `high`, else exact `object`."""
+    return np.int64 if high < 1 << 63 else object
+
+
+def interval_dp(
+    n: int,
+    split: Callable,
+    op: str = "min",
+    *,
+    knuth: bool = False,
+    argopt: bool = False,
+    dtype: type = np.int64,
+) -> np.ndarray | tuple[np.ndarray, np.ndarray]:
+    """Solve the interval DP: `dp[i, j] = op(dp[i, k] + dp[k, j] + split(i, k, j))`.
+
+    The `op` is one of "min" or "max" over `i < k < j` for `0 <= i < j <= n`,
+    with `dp[i, i + 1] == 0`. The table is filled bottom-up, one diagonal
+    at a time. Each diagonal is computed with NumPy at once, so `split`
+    receives broadcastable integer arrays `i`, `k`, `j` and returns an array.
+
+    With `knuth=True` the search of `k` is limited to Knuth's bounds:
+    `opt[i, j - 1] <= k <= opt[i + 1, j]`. This runs in O(N^2), but is valid
+    only if `split(i, k, j) == w(i, j)` does not depend on `k` and `w`
+    satisfies the quadrangle inequality, e.g. for sums of ranges.
+    Matrix chain like costs: `a[i] * a[k] * a[j]` do not qualify.
+
+    Parameters
+    ----------
+    n : int
+        the number of unit intervals
+    split : Callable
+        cost of splitting `[i, j)` at `k`
+    op : str, optional
+        "min" or "max", by default "min"
+    knuth : bool, optional
+        use Knuth's optimization, by default False
+    argopt : bool, optional
+        also return the table of optimal splits `k`, by default False
+    dtype : type, optional
+        the type of the DP table, by default `np.int64`, which overflows silently;
+        use `object` for exact Python ints, see `int_dtype`
+
+    Returns
+    -------
+    np.ndarray | tuple[np.ndarray, np.ndarray]
+        the `(n + 1) x (n + 1)` DP table, and optionally the optimal splits
+
+    """
+    dp = np.zeros((n + 1, n + 1), dtype=dtype)
+    opt = np.zeros((n + 1, n + 1), dtype=np.int64)
+    opt[np.arange(n), np.arange(1, n + 1)] = np.arange(1, n + 1)
+    if knuth:
+        # Scalar loops run faster on Python lists than on NumPy arrays.
+        t = [[0] * (n + 1) for _ in range(n + 1)]
+        o = opt.tolist()
+        pick = min if op == "min" else max
+        for d in range(2, n + 1):
+            for i in range(n - d + 1):
+                j = i + d
+                ti, lo, hi = t[i], max(o[i][j - 1], i + 1), min(o[i + 1][j], j - 1)
+                v, k = pick((ti[k] + t[k][j], k) for k in range(lo, hi + 1))
+                ti[j] = v + int(split(i, k, j))
+                o[i][j] = k
+        dp, opt = np.array(t, dtype=dtype), np.array(o, dtype=np.int64)
+        return (dp, opt) if argopt else dp
+
+    # `dpt` is the transposed table, so that both the left parts `dp[i, k]`
+    # and the right parts `dp[k, j]` of a diagonal are strided views
+    # with the split `k` along the contiguous last axis.
+    dpt = np.zeros_like(dp)
+    reduce_, arg_ = (np.min, np.argmin) if op == "min" else (np.max, np.argmax)
+    row = dp.strides[0] + dp.strides[1]  # stride along a diagonal
+    col = dp.strides[1]
+    flat, flatt = dp.reshape(-1), dpt.reshape(-1)
+    for d in range(2, n + 1):
+        cnt = n - d + 1
+        i = np.arange(cnt)
+        m = np.arange(1, d)
+        # left[i, m] = dp[i, i + m], right[i, m] = dp[i + m, i + d]
+        left = as_strided(dp[0, 1:], shape=(cnt, d - 1), strides=(row, col))
+        right = as_strided(dpt[d, 1:], shape=(cnt, d - 1), strides=(row, col))
+        cand = split(i[:, None], i[:, None] + m, i[:, None] + d) + left
+        cand += right
+        flat[i * (n + 2) + d] = flatt[(i + d) * (n + 1) + i] = reduce_(cand, axis=1)
+        if argopt:
+            opt[i, i + d] = arg_(cand, axis=1) + i + 1
+    return (dp, opt) if argopt else dp
+
+
+def merge_piles_cost(a: list[int]) -> int:
+    """Return the minimum cost of merging adjacent piles of sizes `a` into one.
+
+    Merging two adjacent piles costs the sum of their sizes.
+    """
+    # The cost of the last merge of `a[i:j]` is the sum of the range,
+    # which satisfies Knuth's conditions. Runs in O(N^2).
+    s = list(accumulate(a, initial=0))
+    cost = lambda i, _, j: s[j] - s[i]
+    dtype = int_dtype(s[-1] * len(a))
+    return int(interval_dp(len(a), cost, knuth=True, dtype=dtype)[0, -1])
@@ -2,7 +2,14 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections import OrderedDict
+from functools import reduce, update_wrapper
+from operator import mul
+from sys import getsizeof
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 
 def bit(x: Any) -> int:
@@ -14,3 +21,159 @@ def bit(x: Any) -> int:
 def identity(a: Any, *args: Any) -> Any:
     """Return the same thing back."""
     return (a, *args) if args else a
+
+
+class MemoInfo(NamedTuple):
+    """Statistics of a memoization cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    nbytes: int
+
+
+class Memo:
+    """Memoize a function in a bounded LRU cache with hit and miss counters.
+
+    The cache is bounded by the number of entries `maxsize` and/or by
+    the estimated `maxbytes` of keys and values (see `sys.getsizeof`).
+    The least recently used entries are evicted first.
+    """
+
+    def __init__(
+        self, func: Callable, maxsize: int | None = 1 << 16, maxbytes: int | None = None
+    ) -> None:
+        """Wrap `func` with a cache of at most `maxsize` entries or `maxbytes`."""
+        update_wrapper(self, func)
+        self.func = func
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.cache: OrderedDict = OrderedDict()
+        self.hits = self.misses = self.evictions = self.nbytes = 0
+
+    def __call__(self, *args: Any) -> Any:
+        """Return the cached value for `args` or compute and cache it."""
+        cache = self.cache
+        if args in cache:
+            self.hits += 1
+            cache.move_to_end(args)
+            return cache[args]
+        self.misses += 1
+        v = self.func(*args)
+        if self.maxbytes is not None:
+            self.nbytes += getsizeof(args) + getsizeof(v)
+        cache[args] = v
+        while cache and (
+            (self.maxsize is not None and len(cache) > self.maxsize)
+            or (self.maxbytes is not None and self.nbytes > self.maxbytes)
+        ):
+            k, old = cache.popitem(last=False)
+            self.evictions += 1
+            if self.maxbytes is not None:
+                self.nbytes -= getsizeof(k) + getsizeof(old)
+        return v
+
+    def cache_info(self) -> MemoInfo:
+        """Return the cache statistics."""
+        return MemoInfo(
+            self.hits, self.misses, self.evictions, len(self.cache), self.nbytes
+        )
+
+    def cache_clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        self.cache.clear()
+        self.hits = self.misses = self.evictions = self.nbytes = 0
+
+
+_MISSING = object()  # marks missing entries in the dense table
+
+
+def _fits(i: int, n: int) -> bool:
+    """Return True if the index `i` is in `range(n)`."""
+    return 0 <= i < n
+
+
+class DenseMemo:
+    """Memoize a function of integer arguments in a preallocated flat table.
+
+    The arguments `(i, j, ...)` need to fit the table `shape`: `0 <= i < shape[0]`.
+    The table takes a pointer per state instead of a dict entry and a key tuple,
+    but the lookup runs in Python, so `functools.lru_cache` is faster when
+    the memory of the states is not a concern (see `benchmarks.bench_memo`).
+    """
+
+    def __init__(self, func: Callable, shape: tuple[int, ...]) -> None:
+        """Wrap `func` with a table of the `shape`."""
+        update_wrapper(self, func)
+        self.func = func
+        self.shape = shape
+        # Row-major strides of the flat table.
+        self.strides = tuple(reduce(mul, shape[k + 1 :], 1) for k in range(len(shape)))
+        self.table: list = [_MISSING] * reduce(mul, shape, 1)
+        self.hits = self.misses = 0
+
+    def __call__(self, *args: int) -> Any:
+        """Return the cached value for `args` or compute and cache it.
+
+        Raise `IndexError` if the `args` do not fit the table `shape`.
+        """
+        # 1-D and 2-D tables skip the generic arithmetic. A negative flat index
+        # rejects all negative arguments, and the list rejects ones past the end.
+        shape = self.shape
+        if len(args) != len(shape):
+            k = -1
+        elif len(args) == 2:
+            i, j = args
+            k = i * shape[1] + j if 0 <= j < shape[1] else -1
+        elif len(args) == 1:
+            (k,) = args
+        else:
+            fits = all(map(_fits, args, shape))
+            k = sum(map(mul, args, self.strides)) if fits else -1
+        if k < 0 or k >= len(self.table):
+            msg = f"{args} out of the table of shape {shape}"
+            raise IndexError(msg)
+        v = self.table[k]
+        if v is _MISSING:
+            self.misses += 1
+            v = self.table[k] = self.func(*args)
+        else:
+            self.hits += 1
+        return v
+
+    def cache_info(self) -> MemoInfo:
+        """Return the cache statistics."""
+        return MemoInfo(self.hits, self.misses, 0, self.misses, 0)
+
+    def cache_clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        self.table = [_MISSING] * len(self.table)
+        self.hits = self.misses = 0
+
+
+def memoize(
+    maxsize: int | None = 1 << 16,
+    maxbytes: int | None = None,
+    shape: tuple[int, ...] | None = None,
+) -> Callable[[Callable], Memo | DenseMemo]:
+    """Return a memoizing decorator.
+
+    Parameters
+    ----------
+    maxsize : int | None, optional
+        maximum number of cached entries, by default 65536, unbounded if None
+    maxbytes : int | None, optional
+        maximum estimated size of cached keys and values, by default None
+    shape : tuple[int, ...] | None, optional
+        use a dense table of this shape for integer arguments, by default None
+
+    Returns
+    -------
+    Callable[[Callable], Memo | DenseMemo]
+        the decorator
+
+    """
+    if shape is not None:
+        return lambda f: DenseMemo(f, shape)
+    return lambda f: Memo(f, maxsize, maxbytes)
@@ -2,147 +2,569 @@
 
 from __future__ import annotations
 
+import warnings
+from array import array
 from collections import deque
+from collections.abc import Sequence
 from functools import reduce
-from typing import TYPE_CHECKING, Any
+from itertools import accumulate, chain, islice, repeat
+from pathlib import Path
+from struct import Struct
+from typing import TYPE_CHECKING, Any, NamedTuple
 
-from sequences import find_if
-from sets import powerset
+import numpy as np
+
+import paths
+import topological
+from np_complete import vertex_cover
+from sets import Disjoint
 from stack import IndexStack
+from topological import CycleError
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable, Iterator
+    from os import PathLike
+
+
+class Graph(Sequence):
+    """Directed graph stored as compressed sparse rows (CSR).
+
+    The neighbors of node `n` are: `targets[offsets[n] : offsets[n + 1]]`,
+    with optional edge `weights` in the same order.
+    A `Graph` can be used in place of an `adj: list[list[int]]` list,
+    while taking only 8 bytes per node and per edge.
+
+    Graphs are saved to a binary file: a header, the int64 offsets, the int64 targets,
+    and the optional float64 weights. `Graph.load` maps the file without copying.
+    """
+
+    MAGIC = b"CSRG"
+    HEADER = Struct("<4sIqq")  # magic, flags, nodes, edges
+    WEIGHTED = 1  # header flag
+
+    def __init__(self, offsets: Any, targets: Any, weights: Any = None) -> None:
+        """Create a graph from the CSR `offsets`, `targets`, and `weights` buffers."""
+        self.offsets = memoryview(np.ascontiguousarray(offsets, dtype=np.int64))
+        self.targets = memoryview(np.ascontiguousarray(targets, dtype=np.int64))
+        self.weights = (
+            None
+            if weights is None
+            else memoryview(np.ascontiguousarray(weights, dtype=np.float64))
+        )
+
+    @classmethod
+    def from_edges(
+        cls,
+        edges: Any,
+        n: int | None = None,
+        *,
+        undirected: bool = False,
+        weighted: bool = False,
+    ) -> Graph:
+        """Create a graph with `n` nodes from `(source, target, weight)` `edges`.
+
+        The weights are ignored, unless `weighted` is set.
+        """
+        e, w = _edge_arrays(edges, weighted=weighted)
+        return cls._from_arrays(e, w, n, undirected=undirected)
+
+    @classmethod
+    def _from_arrays(
+        cls, e: np.ndarray, w: np.ndarray | None, n: int | None, *, undirected: bool
+    ) -> Graph:
+        """Create a graph from int64 `(source, target)` pairs `e` and weights `w`."""
+        src, dst = e[:, 0], e[:, 1]
+        if undirected:
+            src, dst = np.concatenate((src, dst)), np.concatenate((dst, src))
+            w = None if w is None else np.concatenate((w, w))
+        if n is None:
+            n = int(max(src.max(), dst.max())) + 1 if len(src) else 0
+        # Counting sort of the edges by the source node.
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=offsets[1:])
+        order = np.argsort(src, kind="stable")
+        return cls(offsets, dst[order], None if w is None else w[order])
+
+    @classmethod
+    def from_adj(cls, adj: Sequence[Sequence[int]]) -> Graph:
+        """Create a graph from an adjacency list."""
+        offsets = array("q", accumulate(map(len, adj), initial=0))
+        targets = np.fromiter(chain.from_iterable(adj), np.int64, offsets[-1])
+        return cls(offsets, targets)
+
+    @classmethod
+    def from_file(
+        cls,
+        path: str | PathLike,
+        n: int | None = None,
+        *,
+        undirected: bool = False,
+        weighted: bool = False,
+    ) -> Graph:
+        """Create a graph from a text file of `source target [weight]` edge lines.
+
+        Lines starting with `#` are skipped.
+        """
+        e, w = _load_edges(path, weighted=weighted)
+        return cls._from_arrays(e, w, n, undirected=undirected)
+
+    @classmethod
+    def load(cls, path: str | PathLike, mode: str = "r") -> Graph:
+        """Map the binary graph file at `path` into memory, see `Graph.save`.
+
+        The `mode` is passed to `np.memmap`, e.g. "r+" to modify the file in place.
+        """
+        return cls(*_map_graph(path, mode))
+
+    def save(self, path: str | PathLike) -> None:
+        """Save the graph into a binary file at `path`."""
+        flags = 0 if self.weights is None else self.WEIGHTED
+        with Path(path).open("wb") as f:
+            f.write(self.HEADER.pack(self.MAGIC, flags, len(self), len(self.targets)))
+            f.write(self.offsets)
+            f.write(self.targets)
+            if self.weights is not None:
+                f.write(self.weights)
+
+    def __len__(self) -> int:
+        """Return the number of nodes."""
+        return len(self.offsets) - 1
+
+    def __getitem__(self, n: int) -> memoryview:
+        """Return the neighbors of node `n`."""
+        if not 0 <= n < len(self.offsets) - 1:
+            raise IndexError(n)
+        return self.targets[self.offsets[n] : self.offsets[n + 1]]
+
+    def neighbors(self, n: int) -> Iterable[tuple[int, float]]:
+        """Return the `(target, weight)` pairs of node `n`. Weights default to 1."""
+        a, b = self.offsets[n], self.offsets[n + 1]
+        w = repeat(1, b - a) if self.weights is None else self.weights[a:b]
+        return zip(self.targets[a:b], w, strict=True)
+
+    def edge_count(self) -> int:
+        """Return the number of (directed) edges."""
+        return len(self.targets)
+
+    def degrees(self) -> np.ndarray:
+        """Return the out-degree of each node."""
+        return np.diff(np.asarray(self.offsets))
+
+
+def _edge_arrays(
+    edges: Any, *, weighted: bool = False
+) -> tuple[np.ndarray, np.ndarray | None]:
+    """Return the int64 `(source, target)` pairs and the float64 weights of `edges`."""
+    if not weighted:
+        e = np.asarray(edges, dtype=np.int64)
+        return (e[:, :2] if len(e) else e.reshape(0, 2)), None
+    # Ids and weights are converted apart: a float64 array rounds ids above 2**53.
+    e = edges if isinstance(edges, np.ndarray) else np.asarray(edges, dtype=object)
+    if not len(e):
+        return np.empty((0, 2), dtype=np.int64), np.empty(0)
+    return e[:, :2].astype(np.int64), e[:, 2].astype(np.float64)
+
+
+def _load_edges(
+    lines: Any, *, weighted: bool = False
+) -> tuple[np.ndarray, np.ndarray | None]:
+    """Load a text edge list from a file path or from `lines`, see `_edge_arrays`."""
+    dtype = [("s", np.int64), ("d", np.int64)] + weighted * [("w", np.float64)]
+    with warnings.catch_warnings():
+        # Chunks may consist only of comments.
+        warnings.simplefilter("ignore", UserWarning)
+        e = np.loadtxt(lines, dtype, comments="#", usecols=range(len(dtype)), ndmin=1)
+    ids = np.stack((e["s"], e["d"]), axis=1)
+    return ids, e["w"] if weighted else None
+
+
+def _map_graph(path: str | PathLike, mode: str = "r") -> list[np.ndarray | None]:
+    """Return the memory mapped offsets, targets, and weights of a graph file."""
+    with Path(path).open("rb") as f:
+        magic, flags, n, m = Graph.HEADER.unpack(f.read(Graph.HEADER.size))
+    if magic != Graph.MAGIC:
+        msg = f"not a graph file: {path}"
+        raise ValueError(msg)
+    o: list[np.ndarray | None] = []
+    at = Graph.HEADER.size
+    weighted = flags & Graph.WEIGHTED
+    for dtype, size in ((np.int64, n + 1), (np.int64, m), (np.float64, m * weighted)):
+        if size:
+            o.append(np.memmap(path, dtype, mode, at, (size,)))
+        else:
+            o.append(np.empty(0, dtype))  # empty arrays cannot be mapped
+        at += size * 8
+    if not weighted:
+        o[2] = None
+    return o
+
+
+def convert_edge_list(
+    src: str | PathLike,
+    dst: str | PathLike,
+    n: int | None = None,
+    *,
+    undirected: bool = False,
+    weighted: bool = False,
+    chunk: int = 1 << 20,
+) -> Graph:
+    """Convert a text edge list file `src` into a binary graph file `dst`.
+
+    The `src` format is the one of `Graph.from_file`. The edges are streamed
+    in chunks of `chunk` lines, so that memory use does not depend on the file size.
+    The binary file is returned as a mapped `Graph`.
+    """
+
+    def chunks() -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray | None]]:
+        # Undirected edges are read twice: forward and then reversed.
+        for flip in (0, 1)[: 1 + undirected]:
+            with Path(src).open() as f:
+                while lines := list(islice(f, chunk)):
+                    e, w = _load_edges(lines, weighted=weighted)
+                    s, d = e[:, [flip, 1 - flip]].T
+                    yield s, d, w
 
+    # The first pass counts the out-degrees.
+    degrees = np.zeros(n or 0, dtype=np.int64)
+    for s, d, _ in chunks():
+        size = max(len(degrees), int(s.max(initial=-1)) + 1, int(d.max(initial=-1)) + 1)
+        degrees.resize(size, refcheck=False)
+        degrees += np.bincount(s, minlength=size)
+    n, m = len(degrees), int(degrees.sum())
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(degrees, out=offsets[1:])
+    with Path(dst).open("wb") as f:
+        f.write(Graph.HEADER.pack(Graph.MAGIC, weighted and Graph.WEIGHTED, n, m))
+        f.write(offsets)
+        # Reserve the space for the targets and the weights.
+        f.truncate(f.tell() + m * 8 * (1 + weighted))
+    _, targets, weights = _map_graph(dst, "r+")
+    # The second pass places the edges at the next free slot of their source.
+    cursor = offsets[:-1].copy()
+    for s, d, w in chunks():
+        order = np.argsort(s, kind="stable")
+        s = s[order]  # noqa: PLW2901
+        # The rank of each edge among the edges of the same source in this chunk.
+        pos = cursor[s] + np.arange(len(s)) - np.searchsorted(s, s)
+        targets[pos] = d[order]
+        if weights is not None:
+            weights[pos] = w[order]
+        cursor += np.bincount(s, minlength=n)
+    for a in (targets, weights):
+        if isinstance(a, np.memmap):
+            a.flush()
+    return Graph.load(dst)
 
-def breadth_first(adj: list[list[int]], start: int = 0) -> list[int]:
+
+def breadth_first(adj: Sequence[Sequence[int]], start: int = 0) -> list[int]:
     """Traverse the graph breadth first. Return list of nodes."""
     q = deque([start])
-    v = {start}
+    v = bytearray(len(adj))  # visited markers
+    v[start] = 1
     o = []
     while q:
         n = q.popleft()
         o.append(n)
         for d in adj[n]:
-            if d not in v:
+            if not v[d]:
                 q.append(d)
-                v.add(d)
+                v[d] = 1
     return o
 
 
-def depth_first(adj: list[list[int]], start: int = 0) -> list[int]:
+def frontier_breadth_first(
+    graph: Graph | Sequence[Sequence[int]], sources: int | Iterable[int] = 0
+) -> tuple[np.ndarray, np.ndarray]:
+    """Traverse the graph breadth first from one or more `sources`.
+
+    Return the `dist` and `parent` arrays. Unreachable nodes have both set to -1.
+    Sources have distance 0 and are their own parents.
+    """
+    # Level synchronous BFS: each level is expanded at once with NumPy,
+    # by gathering the CSR neighbors of the whole frontier,
+    # masking the visited ones, and deduplicating the rest.
+    g = graph if isinstance(graph, Graph) else Graph.from_adj(graph)
+    offsets, targets = np.asarray(g.offsets), np.asarray(g.targets)
+    dist = np.full(len(g), -1, dtype=np.int64)
+    parent = dist.copy()
+    first = np.empty_like(dist)  # scratch space for the deduplication
+    frontier = np.unique(np.asarray(sources, dtype=np.int64))
+    dist[frontier] = 0
+    parent[frontier] = frontier
+    level = 0
+    while len(frontier):
+        level += 1
+        starts = offsets[frontier]
+        counts = offsets[frontier + 1] - starts
+        # The position of each gathered neighbor in `targets`.
+        shift = np.repeat(starts - np.cumsum(counts) + counts, counts)
+        nbs = targets[np.arange(len(shift)) + shift]
+        srcs = np.repeat(frontier, counts)
+        new = dist[nbs] < 0
+        nbs, srcs = nbs[new], srcs[new]
+        # Deduplicate without sorting: scatter the positions in reverse,
+        # so that `first[nb]` is the first position of each new node.
+        at = np.arange(len(nbs))
+        first[nbs[::-1]] = at[::-1]
+        keep = first[nbs] == at
+        frontier = nbs[keep]
+        dist[frontier] = level
+        parent[frontier] = srcs[keep]
+    return dist, parent
+
+
+def weighted_shortest_path(
+    graph: Graph, source: int, target: int, *, bidirectional: bool = False
+) -> tuple[float, list[int]]:
+    """Return the distance and the path from `source` to `target` in a weighted graph.
+
+    Return `(math.inf, [])` if the `target` is unreachable.
+    The `bidirectional` search expects an undirected graph.
+    """
+    if bidirectional:
+        return paths.bidirectional_dijkstra(graph.neighbors, source, target)
+    return paths.shortest_path(graph.neighbors, source, target)
+
+
+def depth_first(adj: Sequence[Sequence[int]], start: int = 0) -> list[int]:
     """Traverse the graph depth first using stack. Return list of nodes."""
     o = []
-    v = set()
+    v = bytearray(len(adj))  # visited markers
     s = [start]
     while s:
         n = s.pop()
-        if n not in v:
-            v.add(n)
+        if not v[n]:
+            v[n] = 1
             o.append(n)
-            s.extend(filter(lambda a: a not in v, reversed(adj[n])))
+            s.extend(a for a in reversed(adj[n]) if not v[a])
     return o
 
 
-def depth_first_r(adj: list[list[int]], start: int = 0) -> list[int]:
+def depth_first_r(adj: Sequence[Sequence[int]], start: int = 0) -> list[int]:
     """Traverse the graph recursively depth first. Return list of nodes."""
     o = []
-    v = set()
+    v = bytearray(len(adj))  # visited markers
 
     def dfs(n: int) -> None:
-        v.add(n)
+        v[n] = 1
         o.append(n)
         for a in adj[n]:
-            if a not in v:
+            if not v[a]:
                 dfs(a)
 
     dfs(start)
     return o
 
 
-def topological_order(vertexes: Iterable, edges: dict) -> Iterable:
-    """Return `vertexes` in topological order based on `edges` relation."""
+def topological_order(vertexes: Iterable, edges: dict | None = None) -> Iterable:
+    """Return `vertexes` in topological order based on `edges` relation.
+
+    Without `edges`, `vertexes` is a graph: `adj` list or `Graph`,
+    and its nodes `range(len(vertexes))` are ordered.
+    Raise `CycleError` if there is a cycle. See also `topological.layers`.
+    """
+    if edges is None:
+        adj, vertexes = vertexes, range(len(vertexes))
+        v = bytearray(len(adj))  # 1 - on the stack, 2 - done
+        state, mark = v.__getitem__, v.__setitem__
+        kids = adj.__getitem__
+    else:
+        vs: dict = {}
+        state, mark = lambda n: vs.get(n, 0), vs.__setitem__
+        kids = lambda n: edges.get(n, ())
     s = []
-    v = set()
+    # Iterative DFS with a stack of children iterators, appending in post-order.
+    # A child still on the stack closes a cycle.
+    for r in vertexes:
+        if state(r):
+            continue
+        mark(r, 1)
+        stack = [(r, iter(kids(r)))]
+        while stack:
+            n, it = stack[-1]
+            for c in it:
+                if not state(c):
+                    mark(c, 1)
+                    stack.append((c, iter(kids(c))))
+                    break
+                if state(c) == 1:
+                    cycle = [m for m, _ in stack]
+                    raise CycleError([*cycle[cycle.index(c) :], c])
+            else:
+                stack.pop()
+                mark(n, 2)
+                s.append(n)
+    return reversed(s)
 
-    def sort(n: Any) -> None:
-        if n not in v:
-            v.add(n)
-            any(map(sort, edges.get(n, [])))
-            s.append(n)
 
-    any(map(sort, vertexes))
-    return reversed(s)
+def eulerian_path(
+    graph: Graph | Sequence[Sequence[int]], *, circuit: bool = False
+) -> list[int] | None:
+    """Return the nodes of a path using each edge of a directed multigraph once.
+
+    With `circuit` set, the path needs to end where it starts.
+    Return None if there is no such path, or an empty list if there are no edges.
+    """
+    # Hierholzer's algorithm: walk unused edges from the start until stuck,
+    # which can only happen at the end of the path. Then backtrack along
+    # the walk, appending the nodes to the path in reverse, and take detours
+    # from the nodes with unused edges left. `pos` is the next unused edge
+    # of each node, so each edge is visited once.
+    # A path starts at the node with one more outgoing than incoming edges,
+    # and ends at the node with one more incoming edge. All the other nodes,
+    # or all the nodes of a circuit, are balanced.
+    # The path misses some edges, if those are not connected to the start.
+    g = graph if isinstance(graph, Graph) else Graph.from_adj(graph)
+    offsets, targets = g.offsets, g.targets
+    if not len(targets):
+        return []
+    out = g.degrees()
+    balance = out - np.bincount(np.asarray(targets), minlength=len(g))
+    starts = np.flatnonzero(balance)
+    if not len(starts):
+        start = int(np.argmax(out > 0))
+    elif circuit or len(starts) != 2 or sorted(balance[starts]) != [-1, 1]:
+        return None
+    else:
+        start = int(starts[balance[starts] > 0][0])
+    pos = array("q", bytes(offsets[: len(g)]))
+    stack, path = array("q", [start]), array("q")
+    while stack:
+        n = stack[-1]
+        i = pos[n]
+        if i < offsets[n + 1]:
+            pos[n] = i + 1
+            stack.append(targets[i])
+        else:
+            path.append(stack.pop())
+    if len(path) != len(targets) + 1:
+        return None
+    path.reverse()
+    return path.tolist()
 
 
 def circle_of_words(words: list[str]) -> bool:
-    """Return true if `words` can make a circle if connected by the same letter."""
+    """Return true if `words` can make a circle if connected by the same letter.
+
+    No `words` make an empty circle, so this returns True for them.
+    """
     # Euler circle problem.
-    #   Words are edges.
+    #   Letters are nodes and words are edges from the first to the last letter.
     #   Number of inbound and outbound edges need to be equal.
     #   Graph needs to be connected.
-    # build graph
-    gr = {}
-    for w in words:
-        # outbound edges
-        (gr.get(w[0]) or gr.setdefault(w[0], [[], 0]))[0].append(w[-1])
-        # inbound count
-        (gr.get(w[-1]) or gr.setdefault(w[-1], [[], 0]))[1] += 1
-    # connectivity check
-    vis = set()
-    (dfs := lambda c: c in vis or vis.add(c) or all(map(dfs, gr[c][0])))(words[0][0])
-    # connectivity and vertex degree check
-    return len(gr) == len(vis) and all(len(c[0]) == c[1] for c in gr.values())
-
-
-def articulation_points(adj: list[list[int]]) -> list[int]:
+    ids: dict[str, int] = {}
+    edges = np.fromiter(
+        (ids.setdefault(c, len(ids)) for w in words for c in (w[0], w[-1])),
+        np.int64,
+        2 * len(words),
+    )
+    gr = Graph.from_edges(edges.reshape(-1, 2), len(ids))
+    return eulerian_path(gr, circuit=True) is not None
+
+
+class Biconnected(NamedTuple):
+    """Articulation points, bridges, and biconnected components of a graph."""
+
+    points: list[int]
+    bridges: list[tuple[int, int]]
+    components: list[list[int]]
+
+
+def _low_links(g: Graph) -> tuple[array, array, array, array]:
+    """Return the visit times, low-links, DFS parents, and the DFS preorder of `g`."""
+    # An iterative Tarjan's DFS over the CSR arrays of an undirected graph.
+    # `vt` is the visit time of each node and `low` the lowest visit time
+    # reached from its DFS-subtree by a back-edge. Instead of recursion,
+    # `pos` keeps the position of the next edge to scan for each node
+    # on the `path`. A finished node passes its `low` on to its parent.
+    offsets, targets = g.offsets, g.targets
+    ln = len(g)
+    vt = array("q", [0]) * ln
+    low = vt[:]
+    parent = array("q", [-1]) * ln
+    pos = array("q", offsets[:ln])
+    skipped = bytearray(ln)  # set once the edge back to the parent was skipped
+    path, order = array("q"), array("q")
+    for r in range(ln):
+        if vt[r]:
+            continue
+        vt[r] = low[r] = len(order) + 1
+        path.append(r)
+        order.append(r)
+        while path:
+            n = path[-1]
+            i = pos[n]
+            if i < offsets[n + 1]:
+                pos[n] = i + 1
+                c = targets[i]
+                if not vt[c]:
+                    vt[c] = low[c] = len(order) + 1
+                    parent[c] = n
+                    path.append(c)
+                    order.append(c)
+                elif c == parent[n] and not skipped[n]:
+                    skipped[n] = 1
+                elif vt[c] < low[n]:
+                    low[n] = vt[c]
+                continue
+            path.pop()
+            p = parent[n]
+            if p >= 0 and low[n] < low[p]:
+                low[p] = low[n]
+    return vt, low, parent, order
+
+
+def biconnected(graph: Graph | Sequence[Sequence[int]]) -> Biconnected:
+    """Return the articulation points, bridges, and biconnected components.
+
+    The `graph` is undirected, with each edge listed in both directions.
+    Parallel edges are not bridges. Isolated nodes belong to no component.
+    All lists are sorted, bridges are `(min, max)` node pairs.
+    """
+    # When `low[n] >= vt[p]` for a DFS child `n` of `p`, nothing in the subtree
+    # of `n` reaches above `p`: `p` separates it, unless `p` is a root with
+    # a single child. Then `n` heads a new component with `p`, and the nodes
+    # of its subtree join it, but for those heading components of their own.
+    # If even `low[n] > vt[p]`, the edge `(p, n)` is a bridge.
+    # Visiting the nodes in DFS preorder, parents are assigned before children.
+    g = graph if isinstance(graph, Graph) else Graph.from_adj(graph)
+    vt, low, parent, order = _low_links(g)
+    block = array("q", [-1]) * len(g)
+    cut = bytearray(len(g))  # articulation point markers
+    kids = bytearray(len(g))  # set for roots with a child
+    bridges, components = [], []
+    for n in order:
+        p = parent[n]
+        if p < 0:
+            continue
+        if low[n] < vt[p]:
+            block[n] = block[p]
+            continue
+        block[n] = len(components)
+        components.append([p])
+        if low[n] > vt[p]:
+            bridges.append((p, n) if p < n else (n, p))
+        if parent[p] >= 0 or kids[p]:
+            cut[p] = 1
+        kids[p] = 1
+    for n in order:
+        if block[n] >= 0:
+            components[block[n]].append(n)
+    any(map(list.sort, components))
+    points = np.flatnonzero(np.frombuffer(cut, dtype=np.uint8)).tolist()
+    bridges.sort()
+    components.sort()
+    return Biconnected(points, bridges, components)
+
+
+def articulation_points(adj: Sequence[Sequence[int]]) -> list[int]:
     """Return graph articulation points."""
-    # This is an iterative (non-recursive) version using two stacks.
+    # See `biconnected` for the iterative version of Tarjan's algorithm.
     # For the recursive version see below.
-    # Expects a strongly connected graph. `adj` contains symmetric edges.
-    vt = [0] * len(adj)  # visited time for each node in DFS-tree order
-    ct = vt[:]  # uplink min connection time
-    t = 0  # Tarjan's DFS node index
-    s1: list[tuple[int, int]] = [(-1, 0)]  # root node with -1 as parent
-    s2 = []  # second stack for non root child nodes
-
-    root_kids = -1  # used for the root only
-    while s1:
-        p, n = s1.pop()
-        if vt[n]:  # skip visited
-            continue
-        vt[n] = ct[n] = t = t + 1  # set the times
-        # We move the nodes to the second stack
-        # after they were popped out of the first
-        # to properly retain the parent relation,
-        # and preserve the bottom-up DFS-tree order.
-        if p > 0:  # non-root children
-            s2.append((p, n))
-        else:
-            # The root node and its DFS-tree are counted here.
-            root_kids += 1
-        s1.extend((n, c) for c in adj[n] if not vt[c])
-
-    # Using a set as a parent node may be an AP
-    # for multiple other nodes.
-    # Root is an articulate point
-    # if it had more than one child node.
-    aps = set([0] if root_kids > 1 else [])
-    # process non root child nodes, bottom-up in DFS-tree order
-    while s2:
-        p, n = s2.pop()
-        # Use min vt for any tree- or back-edges (except parent)
-        ct[n] = reduce(min, (vt[c] for c in adj[n] if c != p), ct[n])
-        # Lower parent `ct`
-        ct[p] = min(ct[p], ct[n])
-        # If this node `ct` is higher than parent `vt`,
-        # then we were unable to connect to parent component
-        # using any other edge or node. Parent must be an AP.
-        if vt[p] <= ct[n]:
-            aps.add(p)
-    return sorted(aps)
-
-
-def articulation_points_recursive(adj: list[list[int]]) -> list[int]:
+    return biconnected(adj).points
+
+
+def articulation_points_recursive(adj: Sequence[Sequence[int]]) -> list[int]:
     """Return the articulation points for a graph defined by the `adj` list."""
     # This uses single pass Tarjan's recursive algorithm.
     vt = [0] * len(adj)  # visited time for each node in DFS-tree order
@@ -187,50 +609,21 @@ def articulation_points_recursive(adj: list[list[int]]) -> list[int]:
     return sorted(o)
 
 
-def critical_connections(adj: list[list[int]]) -> list[list[int]]:
+def critical_connections(adj: Sequence[Sequence[int]]) -> list[tuple[int, int]]:
     """Return a list of critical bridges in an undirected graph."""
-    # This uses single pass Tarjan's Algorithm.
-    # It expects a strongly connected undirected graph
-    # with (directed) edges specified in `adj` one for each way.
-    #
-    # The idea is to DFS the graph and at each node to
-    # to compute the minimum of child nodes connection times: `ct`.
-    # If any child connects to a higher node in the stack,
-    # its `ct` will be lower or equal to the parent visit time.
-    # Otherwise, the child is only connected to the parent through
-    # a critical edge.
-    ct = [0] * len(adj)  # minimum connection time
-    ccs = []  # results
+    # An edge is critical if no other path connects its two nodes.
+    # Those edges are the bridges found by Tarjan's algorithm, see `biconnected`.
+    return biconnected(adj).bridges
 
-    # Depth first search to determine the parent of each node
-    # and created the DFS-tree.
-    def visit(p: int, n: int, t: int) -> int:
-        # Skip visited nodes.
-        if not ct[n]:
-            ct[n] = t  # Initialize the ct time.
-            # Descend recursively, skipping the parent.
-            descend = lambda c: visit(n, c, t + 1) if c != p else t
-            # Choose the minimum of the recursive connection times.
-            ct[n] = reduce(min, map(descend, adj[n]), t)
-            # Add all edges for which the child `ct` is larger than `vt`.
-            ccs.extend((min(n, c), max(n, c)) for c in adj[n] if t < ct[c])
-        return ct[n]
-
-    # Start search from the first node (== 0)
-    # of the strongly connected graph.
-    visit(-1, 0, 1)
-    ccs.sort()
-    return ccs
-
-
-def strongly_connected_components(adj: list[list[int]]) -> list[list[int]]:
+
+def strongly_connected_components(adj: Sequence[Sequence[int]]) -> list[list[int]]:
     """Return strongly connected components (SSCs) as a list of vertices.
 
     Note that this algorithm only applies to directed graphs.
 
     Args:
     ----
-        adj (List[List[int]]): Array of adjacent nodes `adj[i]` for node `i`.
+        adj (Sequence[Sequence[int]]): Adjacent nodes `adj[i]` or a `Graph`.
 
     Returns:
     -------
@@ -254,7 +647,7 @@ def strongly_connected_components(adj: list[list[int]]) -> list[list[int]]:
     # node of a SCC. Nodes on the stack form the SCC.
     #
     ln = len(adj)
-    ct = [0] * ln  # child/circle/uplink connection time
+    ct = array("q", [0]) * ln  # child/circle/uplink connection time
     vt = ct[:]  # first visit time
     t = 0  # rolling index time
     # Stack contains nodes that form the SCCs.
@@ -296,7 +689,9 @@ def strongly_connected_components(adj: list[list[int]]) -> list[list[int]]:
     return sccs
 
 
-def strongly_connected_components_recursive(adj: list[list[int]]) -> list[list[int]]:
+def strongly_connected_components_recursive(
+    adj: Sequence[Sequence[int]],
+) -> list[list[int]]:
     """Return strongly connected components (SSCs) as a list of vertices.
 
     Note that this algorithm only applies to directed graphs.
@@ -414,80 +809,241 @@ def strongly_connected_components_recursive(adj: list[list[int]]) -> list[list[i
     # ct: [1, 2, 9, 3, 5, 3, 8, 10, 5, 3]
 
 
+class IncrementalSCC:
+    """Strongly connected components (SCCs) of a graph growing by edge insertions.
+
+    The SCCs are kept in a `Disjoint` set, together with a topological order
+    of the condensation DAG. An edge that agrees with the order is just recorded.
+    Otherwise, only the components ordered between the two ends of the edge
+    are searched, merged if they close a cycle, and reordered (Pearce-Kelly).
+    """
+
+    def __init__(self, n: int, edges: Iterable[Sequence[int]] = ()) -> None:
+        """Create the SCCs of `n` nodes, adding the `edges`."""
+        self.sets = Disjoint(n)
+        self.out: list[list[int]] = [[] for _ in range(n)]
+        self.inc: list[list[int]] = [[] for _ in range(n)]
+        self.members: list[list[int]] = [[i] for i in range(n)]
+        self.order = list(range(n))  # position of each component in the DAG order
+        self.add_edges(edges)
+
+    def __len__(self) -> int:
+        """Return the number of nodes."""
+        return len(self.out)
+
+    def component(self, n: int) -> int:
+        """Return the representative node of the SCC containing node `n`."""
+        return self.sets.find(n)
+
+    def connected(self, a: int, b: int) -> bool:
+        """Return True if nodes `a` and `b` are in the same SCC."""
+        return self.sets.find(a) == self.sets.find(b)
+
+    def add_edges(self, edges: Iterable[Sequence[int]]) -> int:
+        """Add the `edges`. Return the number of SCC merges."""
+        return sum(self.add_edge(a, b) for a, b, *_ in edges)
+
+    def add_edge(self, a: int, b: int) -> bool:
+        """Add the edge `a -> b`. Return True if this merged some SCCs."""
+        self.out[a].append(b)
+        self.inc[b].append(a)
+        x, y = self.sets.find(a), self.sets.find(b)
+        order = self.order
+        lo, hi = order[y], order[x]
+        if lo >= hi:
+            # The edge is within an SCC or follows the DAG order.
+            return False
+        # Search the components reachable from `y` and those reaching `x`,
+        # limited to the region of the order between `y` and `x`.
+        fwd = topological.reach(y, self._step(self.out), lambda c: order[c] <= hi)
+        bwd = topological.reach(x, self._step(self.inc), lambda c: order[c] >= lo)
+        # The components on a path from `y` to `x` close a cycle with the edge.
+        # The components reaching `x` go first, followed by the cycle merged
+        # into `x`, and the components reachable from `y`.
+        cycle = {c: None for c in fwd if c in bwd} if x in fwd else {}
+        topological.reorder(
+            order,
+            (
+                (c for c in bwd if c not in cycle),
+                [x] if cycle else [],
+                (c for c in fwd if c not in cycle),
+            ),
+        )
+        for c in cycle:
+            self._merge(x, c)
+        order[self.sets.find(x)] = order[x]
+        return bool(cycle)
+
+    def _step(self, edges: list[list[int]]) -> Callable[[int], Iterator[int]]:
+        """Return the function listing the components adjacent to a component."""
+        find = self.sets.find
+        return lambda c: (find(m) for n in self.members[c] for m in edges[n])
+
+    def _merge(self, a: int, b: int) -> None:
+        x, y = self.sets.find(a), self.sets.find(b)
+        if x == y:
+            return
+        r = self.sets.union(x, y)
+        other = y if r == x else x
+        self.members[r].extend(self.members[other])
+        self.members[other] = []
+
+    def components(self) -> list[list[int]]:
+        """Return the SCCs as sorted lists of nodes, sorted."""
+        return sorted(sorted(m) for m in self.members if m)
+
+    def topological_order(self) -> list[int]:
+        """Return the representatives of the SCCs in a topological order."""
+        return sorted(
+            (c for c, m in enumerate(self.members) if m), key=self.order.__getitem__
+        )
+
+    def condensation(self) -> dict[int, set[int]]:
+        """Return the condensation DAG as a map of SCC representatives to successors.
+
+        The keys are in a topological order.
+        """
+        find = self.sets.find
+        return {
+            c: {d for n in self.members[c] for m in self.out[n] if (d := find(m)) != c}
+            for c in self.topological_order()
+        }
+
+
 def vertex_cover_optimal(edges: list[list[int]]) -> set[int]:
     """Return the vertices of a minimal vertex cover."""
-    edges_ = list(map(set, edges))  # Make edges undirected and easy to intersect.
-    vertexes = set.union(*edges_)  # Limit to interesting vertexes.
-    covers_all_edges = lambda s: all(e & s for e in edges_)
-    return find_if(covers_all_edges, powerset(vertexes)) or vertexes
+    # See `np_complete.vertex_cover` for the branch and bound solver.
+    return vertex_cover(edges)
+
+
+class WordLadder:
+    """Index of the `words` for word ladder queries.
+
+    Two words are adjacent if they differ in exactly one letter. Each word
+    is kept in the wildcard buckets of its patterns, e.g. "hot" in "*ot", "h*t",
+    and "ho*". So the adjacent words are looked up instead of generated.
+    The index is built once and reused for any number of queries.
+    Words must not contain the `WILDCARD`.
+    """
+
+    WILDCARD = "*"
+
+    def __init__(self, words: Iterable[str]) -> None:
+        """Index the `words`."""
+        self.words = set(words)
+        self.buckets: dict[str, list[str]] = {}
+        for w in self.words:
+            for p in self.patterns(w):
+                self.buckets.setdefault(p, []).append(w)
+        # Sorted buckets list the adjacent words by position, then by letter.
+        for b in self.buckets.values():
+            b.sort()
+
+    def patterns(self, word: str) -> list[str]:
+        """Return the wildcard patterns of the `word`."""
+        return [word[:i] + self.WILDCARD + word[i + 1 :] for i in range(len(word))]
+
+    def neighbors(self, word: str) -> Iterator[str]:
+        """Yield the indexed words adjacent to `word`, by position and letter."""
+        for p in self.patterns(word):
+            for w in self.buckets.get(p, ()):
+                if w != word:
+                    yield w
+
+    def distance(self, start: str, end: str) -> int:
+        """Return the number of words in a shortest ladder from `start` to `end`.
+
+        Only the words in between need to be indexed.
+        Return 1 if `start == end`, and 0 if there is no ladder.
+        """
+        # Bidirectional BFS, expanding the smaller frontier a level at a time.
+        # The searches never share a node before they meet, so the first
+        # edge found between the two searched parts closes a shortest ladder.
+        if start == end:
+            return 1
+        if len(start) != len(end):
+            return 0
+        if sum(a != b for a, b in zip(start, end, strict=True)) == 1:
+            return 2
+        seen = ({start: 0}, {end: 0})
+        fronts = [[start], [end]]
+
+        def expand(side: int) -> int:
+            mine, other = seen[side], seen[1 - side]
+            front = []
+            for w in fronts[side]:
+                d = mine[w] + 1
+                for v in self.neighbors(w):
+                    if v in other:
+                        return d + other[v] + 1
+                    if v not in mine:
+                        mine[v] = d
+                        front.append(v)
+            fronts[side] = front
+            return 0
+
+        # Both ends are expanded first, as the searches never step
+        # onto an end that is not indexed.
+        found = expand(0) or expand(1)
+        while not found and fronts[0] and fronts[1]:
+            found = expand(0 if len(fronts[0]) <= len(fronts[1]) else 1)
+        return found
+
+    def paths(self, start: str, end: str) -> Iterator[list[str]]:
+        """Yield the shortest ladders from `start` to `end` lazily.
+
+        The `end` must be indexed. Ladders are ordered by the positions
+        and the letters changed first.
+        """
+        # A BFS from `start` records the parents of each word on its level,
+        # up to the level of `end`. The words leading to `end` are marked
+        # walking the parents back, and the ladders are generated by a DFS
+        # from `start` through the marked words, one copy per ladder.
+        if start == end:
+            yield [start]
+            return
+        if end not in self.words:
+            return
+        parents: dict[str, list[str]] = {start: []}
+        front = [start]
+        while front and end not in parents:
+            level: dict[str, list[str]] = {}
+            for w in front:
+                for v in self.neighbors(w):
+                    if v not in parents:
+                        level.setdefault(v, []).append(w)
+            parents.update(level)
+            front = list(level)
+        if end not in parents:
+            return
+        on = {end}
+        stack = [end]
+        while stack:
+            for p in parents[stack.pop()]:
+                if p not in on:
+                    on.add(p)
+                    stack.append(p)
+        nexts = lambda w: (v for v in self.neighbors(w) if v in on and w in parents[v])
+        path = [start]
+        iters = [nexts(start)]
+        while iters:
+            v = next(iters[-1], None)
+            if v is None:
+                iters.pop()
+                path.pop()
+            elif v == end:
+                yield [*path, v]
+            else:
+                path.append(v)
+                iters.append(nexts(v))
 
 
 def word_distance(words: Iterable[str], start: str, end: str) -> int:
     """Return the min distance from `start` to `end` using `words` as steps."""
-    # The idea is to use breadth first search BFS and keep track of the depth.
-    # The first time we hit the target end word, we return the depth calculated so far.
-    if start == end:
-        return 1
-    lookup = set(words)
-    q = deque([start])
-    depth = 2  # `start` and `end` are two words
-    while q:
-        # Standard BFS level expansion based on current queue length.
-        for _ in range(len(q)):
-            word = q.popleft()
-            # Generate the neighbors by manipulating the string.
-            for i in range(len(word)):
-                for rc in "abcdefghijklmnopqrstuvwxyz":
-                    # String manipulation and string set lookup are faster than
-                    # converting to a list and back to a hashable object.
-                    nw = word[:i] + rc + word[i + 1 :]
-                    if nw == end:
-                        return depth
-                    if nw in lookup:
-                        # Avoid cycles and mark visited nodes.
-                        lookup.remove(nw)
-                        q.append(nw)
-        depth += 1
-    return 0
+    # See `WordLadder` to run many queries against the same `words`.
+    return WordLadder(words).distance(start, end)
 
 
 def word_paths(words: Iterable[str], start: str, end: str) -> list[list[str]]:
     """Return the min paths from `start` to `end` using `words` as steps."""
-    # The idea is to treat the words list as an adjacency list of a graph
-    # While traversing the, the set of adjacent words is reduced to keep track of
-    # visited nodes in breadth first search (BFS) and to remove any cycles.
-    # BFS will provide the shortest paths if aborted after the target end word is found.
-    # A queue is used to keep paths found so far.
-    #
-    # Current set of yet to be visited nodes in the graph.
-    lookup = set(words)
-    # The queue contains paths as Python lists.
-    q = deque([[start]])
-    # Keep track of the goal. Abort at the earliest hit.
-    found = start == end
-    # Using BFS while tracking the paths.
-    while q and not found:
-        # Track the visited nodes (words) in the BFS expansion.
-        used = set()
-        # Standard BFS level expansion based on current queue length.
-        for _ in range(len(q)):
-            path = q.popleft()
-            word = path[-1]
-            # Generate the neighbors by manipulating the string.
-            for i in range(len(word)):
-                for rc in "abcdefghijklmnopqrstuvwxyz":
-                    # String manipulation and string set lookup are faster than
-                    # converting to a list and back to a hashable object.
-                    nw = word[:i] + rc + word[i + 1 :]
-                    if nw in lookup:
-                        # Keeping track of "used" words as set is faster.
-                        used.add(nw)
-                        # Extending the path is faster than any other manipulations.
-                        q.append([*path, nw])
-                    # Terminate if found.
-                    found |= nw == end
-        # We can remove the used words after a level of BFS.
-        # This allows us to add multiple paths, even those share some words.
-        lookup -= used
-    # Filter the last level to only the paths ending in the target word.
-    return [p for p in q if p[-1] == end]
+    return list(WordLadder(words).paths(start, end))
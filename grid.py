@@ -6,61 +6,235 @@ import math
 from collections import deque
 from heapq import heappop, heappush
 from itertools import product
+from typing import TYPE_CHECKING
+
+import numpy as np
 
 import mathematics
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from numpy.typing import ArrayLike
+
 
 def parse(s: str) -> list:
     """Parse a matrix from string `s`."""
     return [list(map(int, l.split())) for l in s.splitlines() if l]
 
 
-def dijkstra(grid: list[list[int]]) -> int:
+class _Buckets:
+    """Monotone bucket queue of cell id arrays by integer keys."""
+
+    def __init__(self) -> None:
+        """Create an empty queue."""
+        self.buckets: dict[int, list[np.ndarray]] = {}
+        self.keys: list[int] = []
+
+    def __bool__(self) -> bool:
+        """Return True if there are buckets left."""
+        return bool(self.keys)
+
+    def push(self, ids: np.ndarray, keys: np.ndarray) -> None:
+        """File each of the `ids` into the bucket of its key."""
+        if not len(ids):
+            return
+        order = np.argsort(keys, kind="stable")
+        ids, keys = ids[order], keys[order]
+        cuts = np.flatnonzero(keys[1:] != keys[:-1]) + 1
+        parts = np.split(ids, cuts)
+        for part, k in zip(parts, keys[np.r_[0, cuts]].tolist(), strict=True):
+            if k not in self.buckets:
+                self.buckets[k] = []
+                heappush(self.keys, k)
+            self.buckets[k].append(part)
+
+    def pop(self) -> tuple[int, np.ndarray]:
+        """Remove the lowest bucket. Return its key and its distinct ids."""
+        k = heappop(self.keys)
+        return k, np.unique(np.concatenate(self.buckets.pop(k)))
+
+
+class CostGrid:
+    """Rectangular grid of cell costs for repeated shortest path queries.
+
+    A move into a cell costs the value of the cell, so a path costs the sum
+    of its cells, but the first. Cells with infinite costs are walls.
+    Moves go to the 4 adjacent cells, or with `diagonal` set to all 8.
+
+    The costs are kept in a flat NumPy array with a border of walls,
+    so that the cells are integer ids and the moves are fixed id offsets.
+    """
+
+    def __init__(
+        self, costs: ArrayLike, *, diagonal: bool = False, delta: float | None = None
+    ) -> None:
+        """Create the grid of non-negative `costs`, a row of cells per row.
+
+        `delta` is the width of the buckets of the search, see `search`.
+        It defaults to the median positive cost.
+        """
+        c = np.asarray(costs, dtype=np.float64)
+        if (c < 0).any():
+            msg = "negative cell costs"
+            raise ValueError(msg)
+        self.shape = c.shape
+        self.width = w = c.shape[1] + 2
+        padded = np.full((c.shape[0] + 2, w), np.inf)
+        padded[1:-1, 1:-1] = c
+        self.costs = padded.ravel()
+        moves = [-w, w, -1, 1] + diagonal * [-w - 1, -w + 1, w - 1, w + 1]
+        self.moves = np.array(moves, dtype=np.int64)
+        self.diagonal = diagonal
+        finite = c[np.isfinite(c)]
+        self.min_cost = finite.min() if finite.size else 0.0
+        positive = finite[finite > 0]
+        self.delta = delta or (float(np.median(positive)) if positive.size else 1.0)
+
+    def _id(self, cell: tuple[int, int]) -> int:
+        """Return the id of the cell at `(row, col)`."""
+        i, j = cell
+        if not (0 <= i < self.shape[0] and 0 <= j < self.shape[1]):
+            raise IndexError(cell)
+        return (i + 1) * self.width + j + 1
+
+    def _relax(
+        self, nodes: np.ndarray, dist: np.ndarray, parent: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Relax all the moves from the `nodes`. Return the improved cells and costs."""
+        # Takes all the moves at once and keeps the best move into each cell.
+        moves = self.moves
+        nbs = (nodes[:, None] + moves).ravel()
+        nd = (dist[nodes][:, None] + self.costs[nbs].reshape(-1, len(moves))).ravel()
+        better = nd < dist[nbs]
+        nbs, nd = nbs[better], nd[better]
+        frm = np.repeat(nodes, len(moves))[better]
+        order = np.lexsort((nd, nbs))
+        nbs, nd, frm = nbs[order], nd[order], frm[order]
+        first = np.ones(len(nbs), dtype=bool)
+        first[1:] = nbs[1:] != nbs[:-1]
+        nbs, nd = nbs[first], nd[first]
+        dist[nbs] = nd
+        parent[nbs] = frm[first]
+        return nbs, nd
+
+    def search(
+        self, sources: Iterable[tuple[int, int]], target: tuple[int, int] | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Search the shortest paths from the `sources`. Return `dist` and `parent`.
+
+        Both are arrays in the shape of the grid. `dist` are the path costs,
+        infinite for the cells not reached. `parent` are the flat indexes
+        `row * cols + col` of the previous cells, -1 if not reached.
+        Sources are their own parents.
+        With a `target`, this is an A* search that stops once the `target`
+        is reached. Only the costs up to the cost of the `target` are final then.
+        """
+        # Delta-stepping: the cells are kept in buckets of `delta` width by
+        # their tentative cost (plus the heuristic). The lowest bucket is relaxed
+        # with NumPy at once, and again for the cells it improves within itself,
+        # e.g. through zero costs. Each round files the improved cells into
+        # their buckets. A narrow `delta` takes fewer rounds per bucket, but
+        # more buckets: the lowest positive cost settles a bucket in a round,
+        # but a single tiny cost makes for millions of buckets. The median
+        # cost keeps both the rounds and the buckets few.
+        # The heuristic is the minimum cost times the moves to the `target`,
+        # which is consistent, so a bucket never files into a lower bucket.
+        w = self.width
+        dist = np.full(len(self.costs), np.inf)
+        parent = np.full(len(self.costs), -1, dtype=np.int64)
+        src = np.array([self._id(c) for c in sources], dtype=np.int64)
+        dist[src] = 0
+        parent[src] = src
+        goal = -1 if target is None else self._id(target)
+        h = self._heuristic(goal)
+        bucket = lambda ids, d: np.floor((d + h(ids)) / self.delta).astype(np.int64)
+        buckets = _Buckets()
+        buckets.push(src, bucket(src, dist[src]))
+        while buckets:
+            key, nodes = buckets.pop()
+            if goal >= 0 and np.floor(dist[goal] / self.delta) < key:
+                break
+            # Skip the cells filed again into a lower bucket since.
+            nodes = nodes[bucket(nodes, dist[nodes]) == key]
+            while len(nodes):
+                nbs, nd = self._relax(nodes, dist, parent)
+                k = bucket(nbs, nd)
+                same = k <= key
+                buckets.push(nbs[~same], k[~same])
+                nodes = nbs[same]
+        rows, cols = self.shape
+        i, j = np.divmod(parent, w)
+        parent = np.where(parent < 0, -1, (i - 1) * cols + j - 1)
+        inner = lambda a: a.reshape(rows + 2, w)[1:-1, 1:-1].copy()
+        return inner(dist), inner(parent)
+
+    def _heuristic(self, goal: int) -> Callable[[np.ndarray], np.ndarray | float]:
+        """Return the A* heuristic of cell ids for the `goal` id, 0 without a goal."""
+        if goal < 0:
+            return lambda _: 0.0
+        w, gi, gj = self.width, *divmod(goal, self.width)
+        norm = np.maximum if self.diagonal else np.add
+
+        def h(ids: np.ndarray) -> np.ndarray:
+            i, j = np.divmod(ids, w)
+            return self.min_cost * norm(np.abs(i - gi), np.abs(j - gj))
+
+        return h
+
+    def path(
+        self, parent: np.ndarray, target: tuple[int, int]
+    ) -> list[tuple[int, int]]:
+        """Return the cells of the path to `target` following the `parent` array.
+
+        Return an empty list if the `target` was not reached.
+        """
+        cols = self.shape[1]
+        p = parent.ravel()
+        n = target[0] * cols + target[1]
+        if p[n] < 0:
+            return []
+        o = [n]
+        while (m := int(p[o[-1]])) != o[-1]:
+            o.append(m)
+        o.reverse()
+        return [divmod(n, cols) for n in o]
+
+    def shortest_path(
+        self, source: tuple[int, int], target: tuple[int, int]
+    ) -> tuple[float, list[tuple[int, int]]]:
+        """Return the cost and the cells of a shortest path from `source` to `target`.
+
+        Return `(math.inf, [])` if the `target` is unreachable.
+        """
+        dist, parent = self.search([source], target)
+        d = dist[target]
+        if d == math.inf:
+            return math.inf, []
+        return float(d), self.path(parent, target)
+
+
+def _total(grid: list[list[float]], d: float) -> float:
+    """Return the cost of a path of cost `d` from the first cell, -1 if infinite."""
+    # Integer costs give integer totals, which are exact in float64 up to 2^53.
+    if d == math.inf:
+        return -1
+    total = grid[0][0] + d
+    return int(total) if np.asarray(grid).dtype.kind in "iub" else float(total)
+
+
+def dijkstra(grid: list[list[float]]) -> float:
     """Search a path in an NxN grid of costs per cell. Return overall cost."""
-    n = len(grid)
-    goal = (n - 1, n - 1)
-    start = (0, 0)
-    v: set[tuple[int, int]] = {start}
-    dc = grid[0][0]
-    q: list[tuple[int, tuple[int, int]]] = [(dc, start)]
-    while q:
-        d, p = heappop(q)
-        if p == goal:
-            return d
-        for dx, dy in ((-1, 0), (1, 0), (0, -1), (0, 1)):
-            c = (p[0] + dx, p[1] + dy)
-            if not (0 <= c[0] < n and 0 <= c[1] < n) or c in v:
-                continue
-            v.add(c)
-            dc = d + grid[c[0]][c[1]]
-            heappush(q, (dc, c))
-    return -1
+    # The grid searches run on the vectorized `CostGrid` instead of `paths`,
+    # whose searches take Python tuples per cell and are too slow for grids.
+    return _total(grid, CostGrid(grid).search([(0, 0)])[0][-1, -1])
 
 
-def a_star(grid: list[list[int]]) -> int:
+def a_star(grid: list[list[float]]) -> float:
     """Search a path in an NxN grid of costs per cell. Return overall cost."""
-    n = len(grid)
-    g = n - 1
-    d: float = grid[0][0]
-    q: list[tuple[float, int, int]] = [(float(d + g + g), 0, 0)]
-    m = [[math.inf] * n for _ in grid]
-    m[0][0] = d
-    while q:
-        _, i, j = heappop(q)
-        d = m[i][j]
-        if i == g and j == g:
-            return int(d)
-        for dx, dy in ((-1, 0), (1, 0), (0, -1), (0, 1)):
-            cx, cy = i + dx, j + dy
-            if not (0 <= cx < n and 0 <= cy < n):
-                continue
-            dc = d + grid[cx][cy]
-            if m[cx][cy] <= dc:
-                continue
-            h = dc + g + g - cx - cy
-            heappush(q, (h, cx, cy))
-            m[cx][cy] = dc
-    return -1
+    # See `dijkstra`.
+    g = len(grid) - 1
+    return _total(grid, CostGrid(grid).shortest_path((0, 0), (g, g))[0])
 
 
 def connect_islands(grid: list[list[int]]) -> int:
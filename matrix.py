@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 from bisect import bisect_right
-from functools import lru_cache
 from itertools import accumulate, combinations
 
+import numpy as np
+
 import arrays
+from dynamic_programming import int_dtype, interval_dp
 
 
 def make(s: str) -> list[list[int]]:
@@ -41,6 +43,13 @@ def rotate90cc(m: list[list[int]]) -> None:
     m.reverse()
 
 
+def _products(a: list[int]) -> tuple[np.ndarray, type]:
+    """Return `a` as an array and the table type for sums of triple products."""
+    # Exact Python ints, if the sums of products could overflow `np.int64`.
+    dtype = int_dtype(max(map(abs, a), default=0) ** 3 * len(a))
+    return np.array(a, dtype=dtype), dtype
+
+
 def optimum_multiplications(a: list[int]) -> int:
     """Return minimum number of operations for matrices described by `a`.
 
@@ -50,19 +59,17 @@ def optimum_multiplications(a: list[int]) -> int:
     The number of operations differs by the sequence of
     matrix multiplication applied.
     """
+    # Multiplying (i, k) x (k, j) matrices gives: (i, j) matrix.
+    # The number of multiplications necessary is: i * k * j
+    # The matrices between the dimensions `a[i]` and `a[j]` are
+    # multiplied as two products split at the dimension `a[k]`.
+    # Runs in O(N^3) vectorized for each diagonal of the DP table.
+    d, dtype = _products(a)
+    n = len(a) - 1
+    if n <= 0:
+        return 0
+    return int(interval_dp(n, lambda i, k, j: d[i] * d[j] * d[k], dtype=dtype)[0, n])
 
-    @lru_cache(None)
-    def sub(i: int, j: int) -> int:
-        # Multiplying (i, k) x (k, j) matrices gives: (i, j) matrix.
-        # The number of multiplications necessary is: i * k * j
-        # For each K we multiply two matrices resulting from recursive calls:
-        #   sub(i, k)     => (a[i - 1], a[k])
-        #   sub(k + 1, j) => (    a[k], a[j])
-        m = lambda k: sub(i, k) + a[i - 1] * a[k] * a[j] + sub(k + 1, j)
-        # Determine the optimal split for this range.
-        return min(map(m, range(i, j))) if i < j else 0
-
-    return sub(1, len(a) - 1)
 
 def balloon_coin_popping(a: list[int]) -> int:
     """Return the maximum number of coins that can be gained if popping balloons.
@@ -83,18 +90,13 @@ def balloon_coin_popping(a: list[int]) -> int:
         Sum of coins gained by popping each ballooon.
 
     """
-    a = [1, *a, 1]
-
-    @lru_cache(None)
-    def sub(i: int, j: int) -> int:
-        # Choose the maximum by popping balloons between `(i, j)` - exclusive.
-        # Sub-problems also pop balloons between `(i, k)` or `(k, j)`.
-        # Finally, multiply by coins in `i`, `k`, `j`.
-        return i + 1 < j and max(
-            sub(i, k) + a[i] * a[k] * a[j] + sub(k, j) for k in range(i + 1, j)
-        )
-
-    return sub(0, len(a) - 1)
+    # Choose the maximum by popping balloons between `(i, j)` - exclusive.
+    # The last balloon `k` popped between `(i, j)` is adjacent to `i` and `j`.
+    # Sub-problems pop balloons between `(i, k)` and `(k, j)` before.
+    d, dtype = _products([1, *a, 1])
+    n = len(a) + 1
+    cost = lambda i, k, j: d[i] * d[j] * d[k]
+    return int(interval_dp(n, cost, op="max", dtype=dtype)[0, n])
 
 
 A = ord("A")
@@ -107,28 +109,19 @@ def optimum_brackets(a: list[int]) -> str:
     return optimal bracketed multiplication expression
     in the form:  `A(BC)D`.
     """
-
-    @lru_cache(None)
-    def sub(i: int, j: int) -> tuple[int, int]:
-        # Multiplying (i, k) x (k, j) matrices gives: (i, j) matrix.
-        # The number of multiplications necessary is: i * k * j
-        # For each K we multiply two matrices resulting from recursive calls:
-        #   sub(i, k)     => (a[i - 1], a[k])
-        #   sub(k + 1, j) => (    a[k], a[j])
-        def split(k: int) -> tuple[int, int]:
-            return sub(i, k)[0] + a[i - 1] * a[k] * a[j] + sub(k + 1, j)[0], k
-
-        # Determine the optimal split for this range.
-        return min(map(split, range(i, j))) if i < j else (0, i)
+    # Same as `optimum_multiplications`, but keeping the optimal splits.
+    d, dtype = _products(a)
+    cost = lambda i, k, j: d[i] * d[j] * d[k]
+    _, opt = interval_dp(len(a) - 1, cost, argopt=True, dtype=dtype)
 
     def par(i: int, j: int) -> str:
-        if i == j:
-            return chr(A + i - 1)
-        k = sub(i, j)[1]
-        a, b = par(i, k), par(k + 1, j)
+        if i + 1 == j:
+            return chr(A + i)
+        k = opt[i, j]
+        a, b = par(i, k), par(k, j)
         return a + (b if len(b) == 1 else f"({b})")
 
-    return par(1, len(a) - 1)
+    return par(0, len(a) - 1)
 
 
 def sorted_median(m: list[list[int]]) -> int:
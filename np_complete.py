@@ -2,6 +2,15 @@
 
 from __future__ import annotations
 
+import math
+import time
+from typing import TYPE_CHECKING
+
+from bits import enum
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable, Sequence
+
 
 def min_diff_set_partition(a: list[int]) -> tuple[int, int]:
     """Partition the array `a` into two (almost) equal sets.
@@ -81,3 +90,239 @@ def just_add_operators(s: str, target: int) -> list:
         split(i, ns, nv, nv)
 
     return ret
+
+
+def _component(nbs: list[int], start: int, alive: int) -> int:
+    """Return the bitset of the connected component of `start` in `alive`."""
+    seen = front = start
+    while front:
+        reach = 0
+        for i, _ in enum(front):
+            reach |= nbs[i]
+        front = reach & alive & ~seen
+        seen |= front
+    return seen
+
+
+def _maximal_matching(nbs: list[int], alive: int) -> tuple[int, int]:
+    """Match the `alive` vertices greedily. Return the size and the unmatched.
+
+    The size is a lower bound of any cover. The unmatched are independent.
+    """
+    rest, size = alive, 0
+    for i, b in enum(alive):
+        if rest & b and (m := nbs[i] & rest):
+            rest &= ~(b | (m & -m))
+            size += 1
+    return size, rest
+
+
+def _crown(nbs: list[int], alive: int) -> tuple[int, int]:
+    """Return a crown `(head, crown)`: the `head` is in some minimum cover.
+
+    The `crown` is an independent set, matched into its neighbors: the `head`.
+    Both are empty if no crown is found.
+    """
+    # The vertices left out by a maximal matching are independent.
+    # A maximum matching of them into their neighbors leaves
+    # some of them unmatched. Those together with the matched partners
+    # of their neighbors, expanded until closed, form the crown.
+    _, rest = _maximal_matching(nbs, alive)
+    mate: dict[int, int] = {}  # head vertex -> matched outsider
+    mated: dict[int, int] = {}  # outsider -> matched head vertex
+    free = []
+    for o, _ in enum(rest):
+        # BFS for an augmenting path from `o` over the alternating edges.
+        prev: dict[int, int] = {}
+        front, end = [o], None
+        while front and end is None:
+            nxt = []
+            for x in front:
+                for h, _ in enum(nbs[x] & alive):
+                    if h in prev:
+                        continue
+                    prev[h] = x
+                    if h not in mate:
+                        end = h
+                        break
+                    nxt.append(mate[h])
+                if end is not None:
+                    break
+            front = nxt
+        if end is None:
+            free.append(o)
+            continue
+        # Flip the matched and the unmatched edges along the path.
+        while True:
+            x = prev[end]
+            mate[end], mated[x], end = x, end, mated.get(x, -1)
+            if x == o:
+                break
+    crown = sum(1 << o for o in free)
+    head = 0
+    while crown:
+        reach = 0
+        for i, _ in enum(crown):
+            reach |= nbs[i]
+        if reach & alive == head:
+            break
+        head = reach & alive
+        for h, _ in enum(head):
+            crown |= 1 << mate[h]
+    return head, crown
+
+
+def _reduce(nbs: list[int], alive: int) -> tuple[list[int], int, int, list]:
+    """Apply the reduction rules to the graph of the `alive` vertices.
+
+    Return the neighbors `nbs`, the remaining `alive` vertices, the `cover`
+    vertices taken, and the degree-2 `folds` in the order applied.
+    The `nbs` list is copied before it is changed by a fold.
+    """
+    # - A vertex of degree 0 is not needed.
+    # - The neighbor of a vertex of degree 1 can be taken instead.
+    # - If a neighbor `u` of `v` is adjacent to all the other neighbors of `v`,
+    #   `u` can be taken: a cover without `u` has all the neighbors of `u`,
+    #   so it can swap `v` for `u`. This covers the triangles of degree 2 vertices.
+    # - A vertex `v` of degree 2 with non-adjacent neighbors `u` and `w` is folded:
+    #   `u` and `w` are merged into `u`, and `v` is removed. The cover of
+    #   the folded graph is one vertex smaller: it is unfolded to take `u` and `w`,
+    #   if it took `u`, otherwise to take `v`.
+    cover, folds, copied = 0, [], False
+    changed = True
+    while changed:
+        changed = False
+        for i, b in enum(alive):
+            if not alive & b:
+                continue
+            n = nbs[i] & alive
+            d = n.bit_count()
+            if d < 2:
+                cover |= n
+                alive &= ~(b | n)
+                changed |= d > 0
+                continue
+            closed = n | b
+            u = next((u for j, u in enum(n) if not closed & ~nbs[j] & ~u), 0)
+            if u:
+                cover |= u
+                alive &= ~u
+                changed = True
+            elif d == 2:
+                (j, u), (k, w) = enum(n)
+                if not copied:
+                    nbs, copied = nbs[:], True
+                nbs[j] = (nbs[j] | nbs[k]) & alive & ~(b | u | w)
+                for x, _ in enum(nbs[k] & alive & ~b):
+                    nbs[x] |= u
+                alive &= ~(b | w)
+                folds.append((b, u, w))
+                changed = True
+    return nbs, alive, cover, folds
+
+
+def vertex_cover(
+    edges: Iterable[Sequence[Hashable]], budget: float | None = None
+) -> set:
+    """Return a minimum vertex cover of the undirected graph of the `edges`.
+
+    A vertex cover is a set of vertices, such that each edge has at least one end
+    in it. With a time `budget` in seconds, the search stops early
+    and returns the smallest cover found so far.
+
+    Parameters
+    ----------
+    edges : Iterable[Sequence[Hashable]]
+        pairs of vertices
+    budget : float | None, optional
+        time limit in seconds, by default None
+
+    Returns
+    -------
+    set
+        vertices of a minimum vertex cover
+
+    """
+    # Branch and bound over bitsets of vertices as Python ints.
+    # The graph is first shrunk by a crown reduction and the reduction rules.
+    # Then each connected component is solved on its own, branching
+    # on a vertex `v` of the maximum degree: a cover takes either `v`,
+    # or all the neighbors of `v`. A search is bounded by the size `k`
+    # of the smallest cover found so far, and cut as soon as
+    # a maximal matching shows that it cannot find a smaller cover.
+    # Without time left, the search takes only `v`, which turns it greedy.
+    ids: dict[Hashable, int] = {}
+    nbs: list[int] = []
+    loops = 0
+    for a, b in edges:
+        i, j = (ids.setdefault(x, len(ids)) for x in (a, b))
+        nbs.extend([0] * (len(ids) - len(nbs)))
+        nbs[i] |= 1 << j
+        nbs[j] |= 1 << i
+        loops |= (i == j) << i
+    deadline = -math.inf  # the first run is greedy
+
+    def solve(nbs: list[int], alive: int, k: int) -> int | None:
+        # Return a cover of the `alive` vertices smaller than `k` or None.
+        nbs, alive, cover, folds = _reduce(nbs, alive)
+        k -= cover.bit_count() + len(folds)
+        if k <= 0 or (alive and (sub := branch(nbs, alive, k)) is None):
+            return None
+        cover |= sub if alive else 0
+        for v, u, w in reversed(folds):
+            cover |= w if cover & u else v
+        return cover
+
+    def branch(nbs: list[int], alive: int, k: int) -> int | None:
+        parts, rest = [], alive
+        while rest:
+            parts.append(_component(nbs, rest & -rest, rest))
+            rest &= ~parts[-1]
+        bounds = [_maximal_matching(nbs, c)[0] for c in parts]
+        lower = sum(bounds)
+        if lower >= k:
+            return None
+        if len(parts) > 1:
+            cover = 0
+            for c, lb in zip(parts, bounds, strict=True):
+                lower -= lb
+                sub = solve(nbs, c, k - cover.bit_count() - lower)
+                if sub is None:
+                    return None
+                cover |= sub
+            return cover
+        i, b = max(enum(alive), key=lambda e: (nbs[e[0]] & alive).bit_count())
+        best = solve(nbs, alive & ~b, k - 1)
+        if best is not None:
+            best |= b
+            k = best.bit_count()
+        n = nbs[i] & alive
+        if time.monotonic() < deadline and n.bit_count() < k:
+            sub = solve(nbs, alive & ~b & ~n, k - n.bit_count())
+            best = best if sub is None else sub | n
+        return best
+
+    alive = (1 << len(nbs)) - 1 & ~loops
+    head, crown = _crown(nbs, alive)
+    alive &= ~(head | crown)
+    # The greedy cover is the first bound for the exact search.
+    cover = solve(nbs, alive, len(nbs) + 1)
+    deadline = math.inf if budget is None else time.monotonic() + budget
+    exact = solve(nbs, alive, cover.bit_count())
+    cover = cover if exact is None else exact
+    cover |= head | loops
+    vertexes = list(ids)
+    return {vertexes[i] for i, _ in enum(cover)}
+
+
+def independent_set(
+    vertexes: Iterable[Hashable],
+    edges: Iterable[Sequence[Hashable]],
+    budget: float | None = None,
+) -> set:
+    """Return a maximum independent set of the undirected graph.
+
+    No two vertices of an independent set are adjacent.
+    It is the complement of a minimum vertex cover, see `vertex_cover`.
+    """
+    return set(vertexes) - vertex_cover(edges, budget)
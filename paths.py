@@ -0,0 +1,164 @@
+"""Weighted shortest path searches over implicit graphs.
+
+A graph is given by a `neighbors(node)` function returning `(node, weight)` pairs
+for the outgoing edges of a `node`. Nodes can be any hashable values,
+e.g. ints, grid coordinates, or `(node, layer)` states of `layered` graphs.
+Weights must be non-negative.
+"""
+
+from __future__ import annotations
+
+import math
+from heapq import heappop, heappush
+from itertools import count
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterable
+
+    Neighbors = Callable[[Any], Iterable[tuple[Any, float]]]
+
+
+def path(parent: dict, target: Hashable) -> list:
+    """Return the path from a source to `target` following the `parent` links.
+
+    Sources are their own parents. Return an empty list for unreached targets.
+    """
+    if target not in parent:
+        return []
+    o = [target]
+    while (p := parent[o[-1]]) != o[-1]:
+        o.append(p)
+    o.reverse()
+    return o
+
+
+def dijkstra(
+    neighbors: Neighbors,
+    sources: Iterable,
+    target: Any = None,
+    heuristic: Callable[[Any], float] | None = None,
+) -> tuple[dict, dict]:
+    """Search the shortest paths from `sources`. Return the `dist` and `parent` maps.
+
+    The search stops at the first node reached that is equal to the `target`,
+    or for which `target(node)` returns True, if `target` is callable.
+    With an admissible and consistent `heuristic`: a lower bound of the distance
+    to the target, this is an A* search.
+    """
+    # The heap is not decreased in place. Instead, new entries are pushed
+    # and outdated entries skipped. The counter breaks ties without
+    # comparing the nodes, which may not be comparable.
+    is_target = target if callable(target) else lambda n: n == target
+    h = heuristic or (lambda _: 0)
+    dist: dict = {}
+    parent: dict = {}
+    done = set()
+    tie = count()
+    q: list[tuple[float, int, Any]] = []
+    for s in sources:
+        dist[s] = 0
+        parent[s] = s
+        heappush(q, (h(s), next(tie), s))
+    while q:
+        _, _, n = heappop(q)
+        if n in done:
+            continue
+        done.add(n)
+        if is_target(n):
+            break
+        d = dist[n]
+        for c, w in neighbors(n):
+            dc = d + w
+            if dc < dist.get(c, math.inf):
+                dist[c] = dc
+                parent[c] = n
+                heappush(q, (dc + h(c), next(tie), c))
+    # Drop the tentative distances of the nodes not settled.
+    return {n: dist[n] for n in done}, {n: parent[n] for n in done}
+
+
+def shortest_path(
+    neighbors: Neighbors,
+    source: Hashable,
+    target: Any,
+    heuristic: Callable[[Any], float] | None = None,
+) -> tuple[float, list]:
+    """Return the distance and the path from `source` to `target`.
+
+    The `target` may be a node or a predicate, see `dijkstra`.
+    Return `(math.inf, [])` if the `target` is unreachable.
+    """
+    dist, parent = dijkstra(neighbors, [source], target, heuristic)
+    is_target = target if callable(target) else lambda n: n == target
+    end = next((n for n in dist if is_target(n)), None)
+    return (math.inf, []) if end is None else (dist[end], path(parent, end))
+
+
+def bidirectional_dijkstra(
+    neighbors: Neighbors,
+    source: Hashable,
+    target: Hashable,
+    reverse: Neighbors | None = None,
+) -> tuple[float, list]:
+    """Return the distance and the path from `source` to `target`.
+
+    The search runs from both ends and stops once the searches meet.
+    `reverse(node)` returns the incoming edges; by default the graph is undirected.
+    Return `(math.inf, [])` if the `target` is unreachable.
+    """
+    # Alternate the forward and the backward search, always advancing the one
+    # with the smaller frontier distance. Each edge relaxation that touches
+    # a node reached by the other search gives a candidate path.
+    # Once the two frontier distances sum up above the best candidate,
+    # no shorter path exists.
+    if source == target:
+        return 0, [source]
+    nbs = (neighbors, reverse or neighbors)
+    dist: tuple[dict, dict] = ({source: 0}, {target: 0})
+    parent: tuple[dict, dict] = ({source: source}, {target: target})
+    done: tuple[set, set] = (set(), set())
+    tie = count()
+    q: tuple[list, list] = ([(0, next(tie), source)], [(0, next(tie), target)])
+    best, meet = math.inf, None
+    while q[0] and q[1] and q[0][0][0] + q[1][0][0] < best:
+        side = 0 if q[0][0][0] <= q[1][0][0] else 1
+        _, _, n = heappop(q[side])
+        if n in done[side]:
+            continue
+        done[side].add(n)
+        ds, do = dist[side], dist[1 - side]
+        d = ds[n]
+        for c, w in nbs[side](n):
+            dc = d + w
+            if dc < ds.get(c, math.inf):
+                ds[c] = dc
+                parent[side][c] = n
+                heappush(q[side], (dc, next(tie), c))
+            if c in do and dc + do[c] < best:
+                best, meet = dc + do[c], (c, n, side)
+    if meet is None:
+        return math.inf, []
+    # The best path joins the two search trees with the edge between `n` and `c`.
+    c, n, side = meet
+    a, b = (c, n) if side else (n, c)
+    return best, path(parent[0], a) + path(parent[1], b)[::-1]
+
+
+def layered(
+    neighbors: Callable[[Any], Iterable[tuple[Any, float, int]]], k: int
+) -> Neighbors:
+    """Return the neighbors function of the layered state graph.
+
+    `neighbors(node)` returns `(node, weight, cost)` triples, where `cost`
+    is the use of a limited resource, e.g. 1 for a special edge or for breaking
+    a wall. The states are `(node, used)` pairs with `used <= k`.
+    """
+
+    def states(state: tuple[Any, int]) -> Iterable[tuple[tuple[Any, int], float]]:
+        n, used = state
+        return (
+            ((c, used + cost), w) for c, w, cost in neighbors(n) if used + cost <= k
+        )
+
+    return states
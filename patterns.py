@@ -1,3 +1,239 @@
 """Module for algorithms and puzzles related to pattern search."""
 
 from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING
+
+from functional import memoize
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+
+def prefix_function(p: Sequence) -> list[int]:
+    """Return the KMP prefix function of `p`.
+
+    `pi[q]` is the length of the longest proper prefix of `p[:q+1]`,
+    which is also a suffix of `p[:q+1]`.
+    """
+    # Runs in O(N). `k` increases with every matched symbol,
+    # and falls back along the table computed so far after a mismatch.
+    pi = [0] * len(p)
+    k = 0
+    for q in range(1, len(p)):
+        while k and p[k] != p[q]:
+            k = pi[k - 1]
+        if p[k] == p[q]:
+            k += 1
+        pi[q] = k
+    return pi
+
+
+def z_function(s: Sequence) -> list[int]:
+    """Return the Z-array of `s`.
+
+    `z[i]` is the length of the longest common prefix of `s` and `s[i:]`.
+    By convention `z[0] == len(s)`.
+    """
+    # Runs in O(N). `[lo, hi)` is the right-most window matching a prefix of `s`.
+    # Positions within the window start from the mirrored value at `i - lo`.
+    n = len(s)
+    z = [0] * n
+    if n:
+        z[0] = n
+    lo = hi = 0
+    for i in range(1, n):
+        k = min(hi - i, z[i - lo]) if i < hi else 0
+        while i + k < n and s[k] == s[i + k]:
+            k += 1
+        z[i] = k
+        if i + k > hi:
+            lo, hi = i, i + k
+    return z
+
+
+def kmp_search(text: Iterable, p: Sequence) -> Iterator[int]:
+    """Yield start positions of (overlapping) occurrences of `p` in `text`.
+
+    The `text` is consumed one symbol at a time, so it may be any iterator,
+    e.g. a generator of tokens. Only the KMP state is kept in memory.
+    """
+    m = len(p)
+    if not m:
+        return
+    pi = prefix_function(p)
+    k = 0  # number of symbols of `p` matched so far
+    for i, c in enumerate(text):
+        while k and p[k] != c:
+            k = pi[k - 1]
+        if p[k] == c:
+            k += 1
+            if k == m:
+                yield i - m + 1
+                k = pi[k - 1]
+
+
+def suffix_prefix_overlap(text: Sequence, p: Sequence) -> int:
+    """Return the length of the longest prefix of `p` which is a suffix of `text`."""
+    # Runs KMP of `p` over `text` and returns the final state.
+    pi = prefix_function(p)
+    k = 0
+    for c in text:
+        if k == len(p):
+            k = pi[k - 1]
+        while k and p[k] != c:
+            k = pi[k - 1]
+        if k < len(p) and p[k] == c:
+            k += 1
+    return k
+
+
+def find_all(text: str, p: str, start: int = 0) -> array:
+    """Return an array of start positions of (overlapping) occurrences of `p`."""
+    # The scan runs on `str.find`. A naive `find` loop, restarting after
+    # each match, is quadratic for periodic patterns like `"aaaa"`.
+    # Here, two overlapping occurrences must be at least one period
+    # of `p` apart. So after a match, the next one is extended by
+    # comparing only the last `period` characters.
+    o = array("q")
+    m = len(p)
+    if not m:
+        o.extend(range(start, len(text) + 1))
+        return o
+    period = m - prefix_function(p)[-1]
+    tail = p[m - period :]
+    i = text.find(p, start)
+    while i >= 0:
+        o.append(i)
+        while text.startswith(tail, i + m):
+            i += period
+            o.append(i)
+        i = text.find(p, i + period)
+    return o
+
+
+def stream_search(chunks: Iterable[str], p: str) -> Iterator[int]:
+    """Yield positions of `p` in a text delivered as an iterable of `chunks`.
+
+    The `chunks` may come from a file, e.g.: `iter(partial(f.read, 1 << 20), "")`.
+    Occurrences spanning the boundary between chunks are found as well.
+    The positions are relative to the start of the whole text.
+    """
+    # Only the last `m - 1` characters of the text need to be carried
+    # over to the next chunk. This is the same bound as for the KMP state,
+    # but the chunks themselves are scanned with `find_all`.
+    m = len(p)
+    if not m:
+        return
+    carry = ""  # tail of the previous chunk, shorter than `p`
+    offset = 0  # position of `carry` in the whole text
+    for chunk in chunks:
+        buf = carry + chunk
+        # No occurrence fits into `carry` alone, so each one found here
+        # ends within `chunk` and has not been reported before.
+        for i in find_all(buf, p):
+            yield offset + i
+        keep = min(m - 1, len(buf))
+        offset += len(buf) - keep
+        carry = buf[len(buf) - keep :]
+
+
+class Wildcards:
+    """Wildcard patterns with `*` and `?` compiled to a single automaton.
+
+    `?` matches any single character and `*` matches any sequence of characters.
+    All the patterns are run together as one bit-parallel NFA. The NFA states
+    reached are cached as a lazily built DFA, so repeated matching costs
+    one dictionary lookup per character.
+    """
+
+    def __init__(self, patterns: Iterable[str], cache_size: int = 1 << 16) -> None:
+        """Compile the `patterns`.
+
+        Parameters
+        ----------
+        patterns : Iterable[str]
+            wildcard patterns
+        cache_size : int, optional
+            maximum number of cached DFA transitions, by default 65536
+
+        """
+        self.patterns = list(patterns)
+        self.cache_size = cache_size
+        # Bit `off + k` is set, if the first `k` symbols of a pattern were matched.
+        # Each pattern uses `len(pattern) + 1` bits starting at `off`.
+        self.literal: dict[str, int] = {}  # bits entered by a literal character
+        self.any = 0  # bits entered by `?`
+        self.star = 0  # bits on `*`, looping on any character
+        self.accept = 0  # bits for a fully matched pattern
+        self.index: dict[int, int] = {}  # accept bit position to pattern index
+        start = off = 0
+        for i, p in enumerate(self.patterns):
+            # Consecutive stars are redundant and need a single closure step only.
+            p = "".join(c for j, c in enumerate(p) if c != "*" or p[j - 1 : j] != "*")  # noqa: PLW2901
+            start |= 1 << off
+            for k, c in enumerate(p, off):
+                if c == "*":
+                    self.star |= 1 << k
+                elif c == "?":
+                    self.any |= 1 << (k + 1)
+                else:
+                    self.literal[c] = self.literal.get(c, 0) | 1 << (k + 1)
+            off += len(p)
+            self.accept |= 1 << off
+            self.index[off] = i
+            off += 1
+        self.start = self._closure(start)
+        self.delta: dict[tuple[int, str], int] = {}
+
+    def _closure(self, s: int) -> int:
+        """Return the NFA states `s` extended by skipping over stars."""
+        return s | (s & self.star) << 1
+
+    def _run(self, string: str) -> int:
+        """Return the set of NFA states after consuming `string`."""
+        s = self.start
+        delta = self.delta
+        for c in string:
+            if not s:
+                break
+            n = delta.get((s, c))
+            if n is None:
+                if len(delta) >= self.cache_size:
+                    delta.clear()
+                m = self.literal.get(c, 0) | self.any
+                n = delta[s, c] = self._closure((s << 1) & m | s & self.star)
+            s = n
+        return s
+
+    def match(self, string: str) -> bool:
+        """Return True if any of the patterns matches the whole `string`."""
+        return bool(self._run(string) & self.accept)
+
+    def matches(self, string: str) -> list[str]:
+        """Return the patterns matching the whole `string` in their order."""
+        a = self._run(string) & self.accept
+        o = []
+        while a:
+            low = a & -a
+            o.append(self.patterns[self.index[low.bit_length() - 1]])
+            a ^= low
+        return o
+
+
+@memoize(maxsize=1024)
+def compile_pattern(pattern: str) -> Wildcards:
+    """Return a (cached) automaton for a wildcard `pattern`."""
+    return Wildcards((pattern,))
+
+
+@memoize(maxsize=16)
+def compile_patterns(patterns: tuple[str, ...]) -> Wildcards:
+    """Return a (cached) automaton for the tuple of wildcard `patterns`."""
+    return Wildcards(patterns)
+
+
+def match_many(patterns: Iterable[str], string: str) -> list[str]:
+    """Return the wildcard `patterns` matching `string` in a single pass."""
+    return compile_patterns(tuple(patterns)).matches(string)
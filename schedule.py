@@ -2,7 +2,23 @@
 
 from __future__ import annotations
 
-from functools import reduce
+import os
+from array import array
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from heapq import heapify, heappop, heappush
+from itertools import count
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import numpy as np
+
+import topological
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterable
+    from concurrent.futures import Executor, Future
+
+    from numpy.typing import ArrayLike
 
 
 def meetings(start: list[int], end: list[int]) -> int:
@@ -11,8 +27,281 @@ def meetings(start: list[int], end: list[int]) -> int:
     The meetings are scheduled  in one room based on the meetings
     `start` and `end` times.
     """
-    return reduce(
-        (lambda v, m: (v[0] + 1, m[0]) if v[1] < m[1] else v),
-        sorted(zip(end, start)),
-        (0, -1),
-    )[0]
+    return len(select_meetings(start, end))
+
+
+def select_meetings(start: ArrayLike, end: ArrayLike) -> np.ndarray:
+    """Return the indexes of the most meetings that can be held in one room.
+
+    A meeting can start only after the previous one ended, i.e. the intervals
+    `[start, end]` must not overlap. The indexes are ordered by time.
+    """
+    # Greedy: take the meeting ending first, then the next one ending first
+    # among those starting after it ended. In the order of `end` times,
+    # the next meeting is the first one with a start after the end,
+    # as it cannot end earlier. That is found by a binary search over
+    # the running maximum of starts, at once for all the meetings.
+    # Only the chain of selected meetings is followed one by one.
+    s, e = np.asarray(start), np.asarray(end)
+    order = np.lexsort((s, e))
+    s, e = s[order], e[order]
+    nxt = memoryview(np.searchsorted(np.maximum.accumulate(s), e, side="right"))
+    picks = array("q")
+    i = 0
+    while i < len(nxt):
+        picks.append(i)
+        i = nxt[i]
+    return order[np.frombuffer(picks, dtype=np.int64)]
+
+
+def min_rooms(start: ArrayLike, end: ArrayLike) -> int:
+    """Return the minimum number of rooms to hold all the meetings.
+
+    The meetings are the intervals `[start, end]`, see `select_meetings`.
+    """
+    # Sweep line: the meetings held at the start of a meeting are those
+    # started until then, less those ended before. The maximum is the answer.
+    s, e = np.sort(start), np.sort(end)
+    held = np.searchsorted(s, s, side="right") - np.searchsorted(e, s, side="left")
+    return int(held.max(initial=0))
+
+
+def max_weight_meetings(
+    start: ArrayLike, end: ArrayLike, weight: ArrayLike
+) -> tuple[Any, np.ndarray]:
+    """Return the max total `weight` of meetings held in one room and their indexes.
+
+    The meetings are the intervals `[start, end]`, see `select_meetings`.
+    The indexes are ordered by time.
+    """
+    # DP in the order of `end` times: the best total of the first `j + 1`
+    # meetings either skips meeting `j`, or takes it together with
+    # the best total of the meetings ended before it started.
+    # Those are found by a binary search, at once for all the meetings.
+    s, e, w = np.asarray(start), np.asarray(end), np.asarray(weight)
+    order = np.argsort(e, kind="stable")
+    s, e, w = s[order], e[order], w[order]
+    before = memoryview(np.searchsorted(e, s, side="left"))
+    best = np.zeros(len(s) + 1, dtype=np.result_type(w.dtype, np.int64))
+    b, wm = memoryview(best), memoryview(w.astype(best.dtype))
+    for j in range(len(s)):
+        b[j + 1] = max(b[j], wm[j] + b[before[j]])
+    picks = array("q")
+    j = len(s)
+    while j:
+        if b[j] == b[j - 1]:
+            j -= 1
+        else:
+            picks.append(j - 1)
+            j = before[j - 1]
+    picks.reverse()
+    return best[-1].item(), order[np.frombuffer(picks, dtype=np.int64)]
+
+
+class IntervalTree:
+    """Static interval tree for overlap queries over the intervals `[start, end]`.
+
+    The intervals are sorted by start and split into blocks of `BLOCK` intervals.
+    A complete binary tree over the blocks keeps the maximum end of each subtree.
+    A query descends only into the subtrees with an end reaching the query,
+    processing a level of the tree at a time with NumPy.
+    """
+
+    BLOCK = 64
+
+    def __init__(self, start: ArrayLike, end: ArrayLike) -> None:
+        """Index the intervals `[start, end]`."""
+        s, e = np.asarray(start), np.asarray(end)
+        self.order = np.lexsort((e, s))
+        self.start, self.end = s[self.order], e[self.order]
+        blocks = max(1, -(-len(s) // self.BLOCK))
+        size = 1 << (blocks - 1).bit_length()
+        ends = np.resize(self.end, size * self.BLOCK)  # padded, but never in range
+        level = ends.reshape(size, self.BLOCK).max(axis=1)
+        self.levels = [level]
+        while len(level) > 1:
+            level = level.reshape(-1, 2).max(axis=1)
+            self.levels.append(level)
+        self.levels.reverse()
+
+    def __len__(self) -> int:
+        """Return the number of intervals."""
+        return len(self.order)
+
+    def overlaps(self, start: Any, end: Any) -> np.ndarray:
+        """Return the indexes of the intervals overlapping `[start, end]`.
+
+        The indexes are ordered by the start of the intervals.
+        """
+        # Only the intervals starting until `end` may overlap.
+        k = int(np.searchsorted(self.start, end, side="right"))
+        nodes = np.zeros(1, dtype=np.int64)
+        size = len(self.levels[-1]) * self.BLOCK
+        for d, level in enumerate(self.levels):
+            nodes = nodes[(nodes * (size >> d) < k) & (level[nodes] >= start)]
+            if d + 1 < len(self.levels):
+                nodes = np.stack((2 * nodes, 2 * nodes + 1), axis=1).ravel()
+        idx = (nodes[:, None] * self.BLOCK + np.arange(self.BLOCK)).ravel()
+        idx = idx[idx < k]
+        return self.order[idx[self.end[idx] >= start]]
+
+    def stab(self, t: Any) -> np.ndarray:
+        """Return the indexes of the intervals containing the time `t`."""
+        return self.overlaps(t, t)
+
+
+class DependencyError(RuntimeError):
+    """A task was skipped, because the `task` it depends on failed."""
+
+    def __init__(self, task: Hashable) -> None:
+        """Create the error for the failed `task`."""
+        super().__init__(f"dependency failed: {task}")
+        self.task = task
+
+
+class TaskRun(NamedTuple):
+    """The outcome of a task run by `run_tasks`.
+
+    The `start` and `end` are the seconds from the start of the run,
+    when the task was submitted and when it was done. The `duration`
+    is the time spent running the task itself.
+    """
+
+    result: Any
+    error: BaseException | None
+    start: float
+    end: float
+    duration: float
+
+
+def _timed(task: Callable[[], Any]) -> tuple[float, Any]:
+    """Run the `task` and return its duration and result."""
+    t = perf_counter()
+    result = task()
+    return perf_counter() - t, result
+
+
+def run_tasks(
+    tasks: dict[Hashable, Callable[[], Any]],
+    deps: dict[Hashable, Iterable[Hashable]] | None = None,
+    workers: int | None = None,
+    executor: Executor | None = None,
+    costs: dict[Hashable, float] | None = None,
+) -> dict[Hashable, TaskRun]:
+    """Run the `tasks` on a `concurrent.futures` pool, each after its `deps`.
+
+    A task is ready once all the tasks it depends on are done. At most `workers`
+    tasks run at once, and the ready task with the longest chain of dependent
+    `costs` still to run (the critical path) starts first. The costs default to 1,
+    the durations of a previous run make good estimates.
+    If a task fails, the tasks depending on it are skipped
+    with a `DependencyError`, while the independent ones keep running.
+
+    Parameters
+    ----------
+    tasks : dict[Hashable, Callable[[], Any]]
+        the tasks by name, picklable for a process pool
+    deps : dict[Hashable, Iterable[Hashable]] | None, optional
+        the names of the tasks each task depends on, by default None
+    workers : int | None, optional
+        the number of tasks run at once, by default the number of CPUs
+    executor : Executor | None, optional
+        the pool to run the tasks, by default a new thread pool
+    costs : dict[Hashable, float] | None, optional
+        the estimated durations of the tasks, by default 1
+
+    Returns
+    -------
+    dict[Hashable, TaskRun]
+        the outcome of each task, in the order done
+
+    """
+    # Critical path priorities: the cost of each task plus the maximum
+    # priority of the tasks depending on it, computed in reversed topological
+    # order, which also makes sure there are no cycles.
+    deps = deps or {}
+    costs = costs or {}
+    kids: dict[Hashable, list] = {t: [] for t in tasks}
+    for t, ds in deps.items():
+        for d in ds:
+            if d not in tasks or t not in tasks:
+                msg = f"unknown task: {d if d not in tasks else t}"
+                raise ValueError(msg)
+            kids[d].append(t)
+    prio: dict[Hashable, float] = {}
+    for t in reversed(topological.order(list(tasks), kids)):
+        prio[t] = costs.get(t, 1) + max((prio[k] for k in kids[t]), default=0)
+    waiting = dict.fromkeys(tasks, 0)
+    for ds in kids.values():
+        for t in ds:
+            waiting[t] += 1
+    tie = count()
+    ready = [(-prio[t], next(tie), t) for t in tasks if not waiting[t]]
+    heapify(ready)
+    runs: dict[Hashable, TaskRun] = {}
+    running: dict[Future, Hashable] = {}
+    started: dict[Hashable, float] = {}
+    workers = workers or os.cpu_count() or 1
+    pool = executor or ThreadPoolExecutor(workers)
+    t0 = perf_counter()
+    try:
+        while ready or running:
+            while ready and len(running) < workers:
+                t = heappop(ready)[2]
+                started[t] = perf_counter() - t0
+                running[pool.submit(_timed, tasks[t])] = t
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for f in done:
+                t = running.pop(f)
+                end = perf_counter() - t0
+                error = f.exception()
+                duration, result = (end - started[t], None) if error else f.result()
+                runs[t] = TaskRun(result, error, started[t], end, duration)
+                if error:
+                    # Skip all the tasks depending on `t`, directly or not.
+                    stack = list(kids[t])
+                    while stack:
+                        k = stack.pop()
+                        if k not in runs:
+                            runs[k] = TaskRun(None, DependencyError(t), end, end, 0.0)
+                            stack.extend(kids[k])
+                    continue
+                for k in kids[t]:
+                    waiting[k] -= 1
+                    if not waiting[k] and k not in runs:
+                        heappush(ready, (-prio[k], next(tie), k))
+    finally:
+        if executor is None:
+            pool.shutdown()
+    return runs
+
+
+def critical_path(
+    runs: dict[Hashable, TaskRun], deps: dict[Hashable, Iterable[Hashable]]
+) -> tuple[float, list]:
+    """Return the total duration and the tasks of the critical path of the `runs`.
+
+    The critical path is the chain of dependent tasks with the longest
+    total duration, which bounds the run time with any number of workers.
+    Raise `ValueError` if the `deps` name a task missing from the `runs`.
+    """
+    for t, ds in deps.items():
+        for d in ds:
+            if d not in runs or t not in runs:
+                msg = f"unknown task: {d if d not in runs else t}"
+                raise ValueError(msg)
+    total: dict[Hashable, float] = {}
+    prev: dict[Hashable, Hashable] = {}
+    # Tasks after the tasks they depend on.
+    for t in reversed(topological.order(list(runs), deps)):
+        p = max(deps.get(t, ()), key=total.__getitem__, default=None)
+        total[t] = runs[t].duration + (0 if p is None else total[p])
+        if p is not None:
+            prev[t] = p
+    t = max(total, key=total.__getitem__, default=None)
+    path = []
+    while t is not None:
+        path.append(t)
+        t = prev.get(t)
+    path.reverse()
+    return (total[path[-1]] if path else 0.0), path
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import math
 import sys
-from heapq import heappop, heappush
 from itertools import accumulate
 from typing import Any, Callable
 
+import paths
+
 
 def upper_int(predicate: Callable, low: int, high: int, result: Any = None) -> Any:
     """Find the max int from between `low` and `high` for which `predicate` is True.
@@ -412,38 +414,18 @@ def shortest_path_with_special_edge(edges: list, a: int, b: int) -> int:
         minimum path distance using at most one special edge.
 
     """
-    # Determine the size of the adjacency map.
+    # Search the layered graph of `(node, special edges used)` states.
     n = max(max(e[0], e[1]) for e in edges) + 1
-    # Build up the adjacency map.
+    # Build up the adjacency map: `(node, weight, special weight)`.
     adj = [[] for _ in range(n)]
     for e in edges:
         adj[e[0]].append(e[1:])
         adj[e[1]].append((e[0], e[2], e[3]))
-    # Initialize the minimum visited distance.
-    mx = sum(e[2] for e in edges) + 1
-    v = [[mx, mx] for _ in range(n)]
-    # Priority heap queue: distance, number of special edges, node
-    q = [(0, 0, a)]
-    while q:
-        # Distance, number of special edges, destination node.
-        d, s, n = heappop(q)
-        # Cut if shorter value found.
-        if v[n][s] <= d:
-            continue
-        # This will be the min distance to b.
-        if n == b:
-            return d
-        # Update minimum visited distance.
-        v[n][s] = v[n][1] = d
-        for c, e1, e2 in adj[n]:
-            # Cut, if there exists a better path.
-            if v[c][s] > d + e1:
-                heappush(q, (d + e1, s, c))
-                # In case we did not use the curved edge yet,
-                # and it is shorter than the straight one.
-                if s == 0 and e2 < e1 and v[c][1] > d + e2:
-                    heappush(q, (d + e2, 1, c))
-    return -1
+    # Each edge can be taken as normal edge or as a special one.
+    both = lambda n: [(c, w, s) for c, e1, e2 in adj[n] for w, s in ((e1, 0), (e2, 1))]
+    d, _ = paths.shortest_path(paths.layered(both, 1), (a, 0), lambda s: s[0] == b)
+    return -1 if d == math.inf else d
+
 
 def flower_gardening(a: list[int], k: int, w: int) -> int:
     """Return the maximum length of the shortest flower in a after `k` days of watering.
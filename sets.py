@@ -2,16 +2,31 @@
 
 from __future__ import annotations
 
-from itertools import chain, combinations
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, groupby, repeat
+from multiprocessing import get_all_start_methods, get_context
 from operator import itemgetter
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from combinatorics import chunks, subsets
+from sorting import external_sort
 
 if TYPE_CHECKING:
     from collections.abc import Iterable, Iterator, Sequence
+    from os import PathLike
 
 
 class Disjoint:
-    """Create a disjoint set using find-union algorithms."""
+    """Create a disjoint set using find-union algorithms.
+
+    Uses union by size and path halving. The parents and the sizes of the sets
+    are stored in compact `array("q")` arrays of 8 bytes per node.
+    """
 
     def __init__(self, size: int) -> None:
         """Initialize the disjoint set to the `size` of nodes specified.
@@ -22,40 +37,238 @@ class Disjoint:
             the number of nodes in the set
 
         """
-        self.parent = list(range(size))
-        self.rank = [0] * size
-        self.size = [1] * size
+        self.parent = array("q", range(size))
+        self.size = array("q", [1]) * size
+        self.count = size  # number of disjoint sets
+
+    def __len__(self) -> int:
+        """Return the number of nodes."""
+        return len(self.parent)
 
     def find(self, i: int) -> int:
         """Find the representative node for `i`."""
-        while i != self.parent[i]:
-            i, self.parent[i] = self.parent[i], self.parent[self.parent[i]]
+        parent = self.parent
+        while i != parent[i]:
+            i, parent[i] = parent[i], parent[parent[i]]
         return i
 
     def union(self, i: int, j: int) -> int:
-        """Merge both subsets containing nodes `i` and `j`."""
+        """Merge both subsets containing nodes `i` and `j`. Return the new root."""
         x = self.find(i)
         y = self.find(j)
-
         if x == y:
             return x
+        # Attach the smaller set `y` under the larger set `x`.
+        if self.size[x] < self.size[y]:
+            x, y = y, x
+        self.parent[y] = x
+        self.size[x] += self.size[y]
+        self.count -= 1
+        return x
 
-        rx = self.rank[x]
-        ry = self.rank[y]
+    def find_many(self, nodes: Any = None) -> np.ndarray:
+        """Return the representatives of `nodes` (all by default) as an array."""
+        # Pointer jumping on a snapshot of the parents, vectorized with NumPy.
+        parent = np.frombuffer(self.parent, dtype=np.int64)
+        r = parent[np.asarray(nodes, dtype=np.int64)] if nodes is not None else parent
+        while not np.array_equal(p := parent[r], r):
+            r = p
+        return r
+
+    def union_many(self, edges: Iterable[Sequence[int]]) -> int:
+        """Merge the subsets of the node pairs in `edges`. Return the merge count."""
+        count = self.count
+        union = self.union
+        for i, j, *_ in edges:
+            union(i, j)
+        return count - self.count
+
+    def component_size(self, i: int) -> int:
+        """Return the size of the subset containing `i`."""
+        return self.size[self.find(i)]
+
+    def components(self) -> list[list[int]]:
+        """Return the subsets as sorted lists of nodes, sorted by their first node."""
+        roots = self.find_many()
+        order = np.argsort(roots, kind="stable")
+        cuts = np.flatnonzero(np.diff(roots[order])) + 1
+        return sorted(c.tolist() for c in np.split(order, cuts) if len(c))
+
+
+class RollbackDisjoint:
+    """Create a disjoint set with undo of the unions.
+
+    Uses union by size without path compression, so that every union
+    changes only one parent and can be undone from the operation log.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initialize the disjoint set to the `size` of nodes specified."""
+        self.parent = array("q", range(size))
+        self.size = array("q", [1]) * size
+        self.count = size  # number of disjoint sets
+        self.log: list[int] = []  # the roots attached by the unions
+
+    def __len__(self) -> int:
+        """Return the number of nodes."""
+        return len(self.parent)
+
+    def find(self, i: int) -> int:
+        """Find the representative node for `i`. Runs in O(log N)."""
+        parent = self.parent
+        while i != parent[i]:
+            i = parent[i]
+        return i
+
+    def connected(self, i: int, j: int) -> bool:
+        """Return True if `i` and `j` are in the same subset."""
+        return self.find(i) == self.find(j)
 
-        # rename x to the larger set.
-        if rx < ry or (rx == ry and self.size[x] < self.size[y]):
+    def union(self, i: int, j: int) -> bool:
+        """Merge both subsets containing nodes `i` and `j`. Return True if merged."""
+        x, y = self.find(i), self.find(j)
+        if x == y:
+            return False
+        if self.size[x] < self.size[y]:
             x, y = y, x
-        # x has a rank larger or equal to y.
-        # attach y under x
         self.parent[y] = x
-        # since x is now root of both trees
-        # adjust the rank, if the trees were of equal height
-        if rx == ry:
-            self.rank[x] += 1
         self.size[x] += self.size[y]
+        self.count -= 1
+        self.log.append(y)
+        return True
+
+    def checkpoint(self) -> int:
+        """Return a checkpoint to `rollback` to."""
+        return len(self.log)
+
+    def rollback(self, checkpoint: int = 0) -> None:
+        """Undo the unions done after the `checkpoint`."""
+        log, parent, size = self.log, self.parent, self.size
+        while len(log) > checkpoint:
+            y = log.pop()
+            size[parent[y]] -= size[y]
+            parent[y] = y
+            self.count += 1
+
+
+def dynamic_connectivity(n: int, events: Iterable[Sequence]) -> list[bool]:
+    """Answer connectivity queries over a graph of `n` nodes with changing edges.
+
+    The `events` are `("add", a, b)`, `("remove", a, b)`, and `("query", a, b)`
+    for undirected edges. Removed edges must be present.
+    Return if `a` and `b` are connected for each query, in order.
+    """
+    # Offline divide and conquer over time. Each edge is alive during a range
+    # of queries. The ranges are split onto the nodes of a segment tree
+    # over the queries. A DFS of the tree unions the edges of each tree node
+    # on the way down and rolls them back on the way up. At the leaves,
+    # the unions of exactly the edges alive for the query are in effect.
+    queries = []
+    alive: dict[tuple[int, int], list[int]] = {}  # edge -> first queries alive
+    spans = []  # (first query, end query, a, b)
+    for op, a, b in events:
+        if op == "query":
+            queries.append((a, b))
+            continue
+        e = (a, b) if a < b else (b, a)
+        if op == "add":
+            alive.setdefault(e, []).append(len(queries))
+        else:
+            spans.append((alive[e].pop(), len(queries), *e))
+    spans.extend((lo, len(queries), *e) for e, los in alive.items() for lo in los)
+
+    size = 1 << (len(queries) - 1).bit_length() if queries else 1
+    tree: list[list[tuple[int, int]]] = [[] for _ in range(2 * size)]
+    for lo, hi, a, b in spans:
+        # Standard bottom-up segment tree range decomposition.
+        lo, hi = lo + size, hi + size  # noqa: PLW2901
+        while lo < hi:
+            if lo & 1:
+                tree[lo].append((a, b))
+                lo += 1  # noqa: PLW2901
+            if hi & 1:
+                hi -= 1  # noqa: PLW2901
+                tree[hi].append((a, b))
+            lo >>= 1  # noqa: PLW2901
+            hi >>= 1  # noqa: PLW2901
+
+    d = RollbackDisjoint(n)
+    out = [False] * len(queries)
+    stack = [(1, -1)]  # tree node, checkpoint to roll back to (or -1 to enter)
+    while stack:
+        node, checkpoint = stack.pop()
+        if checkpoint >= 0:
+            d.rollback(checkpoint)
+            continue
+        stack.append((node, d.checkpoint()))
+        for a, b in tree[node]:
+            d.union(a, b)
+        if node >= size:
+            if node - size < len(queries):
+                out[node - size] = d.connected(*queries[node - size])
+        else:
+            stack.extend(((2 * node + 1, -1), (2 * node, -1)))
+    return out
+
+
+def _forest(n: int, edges: np.ndarray) -> np.ndarray:
+    """Return the connected components labels: the minimum node of each component."""
+    # Hook the roots of both ends to the smaller root, then jump the pointers
+    # until every label is a root. Repeat while any edge spans two components.
+    labels = np.arange(n)
+    src, dst = edges[:, 0], edges[:, 1]
+    while len(src):
+        a, b = labels[src], labels[dst]
+        spans = a != b
+        src, dst, a, b = src[spans], dst[spans], a[spans], b[spans]
+        np.minimum.at(labels, np.maximum(a, b), np.minimum(a, b))
+        while not np.array_equal(p := labels[labels], labels):
+            labels = p
+    return labels
+
+
+_EDGES = np.empty((0, 2), dtype=np.int64)  # edges shared with forked workers
+
+
+def _shard_forest(n: int, shard: range | np.ndarray) -> np.ndarray:
+    """Return the forest edges of the components of a shard of edges.
+
+    The `shard` is either a range of the shared `_EDGES` or an edges array.
+    """
+    edges = _EDGES[shard.start : shard.stop] if isinstance(shard, range) else shard
+    labels = _forest(n, edges)
+    nodes = np.flatnonzero(labels != np.arange(n))
+    return np.stack((nodes, labels[nodes]), axis=1)
 
-        return x
+
+def connected_components(
+    edges: Any, n: int | None = None, workers: int | None = None, shards: int = 0
+) -> np.ndarray:
+    """Return the connected components labels of the nodes of an undirected graph.
+
+    The label of each node is the minimum node of its component.
+    The `edges` (an `M x 2` array) are split into `shards`, processed in parallel
+    by `workers` processes. Each shard is reduced to a spanning forest of at most
+    `n - 1` edges, and the forests are merged.
+    """
+    e = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    if n is None:
+        n = int(e.max()) + 1 if len(e) else 0
+    shards = shards or (workers or 8)
+    if shards <= 1 or workers == 1 or len(e) < (1 << 16):
+        return _forest(n, e)
+    global _EDGES  # noqa: PLW0603
+    # Forked workers inherit the edges, others receive pickled copies.
+    fork = "fork" in get_all_start_methods()
+    parts = chunks(len(e), shards) if fork else np.array_split(e, shards)
+    _EDGES = e
+    try:
+        ctx = get_context("fork") if fork else None
+        with ProcessPoolExecutor(workers, ctx) as ex:
+            forests = list(ex.map(_shard_forest, repeat(n), parts))
+    finally:
+        _EDGES = np.empty((0, 2), dtype=np.int64)
+    return _forest(n, np.concatenate(forests))
 
 
 def weighted_paths_in_tree(edges: list[Sequence[int]], queries: list[int]) -> list[int]:
@@ -66,31 +279,16 @@ def weighted_paths_in_tree(edges: list[Sequence[int]], queries: list[int]) -> li
     """
     # Determine number of nodes.
     n = max(max(x, y) for x, y, _ in edges)
-    # Initialize the disjoint-set.
-    parents = list(range(n + 1))
-    sizes = [1] * (n + 1)
-
-    def parent(n: int) -> int:
-        """Find the parent of n. Compress the path."""
-        while n != parents[n]:
-            # Compress the set by halving.
-            n, parents[n] = parents[n], parents[parents[n]]
-        return n
+    d = Disjoint(n + 1)
 
     def union(x: int, y: int) -> int:
         """Connect `x` and `y` into one set. Return number of new paths."""
-        x, y = parent(x), parent(y)
+        x, y = d.find(x), d.find(y)
         if x == y:
             return 0
-        # New paths possible by connecting `sizes[x]` with `sizes[y]` nodes.
-        paths = sizes[x] * sizes[y]
-        # Use the larger set as parent. Should improve the find `parent` function.
-        if sizes[x] < sizes[y]:
-            x, y = y, x
-        # The parent now contains `sizes[y]` nodes.
-        sizes[x] += sizes[y]
-        # Attach `y` to `x`
-        parents[y] = x
+        # New paths possible by connecting `size[x]` with `size[y]` nodes.
+        paths = d.size[x] * d.size[y]
+        d.union(x, y)
         return paths
 
     # Sort the edges by weight.
@@ -112,10 +310,7 @@ def weighted_paths_in_tree(edges: list[Sequence[int]], queries: list[int]) -> li
 
 def powerset(iterable: Iterable) -> Iterator:
     """powerset([1,2,3]) → () (1,) (2,) (3,) (1,2) (1,3) (2,3) (1,2,3)."""  # noqa: D402
-    s = set(iterable)
-    for size in range(len(s)):
-        yield from map(set, combinations(s, size))
-    yield s
+    return map(set, subsets(set(iterable)))
 
 
 def merge_email_accounts(accounts: list[list[str]]) -> list[list[str]]:
@@ -141,26 +336,88 @@ def merge_email_accounts(accounts: list[list[str]]) -> list[list[str]]:
 
     """
     n = len(accounts)
-    parents = list(range(n))
-
-    def parent(n: int) -> int:
-        """Find the parent of n. Compress the path."""
-        while n != parents[n]:
-            # Compress the set by halving.
-            n, parents[n] = parents[n], parents[parents[n]]
-        return n
-
+    d = Disjoint(n)
     emails = {}
     for i, a in enumerate(accounts):
         for e in a[1:]:
-            parents[i] = i = parent(emails.setdefault(e, i))  # noqa: PLW2901
+            d.union(i, emails.setdefault(e, i))
 
     merged = [[] for _ in range(n)]
     for e, i in emails.items():
-        merged[parent(i)].append(e)
+        merged[d.find(i)].append(e)
     any(map(list.sort, merged))
     return sorted([accounts[i][0], *m] for i, m in enumerate(merged) if m)
 
+
+def merge_email_account_files(
+    src: str | PathLike,
+    dst: str | PathLike,
+    sep: str = ",",
+    chunk: int = 1 << 20,
+) -> int:
+    """Merge the email accounts from file `src` into file `dst` in bounded memory.
+
+    Each line is an account: `name<sep>email<sep>email...`, like in
+    `merge_email_accounts`. The merged accounts are written in the same format
+    and order. Return the number of merged accounts.
+
+    The fields must not contain tabs. At most `chunk` lines are sorted in memory.
+    """
+    # Instead of a hash map of emails, `email, account, name` records
+    # are sorted externally, so that all accounts of an email are adjacent.
+    # Only the disjoint set of the account indexes is kept in memory.
+    accounts = 0
+
+    def records() -> Iterator[str]:
+        nonlocal accounts
+        with Path(src).open() as f:
+            for line in f:
+                name, *emails = line.rstrip("\n").split(sep)
+                yield from (f"{e}\t{accounts}\t{name}" for e in emails)
+                accounts += 1
+
+    split = lambda r: r.split("\t", 2)
+    email = lambda r: split(r)[0]
+    with tempfile.TemporaryDirectory() as tmp:
+        by_email = external_sort(records(), email, chunk, tmp)
+        # The first record is available only after all the input was read.
+        first = next(by_email, None)
+        d = Disjoint(accounts)
+        # Union the accounts sharing an email and save the sorted records.
+        path = Path(tmp) / "emails"
+        with path.open("w") as f:
+            for _, group in groupby(chain([first] if first else [], by_email), email):
+                i = int(split(r := next(group))[1])
+                f.write(f"{r}\n")
+                for r in group:
+                    d.union(i, int(split(r)[1]))
+                    f.write(f"{r}\n")
+
+        # Group the unique emails by the root account and name them after the root.
+        def by_root() -> Iterator[str]:
+            with path.open() as f:
+                for r in f:
+                    e, i, name = split(r.rstrip("\n"))
+                    root = d.find(int(i))
+                    yield f"{root}\t{e}\t{name if root == int(i) else ''}"
+
+        root_key = lambda r: (int((p := split(r))[0]), p[1])
+        roots = external_sort(by_root(), root_key, chunk, tmp)
+        merged = (
+            sep.join([max(p[2] for p in ps), *dict.fromkeys(p[1] for p in ps)])
+            for ps in (
+                list(map(split, group))
+                for _, group in groupby(roots, lambda r: split(r)[0])
+            )
+        )
+        count = 0
+        with Path(dst).open("w") as f:
+            for line in external_sort(merged, lambda line: line.split(sep), chunk, tmp):
+                f.write(f"{line}\n")
+                count += 1
+    return count
+
+
 def crazy_chemist_mix(mixes: list, explosive: list) -> list:
     """Mix compounds from the `mixes` list. Avoid mixing `explosive` combinations.
 
@@ -184,23 +441,14 @@ def crazy_chemist_mix(mixes: list, explosive: list) -> list:
 
     """
     n = max(max(a, b) for a, b in chain(mixes, explosive)) + 1
-    parents = list(range(n))
-    size = [1] * n
-
-    def parent(x: int) -> int:
-        """Find the parent of `x`. Compress the path."""
-        while x != parents[x]:
-            # Compress the set by halving.
-            x, parents[x] = parents[x], parents[parents[x]]
-        return x
-
+    d = Disjoint(n)
     emap = [set() for _ in range(n)]
     for x, y in explosive:
         emap[x].add(y)
         emap[y].add(x)
     safety = []
     for a, b in mixes:
-        a, b = parent(a), parent(b)  # noqa: PLW2901
+        a, b = d.find(a), d.find(b)  # noqa: PLW2901
         if a == b:
             safety.append(1)
             continue
@@ -209,10 +457,7 @@ def crazy_chemist_mix(mixes: list, explosive: list) -> list:
             safety.append(0)
             continue
         safety.append(1)
-        if size[a] < size[b]:
-            a, b = b, a  # noqa: PLW2901
-        parents[b] = a
-        size[a] += size[b]
+        d.union(a, b)
         if emap[a] or emap[b]:
-            emap[a] = emap[b] = set(map(parent, chain(emap[a], emap[b])))
+            emap[a] = emap[b] = set(map(d.find, chain(emap[a], emap[b])))
     return safety
@@ -2,6 +2,16 @@
 
 from __future__ import annotations
 
+import tempfile
+from contextlib import ExitStack
+from heapq import merge as merge_sorted
+from itertools import count, islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
 
 def selection(a: list[int]) -> None:
     """Sort array `a` using selection sort."""
@@ -160,3 +170,53 @@ def merge_rec(a: list[int], start: int = 0, stop: int | None = None) -> None:
             a[k:stop] = c[i:m] if i < m else c[j:stop]
 
     sort(a, start, stop or len(a), a[:])
+
+
+def _merge_runs(runs: list[Path], key: Callable | None) -> Iterator[str]:
+    """Generate the lines of the sorted run files `runs` merged by `key`."""
+    with ExitStack() as stack:
+        files = [stack.enter_context(p.open()) for p in runs]
+        yield from merge_sorted(*((line[:-1] for line in f) for f in files), key=key)
+
+
+def external_sort(
+    lines: Iterable[str],
+    key: Callable[[str], Any] | None = None,
+    chunk: int = 1 << 20,
+    tmpdir: str | None = None,
+    fan_in: int = 64,
+) -> Iterator[str]:
+    """Generate the `lines` sorted by `key`, keeping at most `chunk` lines in memory.
+
+    The lines must not contain line breaks. Sorted runs of `chunk` lines are
+    written to temporary files, which are merged lazily and removed at the end.
+    At most `fan_in` files are open at once: more runs are merged in passes.
+    The sort is stable.
+    """
+    if fan_in < 2:
+        msg = f"fan_in must be at least 2, got {fan_in}"
+        raise ValueError(msg)
+    # Each pass merges groups of `fan_in` consecutive runs into one run.
+    # Ties keep the order of the runs, so the passes keep the sort stable.
+    with tempfile.TemporaryDirectory(dir=tmpdir) as d:
+        names = count()
+
+        def write(run: Iterable[str]) -> Path:
+            path = Path(d) / f"{next(names)}.run"
+            with path.open("w") as f:
+                f.writelines(f"{line}\n" for line in run)
+            return path
+
+        runs = []
+        it = iter(lines)
+        while run := list(islice(it, chunk)):
+            run.sort(key=key)
+            runs.append(write(run))
+        while len(runs) > fan_in:
+            merged = []
+            for i in range(0, len(runs), fan_in):
+                merged.append(write(_merge_runs(runs[i : i + fan_in], key)))
+                for p in runs[i : i + fan_in]:
+                    p.unlink()
+            runs = merged
+        yield from _merge_runs(runs, key)
@@ -4,11 +4,18 @@ from __future__ import annotations
 
 from collections import Counter
 from functools import lru_cache, reduce
-from itertools import accumulate, combinations, islice, product
-from typing import Iterator, Sequence
-
+from itertools import accumulate, chain, combinations, islice
+from math import factorial, prod
+from string import ascii_lowercase, ascii_uppercase, digits
+from typing import Iterable, Iterator, Sequence
+
+import combinatorics
+import topological
+from dynamic_programming import interval_fill
+from functional import memoize
 from future import pairwise
-from graphs import topological_order
+from patterns import compile_pattern, prefix_function, suffix_prefix_overlap
+from search import lower_int, upper_int
 
 
 def splint(s: str) -> list[int]:
@@ -98,7 +105,7 @@ class StringView(Sequence):
         return (
             isinstance(other, StringView)
             and len(self) == len(other)
-            and all(a == b for a, b in zip(self, other))
+            and all(a == b for a, b in zip(self, other, strict=True))
         )
 
     def __str__(self) -> str:
@@ -132,7 +139,7 @@ def isomorphic(a: str, b: str) -> bool:
     ab, ba = {}, {}
     return len(a) == len(b) and all(
         cb == ab.setdefault(ca, cb) and ca == ba.setdefault(cb, ca)
-        for ca, cb in zip(a, b)
+        for ca, cb in zip(a, b, strict=True)
     )
 
 
@@ -188,19 +195,20 @@ def edit_distance(s: str, t: str) -> int:
 
     # The `dp` matrix is |s|x|t| in size.
     # The execution takes O(|s|*|t|) steps.
+    # `dist(i, j)` is the distance between prefixes `s[:i]` and `t[:j]`.
     @lru_cache(None)
     def dist(i: int, j: int) -> int:
         return (
             min(
                 dist(i - 1, j) + 1,
                 dist(i, j - 1) + 1,
-                dist(i - 1, j - 1) + int(s[i] != t[j]),
+                dist(i - 1, j - 1) + int(s[i - 1] != t[j - 1]),
             )
-            if min(i, j) >= 0
-            else abs(i - j)
+            if i and j
+            else i + j
         )
 
-    return dist(len(s) - 1, len(t) - 1)
+    return dist(len(s), len(t))
 
 
 def word_break(s: str, d: list[str]) -> bool:
@@ -209,13 +217,15 @@ def word_break(s: str, d: list[str]) -> bool:
     ds.add("")
     mx = max(map(len, ds))
 
+    # `rec(i)` is True, if the suffix `s[i:]` can be broken into words.
     @lru_cache(None)
-    def rec(sub: str) -> bool:
-        return sub in ds or any(
-            sub[:i] in ds and rec(sub[i:]) for i in range(min(mx, len(sub)), 0, -1)
+    def rec(i: int) -> bool:
+        return s[i:] in ds or any(
+            s[i : i + k] in ds and rec(i + k)
+            for k in range(min(mx, len(s) - i), 0, -1)
         )
 
-    return rec(s)
+    return rec(0)
 
 
 def word_parts(d: list[str], s: str) -> list[str]:
@@ -268,95 +278,208 @@ def longest_palindrome_substring_lengths(s: str) -> list[int]:
     return lps
 
 
+class PalindromeIndex:
+    """Palindrome queries on a string `s`, precomputed once in O(N).
+
+    The index keeps the Manacher's array of palindrome lengths for each
+    of the `2N` centers in `s`. A substring `s[i:j]` is centered at `i + j`.
+    """
+
+    def __init__(self, s: str) -> None:
+        """Build the index for string `s`."""
+        self.s = s
+        self.lps = longest_palindrome_substring_lengths(s)
+        # Sparse tables for range maximum queries over even and odd centers.
+        # Built on the first range query.
+        self._tables: list[list[list[int]]] | None = None
+
+    def __len__(self) -> int:
+        """Return the length of the indexed string."""
+        return len(self.s)
+
+    def is_palindrome(self, i: int, j: int) -> bool:
+        """Return True if `s[i:j]` is a palindrome. Runs in O(1)."""
+        return j - i <= 1 or self.lps[i + j] >= j - i
+
+    def count(self) -> int:
+        """Return the count of all (not distinct) palindrome substrings."""
+        return sum((n + 1) // 2 for n in self.lps)
+
+    def longest_prefix(self) -> int:
+        """Return the length of the longest palindromic prefix of `s`."""
+        return next((j for j in range(len(self.s), 0, -1) if self.lps[j] >= j), 0)
+
+    def _max(self, parity: int, lo: int, hi: int) -> int:
+        """Return max of `lps` over centers of `parity` in `[lo, hi]`."""
+        if self._tables is None:
+            self._tables = []
+            for p in (0, 1):
+                level = self.lps[p::2]
+                table = [level]
+                k = 1
+                while 2 * k <= len(table[0]):
+                    level = [max(a, b) for a, b in zip(level, level[k:], strict=False)]
+                    table.append(level)
+                    k *= 2
+                self._tables.append(table)
+        # Map centers to positions in the `parity` subsequence.
+        table = self._tables[parity]
+        a, b = (lo - parity + 1) // 2, min((hi - parity) // 2, len(table[0]) - 1)
+        if a > b:
+            return -1
+        k = (b - a + 1).bit_length() - 1
+        return max(table[k][a], table[k][b - (1 << k) + 1])
+
+    def longest(self, i: int = 0, j: int | None = None) -> tuple[int, int]:
+        """Return `(start, stop)` of the longest palindrome within `s[i:j]`.
+
+        The left-most center is chosen among palindromes of equal length.
+        Runs in O(log(N)^2) after an O(N*log(N)) preprocessing.
+        """
+        j = len(self.s) if j is None else j
+        if j <= i:
+            return i, i
+        # A palindrome of length `n` centered at `c` fits into `s[i:j]`,
+        # if `2*i + n <= c <= 2*j - n`. Palindromes of length `n` contain
+        # palindromes of length `n - 2`, so we can search for the maximum `n`.
+        best = (0, 2 * i)  # length, center
+        for parity in (1, 0):
+            fits = lambda n: self._max(parity, 2 * i + n, 2 * j - n) >= n
+            n = 2 * upper_int(lambda k: fits(2 * k + parity), 0, (j - i) // 2, 0)
+            n += parity
+            if n > best[0] or n == best[0] and n:
+                # Find the left-most center for the length `n`.
+                lo = 2 * i + n
+                c = lower_int(lambda c: self._max(parity, lo, c) >= n, lo, 2 * j - n)
+                if n > best[0] or c < best[1]:
+                    best = (n, c)
+        n, c = best
+        return (c - n) // 2, (c + n) // 2
+
+    def min_cuts(self) -> int:
+        """Return the minimum number of cuts to partition `s` into palindromes."""
+        # Runs in O(N + P) time and O(N) space, for P palindrome substrings.
+        # `parts[j]` is the min number of palindromes making up `s[:j]`.
+        # Centers are visited left to right. All palindromes ending
+        # at `i` have centers below `2*i`, so `parts[i]` is final when
+        # a palindrome `s[i:j]` is visited at the center `i + j > 2*i`.
+        n = len(self.s)
+        parts = list(range(n + 1))
+        for c, size in enumerate(self.lps):
+            for k in range(2 - c % 2, size + 1, 2):
+                i, j = (c - k) // 2, (c + k) // 2
+                parts[j] = min(parts[j], parts[i] + 1)
+        return max(parts[n] - 1, 0)
+
+
 def longest_palindrome(s: str) -> str:
     """Return longest palindrome substring from `s`."""
-    if s == "":
-        return ""
-    lps = longest_palindrome_substring_lengths(s)
-    i = max(range(len(lps)), key=lambda i: lps[i])
-    l = lps[i]
-    return s[(i - l) // 2 : (i + l) // 2]
+    i, j = PalindromeIndex(s).longest()
+    return s[i:j]
 
 
 def longest_palindrome_length(s: str) -> int:
     """Return the size of the longest palindrome in `s`."""
-    if len(s) <= 1:
-        return len(s)
-    return max(longest_palindrome_substring_lengths(s))
+    return max(longest_palindrome_substring_lengths(s), default=0)
 
 
 def count_of_palindrome_substrings(s: str) -> int:
     """Return the count of all palindrome substrings in `s`."""
-    if len(s) <= 1:
-        return len(s)
-    return sum((l + 1) // 2 for l in longest_palindrome_substring_lengths(s))
+    return PalindromeIndex(s).count()
 
 
-def distinct_palindrome_substrings(s: str) -> int:
-    """Return the count of distinct palindromes within `s`."""
-    # Uses Manacher's algorithm.
-    # Runs in O(N).
-    n = len(s)
-    if n <= 3:
+class Eertree:
+    """Palindromic tree (eertree) of a string, which can be extended online.
+
+    Each node is a distinct palindrome. Nodes are stored in parallel arrays:
+    the palindrome length, the suffix link to the longest palindromic suffix,
+    the end position of the first occurrence, and the count of occurrences
+    as the longest palindromic suffix. Node 0 is the imaginary root of
+    length -1, node 1 is the empty palindrome. Runs in O(N) time and space.
+    """
+
+    def __init__(self, s: Iterable[str] = "") -> None:
+        """Build the tree for the characters from `s`."""
+        self.s: list[str] = []
+        self.length = [-1, 0]
+        self.link = [0, 0]
+        self.end = [-1, -1]
+        self.count = [0, 0]
+        self.edges: dict[tuple[int, str], int] = {}  # (node, char) => node
+        self.last = 1  # node of the longest palindromic suffix
+        self.extend(s)
+
+    def __len__(self) -> int:
+        """Return the count of distinct (non-empty) palindromes."""
+        return len(self.length) - 2
+
+    def _suffix(self, n: int, c: str) -> int:
+        """Return the longest palindromic suffix `x` of node `n` with `c + x + c`."""
+        s, i, length, link = self.s, len(self.s) - 1, self.length, self.link
+        while i - 1 - length[n] < 0 or s[i - 1 - length[n]] != c:
+            n = link[n]
         return n
-    pals = set()
-    lps = [StringView("", 0, 0, h=0)] * n * 2
-    lps[1] = StringView(s, 0, 1)  # View of the first palindrome
-    c = 1  # center of the outer palindrome (in s*2)
-    r = 2  # right border of the outer palindrome (in s*2)
-    for i in range(2, n * 2):
-        if i < r:
-            # Use the mirror length if `i` is between `c` and `r`.
-            v = lps[2 * c - i]
-            l = min(len(v), r - i)
-            # Reuse previous hash.
-            h = hash(v) if l == len(v) else None
-        else:
-            l, h = 0, None
 
-        v = StringView(s, (i - l) // 2, (i + l + 1) // 2, h=h)
-        while v.expandable() and s[v.start - 1] == s[v.stop]:
-            v = v.expand()
-            pals.add(v)
-        # Store the value.
-        lps[i] = v
-        # If the current palindrome expanded beyond the
-        # previous one, replace the old by this one.
-        if i + len(v) > r:
-            c = i
-            r = i + len(v)
-    return len(pals) + len(set(iter(s)))
+    def append(self, c: str) -> bool:
+        """Append a character. Return True if a new palindrome was found."""
+        self.s.append(c)
+        p = self._suffix(self.last, c)
+        n = self.edges.get((p, c))
+        if n is not None:
+            self.count[n] += 1
+            self.last = n
+            return False
+        n = self.last = len(self.length)
+        self.length.append(self.length[p] + 2)
+        self.link.append(self.edges[self._suffix(self.link[p], c), c] if p else 1)
+        self.end.append(len(self.s) - 1)
+        self.count.append(1)
+        self.edges[p, c] = n
+        return True
+
+    def extend(self, s: Iterable[str]) -> int:
+        """Append characters from `s`. Return the count of new palindromes."""
+        return sum(map(self.append, s))
+
+    def palindrome(self, n: int) -> str:
+        """Return the palindrome for node `n`."""
+        e = self.end[n]
+        return "".join(self.s[e - self.length[n] + 1 : e + 1])
+
+    def occurrences(self) -> dict[str, int]:
+        """Return the count of occurrences for each distinct palindrome."""
+        # Each occurrence of a palindrome is an occurrence of its suffixes.
+        # Links point to older nodes, so we push the counts in reverse order.
+        count = self.count[:]
+        for n in reversed(range(2, len(count))):
+            count[self.link[n]] += count[n]
+        return {self.palindrome(n): count[n] for n in range(2, len(count))}
+
+
+def distinct_palindrome_substrings(s: str) -> int:
+    """Return the count of distinct palindromes within `s`."""
+    # Uses the palindromic tree. Runs in O(N).
+    return len(Eertree(s))
 
 
 def subsequence_count(s: str, t: str) -> int:
     """Return number of times `t` shows in `s` as a loose subsequence."""
 
+    # `sub(i, j)` counts the occurrences of `t[:j]` in `s[:i]`.
     @lru_cache(None)
     def sub(i: int, j: int) -> int:
         return (
-            sub(i - 1, j) + int(s[i] == t[j] and sub(i - 1, j - 1))
-            if i >= 0 and j >= 0
-            else int(j < 0)
+            sub(i - 1, j) + int(s[i - 1] == t[j - 1] and sub(i - 1, j - 1))
+            if i and j
+            else int(not j)
         )
 
-    return sub(len(s) - 1, len(t) - 1)
+    return sub(len(s), len(t))
 
 
 def palindromic_partitions(s: str) -> int:
     """Return the minimum number of cuts to partition `s` into palindromes."""
-
-    @lru_cache(None)
-    def isp(i: int, j: int) -> int:
-        return i >= j or s[i] == s[j] and isp(i + 1, j - 1)
-
-    n = len(s)
-    dp = [0] * n
-    for j in range(n):
-        dp[j] = int(isp(0, j)) or reduce(
-            min, (dp[k] + 1 for k in range(1, j) if isp(k + 1, j)), j + 1
-        )
-
-    return (int(n == 0) or dp[n - 1]) - 1
+    return PalindromeIndex(s).min_cuts()
 
 
 def smallest_window_with_all_characters(s: str, p: str) -> str | None:
@@ -395,51 +518,45 @@ def boolean_parentheses(s: str) -> int:
     """
     op = {"&": [1, 0], "|": [1, 1], "^": [0, 1]}
 
-    @lru_cache(None)
-    def sub(i: int, j: int) -> tuple[int, int]:
+    # `dp[i][j]` counts the true and false results for the literals `i` to `j-1`.
+    # The operator splitting literals `k-1` and `k` is at `s[2*k-1]`.
+    def cell(dp: list[list], i: int, j: int) -> tuple[int, int]:
         if i == j - 1:
-            return int(s[i] == "T"), int(s[i] == "F")
+            return int(s[2 * i] == "T"), int(s[2 * i] == "F")
         t, f = 0, 0
-        for k in range(i + 1, j - 1, 2):
-            t1, f1 = sub(i, k)
-            t2, f2 = sub(k + 1, j)
+        for k in range(i + 1, j):
+            t1, f1 = dp[i][k]
+            t2, f2 = dp[k][j]
             xor = t1 * f2 + f1 * t2
-            m = op[s[k]]
+            m = op[s[2 * k - 1]]
             t += m[0] * t1 * t2 + m[1] * xor
             f += (1 - m[0]) * t1 * t2 + (1 - m[1]) * xor + f1 * f2
         return t, f
 
-    return sub(0, len(s))[0]
+    n = (len(s) + 1) // 2
+    return interval_fill(n, cell)[0][n][0] if n else 0
 
 
 def alien_alphabet(words: list[str]) -> str:
-    """For a sorted list of `words` return the alien alphabet used to sort it."""
-    chars = set(words[0])
-    edges = {}
+    """For a sorted list of `words` return the alien alphabet used to sort it.
+
+    Raise `topological.CycleError` if the `words` are not sorted consistently.
+    """
+    chars = sorted(set(chain.from_iterable(words)))
+    edges: dict[str, set[str]] = {}
     for a, b in pairwise(words):
-        chars.update(b)
         ca, cb = next((ab for ab in zip(a, b) if ab[0] != ab[1]), (None, None))
         if ca and cb:
             s = edges.get(ca) or edges.setdefault(ca, set())
             s.add(cb)
-    return "".join(topological_order(chars, edges))
+    return "".join(topological.order(chars, edges))
 
 
 def fix_palindrome(s: str) -> int:
     """Return number of characters to be added to make a string a palindrome."""
-
-    @lru_cache(None)
-    def count(i: int, j: int) -> int:
-        return int(
-            i < j
-            and (
-                count(i + 1, j - 1)
-                if s[i] == s[j]
-                else min(count(i + 1, j), count(i, j - 1)) + 1
-            )
-        )
-
-    return count(0, len(s) - 1)
+    # Characters not in the longest palindromic subsequence need a mirror copy.
+    # That subsequence is the LCS of `s` and its reverse.
+    return len(s) - longest_common_subsequence_length(s, s[::-1])
 
 
 def artistic_photo_count(s: str, x: int, y: int) -> int:
@@ -480,48 +597,15 @@ def distinct_subsequence_count(s: str) -> int:
 
 def permutations(string: str) -> list:
     """Return a sorted list of permutations of `string`."""
-    sols = []
-    n = len(string)
-    s = list(string)
-
-    def rec(i: int) -> None:
-        if i >= n:
-            sols.append("".join(s))
-            return
-        rec(i + 1)
-        for j in range(i + 1, n):
-            s[j], s[i] = s[i], s[j]
-            rec(i + 1)
-            s[j], s[i] = s[i], s[j]
-
-    rec(0)
-    return sorted(sols)
+    # Each distinct permutation repeats once per reordering of equal chars.
+    k = prod(map(factorial, Counter(string).values()))
+    return ["".join(p) for p in combinatorics.permutations(string) for _ in range(k)]
 
 
 def pattern_match(pattern: str, string: str) -> bool:
     """Match `pattern` containing `*` and `?` to `string`."""
-    pl = len(pattern)
-    sl = len(string)
-
-    p = s = bp = bs = 0
-
-    skip_stars = lambda: next((i for i in range(p, pl) if pattern[i] != "*"), pl)
-
-    while s < sl:
-        if p < pl and pattern[p] in ("?", string[s]):
-            p += 1
-            s += 1
-        elif p < pl and pattern[p] == "*":
-            bp = p = skip_stars()
-            bs = s
-        elif bp:
-            # backtrack
-            p = bp
-            s = bs = bs + 1
-        else:
-            return False
-
-    return skip_stars() == pl
+    # The pattern is compiled once into a cached automaton.
+    return compile_pattern(pattern).match(string)
 
 
 def longest_repeating_substring(s: str) -> str:
@@ -545,48 +629,15 @@ def longest_repeating_substring(s: str) -> str:
 def longest_prefix_suffix_length(p: str) -> int:
     """Return the length of the longest proper prefix that is also a suffix."""
     # Uses KMP (Knuth Morris Pratt) algorithm. Runs in O(N).
-    pi = [0] * len(p)  # the computed PI table
-    k = 0  # length of the prefix
-    # `k`` increases with every matched letter, but resets after a mismatch.
-    # The length that `k` resets is based on the precomputed `pi` table so far.
-    # It resets to 0, or resets to longest `k` so that `p[:k+1] == p[q-k:q+1]`.
-    for q in range(1, len(p)):
-        # find p[:k] where p[k] == p[q]
-        while p[k] != p[q]:
-            if k == 0:
-                break
-            # pi[k - 1] = j, where p[:j] == p[k - j:k]
-            # resets to length of the self matched prefix-suffix at `k-1`.
-            k = pi[k - 1]
-        else:
-            # p[:k + 1] == p[q - k:q + 1]
-            # We have already matched `k-1` plus one character.
-            # pi[q] is the length of prefix p[:k] that matched p[q-k:q]
-            pi[q] = k = k + 1
-    return pi[-1]
+    # The last value of the prefix function is the answer for the whole `p`.
+    return prefix_function(p)[-1] if p else 0
 
 
 def extra_palindrome_chars(s: str) -> int:
     """Return number of new chars upfront necessary to make `s` a palindrome."""
-    # Uses KMP (Knuth Morris Pratt) algorithm  to determine the length
-    # of the length of the longest prefix of `s` equal to a suffix of
-    # the reverse of `s`.
-    n = len(s)
-    r = s[::-1]
-    # `pi[q]` is the length of a suffix of:
-    #    "#" + `r[:q]`
-    # matching a prefix of `s[:k]`
-    pi = [0] * (n + 1)
-    k = 0
-    for q in range(n):
-        while s[k] != r[q]:
-            if k == 0:
-                break
-            k = pi[k - 1]
-        else:
-            # Using `q+1` to account for the (missing) `#` char.
-            pi[q + 1] = k = k + 1
-    return n - pi[-1]
+    # The longest palindromic prefix stays, the rest is mirrored upfront.
+    # It is the longest prefix of `s` which is a suffix of the reversed `s`.
+    return len(s) - suffix_prefix_overlap(s[::-1], s)
 
 
 def word_wrap(words: list[int], k: int) -> int:
@@ -630,80 +681,121 @@ def sum_string(s: str) -> bool:
     )
 
 
-def k_alphabet_string_with_all_substrings(n: int, k: int) -> str:
-    """Return a string containing all substrings of length `n` from the `k` alphabet."""
-    # The k-alphabet is restricted to: "0123456789"[:k]
-    # The idea presented here is to greedily add digits to the string,
-    # while keeping track of visited substrings so far.
+ALPHANUMERIC = digits + ascii_lowercase + ascii_uppercase
+
+
+def k_alphabet_string_with_all_substrings(
+    n: int, k: int, alphabet: str = ALPHANUMERIC
+) -> str:
+    """Return a string containing all substrings of length `n` from the `k` alphabet.
+
+    The k-alphabet is: `alphabet[:k]`, which must consist of ASCII characters.
+    """
+    # The shortest such string is a de Bruijn sequence, unrolled by `n - 1` symbols.
     if k <= 0 or n <= 0:
         return ""
-    if k == 1:
-        return "0" * n
-
-    # The alphabet.
-    # The trick here is to start with 1 and end with 0,
-    # otherwise the while loop may not be able to terminate.
-    digits = "0123456789"[1:k] + "0"
-    if n == 1:
-        return digits
-    # The output string is initialized with the base substring.
-    o = "0" * n
-    # The base substring is marked as visited.
-    v = {o}
-    end = k**n  # count of all possible substrings.
-    while len(v) < end:
-        p = o[1 - n :]  # last n - 1 digits in the output string.
-        for d in digits:
-            s = p + d  # add the nth digit
-            if s not in v:
-                v.add(s)
-                o += d
-                break
-        # else: The for loop may not add any new digit for a choice of
-        # the alphabet or the initialization string.
-    return o
+    return combinatorics.de_bruijn_bytes(k, n, alphabet.encode("ascii")).decode("ascii")
+
+
+def _lcs_masks(a: Sequence) -> dict:
+    """Return a bit mask of positions in `a` for each character in `a`."""
+    masks = {}
+    for i, c in enumerate(a):
+        masks[c] = masks.get(c, 0) | 1 << i
+    return masks
+
+
+def _lcs_bits(a: Sequence, b: Sequence) -> int:
+    """Return the bit-parallel LCS vector for `b` run against the characters of `a`."""
+    # Allison-Dix/Hyyro bit-vector algorithm. The bits are the columns of the
+    # LCS matrix for `b`. A zero bit at position `j` marks an increase
+    # of the LCS length between the prefixes `b[:j]` and `b[:j+1]`.
+    # Python ints act as arbitrarily wide machine words, so each row
+    # of the quadratic matrix takes only a few big-int operations.
+    masks = _lcs_masks(b)
+    full = (1 << len(b)) - 1
+    v = full
+    for c in a:
+        u = v & masks.get(c, 0)
+        v = ((v + u) | (v - u)) & full
+    return v
+
+
+def _lcs_row(a: Sequence, b: Sequence) -> list[int]:
+    """Return the LCS lengths of `a` against each prefix `b[:j]`."""
+    bits = format(_lcs_bits(a, b), f"0{len(b)}b")[::-1] if b else ""
+    return list(accumulate((c == "0" for c in bits), initial=0))
 
 
 def longest_common_subsequence_length(a: str, b: str) -> int:
     """Return the length of the longest common, non-continuous, subsequence."""
-    ll = [[0, 0] for _ in range(len(a) + 1)]
-    for j, i in product(range(len(b)), range(len(a))):
-        ll[i + 1][1 - j & 1] = (
-            1 + ll[i][j & 1]
-            if a[i] == b[j]
-            else max(ll[i + 1][j & 1], ll[i][1 - j & 1])
-        )
-    return max(ll[-1])
+    # Runs in O(N*M/W) using big-int words of width W. Bits span the longer string.
+    if len(a) > len(b):
+        a, b = b, a
+    return len(b) - _lcs_bits(a, b).bit_count()
+
+
+def longest_common_subsequence(a: str, b: str) -> str:
+    """Return one longest common subsequence of `a` and `b`."""
+    # Hirschberg's divide and conquer in O(N+M) space.
+    # The split of `a` in the middle is matched to the split of `b`
+    # that maximizes the sum of the forward and backward LCS rows.
+    if not a or not b:
+        return ""
+    if len(a) == 1:
+        return a if a in b else ""
+    mid = len(a) // 2
+    fwd = _lcs_row(a[:mid], b)
+    bwd = _lcs_row(a[mid:][::-1], b[::-1])
+    m = len(b)
+    k = max(range(m + 1), key=lambda k: fwd[k] + bwd[m - k])
+    return longest_common_subsequence(a[:mid], b[:k]) + longest_common_subsequence(
+        a[mid:], b[k:]
+    )
+
+
+def longest_common_subsequences(a: str, b: str) -> Iterator[str]:
+    """Yield all distinct longest common subsequences in sorted order."""
+    # Only the suffix LCS lengths are stored; the subsequences are
+    # generated one at a time by a depth first search. Picking the earliest
+    # occurrence of each character in both suffixes keeps them distinct.
+    n, m = len(a), len(b)
+    ll = [[0] * (m + 1) for _ in range(n + 1)]
+    for i in reversed(range(n)):
+        li, ln = ll[i], ll[i + 1]
+        for j in reversed(range(m)):
+            li[j] = ln[j + 1] + 1 if a[i] == b[j] else max(ln[j], li[j + 1])
+
+    def nexts(s: str) -> list[dict]:
+        """Return the index of the next occurrence of each character."""
+        nx = [{}] * (len(s) + 1)
+        for i in reversed(range(len(s))):
+            nx[i] = {**nx[i + 1], s[i]: i}
+        return nx
+
+    na, nb = nexts(a), nexts(b)
+    chars = sorted(set(a) & set(b))
+    # Each stack entry is: prefix, position in `a`, position in `b`.
+    stack = [("", 0, 0)]
+    while stack:
+        p, i, j = stack.pop()
+        rest = ll[i][j]
+        if not rest:
+            yield p
+            continue
+        # Push in reversed order to pop the smallest character first.
+        for c in reversed(chars):
+            x, y = na[i].get(c), nb[j].get(c)
+            if x is not None and y is not None and ll[x + 1][y + 1] == rest - 1:
+                stack.append((p + c, x + 1, y + 1))
 
 
 def all_longest_common_subsequences(a: str, b: str) -> list:
     """Return a sorted list of all common, longest subsequences."""
-    # This is much faster than determining the LCS length,
-    # and then using a backtracking approach.
-    # O(N^4) - worst case.  O(N^3) - average
-
-    def maxlen(x: set, y: set) -> set:
-        """Return set with longer elements or the union of both."""
-        # O(N) - there are at most N subsequences of a given length.
-        lx, ly = len(next(iter(x))), len(next(iter(y)))
-        return x if lx > ly else y if lx < ly else x | y
-
-    # Only two columns are necessary.
-    ll = [[{""}, {""}] for _ in range(len(a) + 1)]
-    # O(N^2)
-    for j, i in product(range(len(b)), range(len(a))):
-        if a[i] == b[j]:
-            # Extend the set from `ll[i][j]` to `ll[i+1][j+1]`
-            # O(N^2)
-            ll[i + 1][j & 1] = {x + a[i] for x in ll[i][~j & 1]}
-        else:
-            # Choose between the two sets `ll[i][j+1]` and `ll[i+1][j]`
-            ll[i + 1][j & 1] = maxlen(ll[i][j & 1], ll[i + 1][~j & 1])
-
-    return sorted(maxlen(*ll[-1]))
+    return list(longest_common_subsequences(a, b))
 
 
-@lru_cache
+@memoize(maxsize=1 << 16)
 def scrambled(a: str, b: str) -> bool:
     """Return True if `a` is a scrambled version of `b`.
 
@@ -1,10 +1,18 @@
 """Test module for the combinatorics related puzzles."""
 
 import unittest
+from functools import partial
+from itertools import combinations, permutations
+
+import pytest
 
 import combinatorics as c
 
 
+def _is_sorted_desc(p: tuple) -> bool:
+    return list(p) == sorted(p, reverse=True)
+
+
 class TestMatrixPuzzles(unittest.TestCase):
     """Test class for the matrix related puzzles."""
 
@@ -33,3 +41,62 @@ class TestMatrixPuzzles(unittest.TestCase):
         assert c.sum_of_456_numbers(1, 1, 1) == 3675
         assert c.sum_of_456_numbers(3, 2, 1) == 34431574
         assert c.sum_of_456_numbers(1, 2, 3) == 39345806
+
+    def test_permutations(self):
+        """Test `permutations`, `next_permutation` and the rank functions."""
+        assert list(c.permutations("")) == [()]
+        assert list(map("".join, c.permutations("aba"))) == ["aab", "aba", "baa"]
+        for x in ("abcd", "aabbc", "aaab"):
+            ref = sorted(set(permutations(x)))
+            assert list(c.permutations(x)) == ref
+            assert list(c.permutations(x, 3, 7)) == ref[3:7]
+            assert c.permutation_count(x) == len(ref)
+            assert [c.permutation_rank(p) for p in ref] == list(range(len(ref)))
+            assert [c.permutation_unrank(x, k) for k in range(len(ref))] == ref
+        a = [3, 2, 1]
+        assert not c.next_permutation(a)
+        assert a == [1, 2, 3]
+        assert c.permutation_unrank(range(20), 10**18) == (
+            (8, 4, 3, 10, 16, 7, 13, 6, 17, 9, 18, 12, 2, 5, 19, 1, 14, 15, 0, 11)
+        )
+        with pytest.raises(IndexError):
+            c.permutation_unrank("ab", 2)
+
+    def test_subsets(self):
+        """Test `subsets`, `next_subset` and the rank functions."""
+        ref = [x for k in range(5) for x in combinations(range(4), k)]
+        assert list(c.subsets(range(4))) == ref
+        assert list(c.subsets(range(4), 5, 9)) == ref[5:9]
+        assert [c.subset_rank(x, 4) for x in ref] == list(range(16))
+        assert [c.subset_unrank(4, k) for k in range(16)] == ref
+        x = [0, 1]
+        assert not c.next_subset(x, 2)
+        assert x == []
+        with pytest.raises(IndexError):
+            c.subset_unrank(2, 4)
+
+    def test_parallel_find_if(self):
+        """Test `chunks`, `map_chunks` and `parallel_find_if`."""
+        assert c.chunks(10, 3) == [range(4), range(4, 7), range(7, 10)]
+        assert c.chunks(2, 5) == [range(1), range(1, 2)]
+        space = partial(c.permutations, "abcdef")
+        assert list(c.map_chunks(list, space, 720, workers=1)) == [
+            list(space(start=r.start, stop=r.stop)) for r in c.chunks(720, 4)
+        ]
+        found = c.parallel_find_if(_is_sorted_desc, space, 720, workers=2)
+        assert found == tuple("fedcba")
+        assert c.parallel_find_if(callable, space, 720, workers=1) is None
+
+    def test_de_bruijn(self):
+        """Test `lyndon_words`, `de_bruijn` and `de_bruijn_bytes`."""
+        assert list(map(bytes, c.lyndon_words(2, 3))) == [
+            b"\0", b"\0\0\1", b"\0\1", b"\0\1\1", b"\1"
+        ]
+        assert b"".join(c.de_bruijn(2, 3)) == bytes([0, 0, 0, 1, 0, 1, 1, 1])
+        assert c.de_bruijn_bytes(1, 3) == b"\0\0\0"
+        assert c.de_bruijn_bytes(3, 2, b"xyz") == b"xxyxzyyzzx"
+        assert c.de_bruijn_bytes(0, 3) == b""
+        o = c.de_bruijn_bytes(256, 2)
+        assert len({bytes(o[i : i + 2]) for i in range(1 << 16)}) == 1 << 16
+        with pytest.raises(ValueError, match="alphabet too small"):
+            c.de_bruijn_bytes(3, 2, b"xy")
@@ -2,6 +2,8 @@
 
 import unittest
 
+import numpy as np
+
 import dynamic_programming as dp
 
 
@@ -30,3 +32,43 @@ class TestDP(unittest.TestCase):
         """Test `divide_number_into_groups`."""
         assert dp.divide_number_into_groups(4, 4) == 1
         assert dp.divide_number_into_groups(8, 4) == 5
+
+    def test_interval_fill(self):
+        """Test `interval_fill`."""
+        cell = lambda t, i, j: f"{i}{j}" if j - i == 1 else t[i][j - 1] + t[j - 1][j]
+        t = dp.interval_fill(3, cell)
+        assert t[0][3] == "011223"
+        assert t[1][3] == "1223"
+        assert t[0][0] is None
+        count = lambda t, i, j: sum(t[i][k] * t[k][j] for k in range(i + 1, j)) or 1
+        assert dp.interval_fill(10, count)[0][10] == 4862  # Catalan number
+
+    def test_interval_dp(self):
+        """Test `interval_dp`."""
+        a = [40, 20, 30, 10, 30]
+        cost = lambda i, k, j: np.take(a, i) * np.take(a, k) * np.take(a, j)
+        t, opt = dp.interval_dp(4, cost, argopt=True)
+        assert t[0, 4] == 26000
+        assert t[1, 3] == 6000
+        assert opt[0, 4] == 3
+        assert dp.interval_dp(4, cost, op="max")[0, 4] == 69000
+        b = np.array(a, dtype=object) * 10**5
+        big = lambda i, k, j: b[i] * b[k] * b[j]
+        assert dp.interval_dp(4, big, dtype=object)[0, 4] == 26000 * 10**15
+        assert dp.int_dtype(1 << 62) is np.int64
+        assert dp.int_dtype(1 << 63) is object
+        assert dp.interval_dp(0, cost).shape == (1, 1)
+        s = [0, 1, 3, 6, 10]
+        w = lambda i, _, j: np.take(s, j) - np.take(s, i)
+        knuth, opt = dp.interval_dp(4, w, knuth=True, argopt=True)
+        assert (knuth == dp.interval_dp(4, w)).all()
+        assert opt[0, 4] == 3
+
+    def test_merge_piles_cost(self):
+        """Test `merge_piles_cost`."""
+        assert dp.merge_piles_cost([]) == 0
+        assert dp.merge_piles_cost([5]) == 0
+        assert dp.merge_piles_cost([1, 2]) == 3
+        assert dp.merge_piles_cost([1, 2, 3, 4]) == 19
+        assert dp.merge_piles_cost([4, 1, 1, 4]) == 18
+        assert dp.merge_piles_cost([10**18] * 4) == 8 * 10**18
@@ -0,0 +1,55 @@
+"""Test module for the functional programming utilities."""
+
+import unittest
+
+import pytest
+
+import functional as f
+
+
+class TestFunctional(unittest.TestCase):
+    """Test class for the functional programming utilities."""
+
+    def test_memo(self):
+        """Test `Memo`."""
+        calls = []
+
+        @f.memoize(maxsize=2)
+        def square(x: int) -> int:
+            calls.append(x)
+            return x * x
+
+        assert square.__name__ == "square"
+        squares = [square(1), square(2), square(1), square(3), square(2)]
+        assert squares == [1, 4, 1, 9, 4]
+        # `2` was evicted as least recently used before it was called again.
+        assert calls == [1, 2, 3, 2]
+        assert square.cache_info() == f.MemoInfo(1, 4, 2, 2, 0)
+        square.cache_clear()
+        assert square.cache_info() == f.MemoInfo(0, 0, 0, 0, 0)
+
+    def test_memo_maxbytes(self):
+        """Test `Memo` bounded by bytes."""
+        m = f.Memo(lambda x: "x" * x, maxsize=None, maxbytes=1000)
+        for i in range(100):
+            m(i)
+        info = m.cache_info()
+        assert 0 < info.nbytes <= 1000
+        assert info.evictions == 100 - info.size
+        assert m(99) == "x" * 99
+
+    def test_dense_memo(self):
+        """Test `DenseMemo`."""
+
+        @f.memoize(shape=(10, 10))
+        def paths(i: int, j: int) -> int:
+            return paths(i - 1, j) + paths(i, j - 1) if i and j else 1
+
+        assert paths(9, 9) == 48620
+        assert paths.cache_info().misses == 99
+        assert paths(9, 9) == 48620
+        paths.cache_clear()
+        assert paths.cache_info() == f.MemoInfo(0, 0, 0, 0, 0)
+        for args in ((-1, 0), (0, 10), (10, 0), (1,), (1, 2, 3)):
+            with pytest.raises(IndexError):
+                paths(*args)
@@ -1,6 +1,11 @@
 """Test module for the graph based puzzles."""
 
+import math
+import tempfile
 import unittest
+from pathlib import Path
+
+import pytest
 
 import graphs as g
 
@@ -8,11 +13,112 @@ import graphs as g
 class TestGraphs(unittest.TestCase):
     """Test class for the graph based puzzles."""
 
+    def test_graph(self):
+        """Test the CSR `Graph`."""
+        adj = [[1, 2, 3], [], [4], [], []]
+        gr = g.Graph.from_adj(adj)
+        assert len(gr) == 5
+        assert gr.edge_count() == 4
+        assert list(map(list, gr)) == adj
+        assert list(gr.degrees()) == [3, 0, 1, 0, 0]
+        with pytest.raises(IndexError):
+            gr[5]
+        edges = [(2, 4), (0, 1), (0, 2), (0, 3)]
+        assert list(map(list, g.Graph.from_edges(edges))) == adj
+        assert list(map(list, g.Graph.from_edges([], 2))) == [[], []]
+        und = g.Graph.from_edges([(0, 1, 7), (1, 2, 8)], undirected=True)
+        assert list(map(list, und)) == [[1], [2, 0], [1]]
+        with tempfile.TemporaryDirectory() as d:
+            path = Path(d) / "edges.txt"
+            path.write_text("# source target\n0 1\n0 2\n0 3\n2 4\n")
+            assert list(map(list, g.Graph.from_file(path))) == adj
+            assert len(g.Graph.from_file(path, n=7)) == 7
+        assert g.breadth_first(gr) == [0, 1, 2, 3, 4]
+        assert g.depth_first(gr) == [0, 1, 2, 4, 3]
+        assert g.depth_first_r(gr) == [0, 1, 2, 4, 3]
+        assert list(g.topological_order(gr)) == [0, 3, 2, 4, 1]
+        assert list(g.topological_order(adj)) == [0, 3, 2, 4, 1]
+        with pytest.raises(g.CycleError) as e:
+            g.topological_order([[1], [2], [0, 3], []])
+        assert e.value.cycle == [0, 1, 2, 0]
+        with pytest.raises(g.CycleError):
+            g.topological_order("ab", {"a": "ba"})
+        und = g.Graph.from_adj([[1], [0, 4], [3, 4], [2, 4], [1, 2, 3]])
+        assert g.articulation_points(und) == [1, 4]
+        assert g.articulation_points_recursive(und) == [1, 4]
+        assert g.critical_connections(und) == [(0, 1), (1, 4)]
+        dg = g.Graph.from_adj([[2, 3], [0], [1], [4], []])
+        assert g.strongly_connected_components(dg) == [[0, 1, 2], [3], [4]]
+        assert g.strongly_connected_components_recursive(dg) == [[0, 1, 2], [3], [4]]
+
     def test_breadth_first(self):
         """Test `breadth_first` traversal."""
         adj = [[1, 2, 3], [], [4], [], []]
         assert [0, 1, 2, 3, 4] == g.breadth_first(adj)
 
+    def test_graph_file(self):
+        """Test `Graph.save`, `Graph.load`, and `convert_edge_list`."""
+        edges = [(0, 1, 0.5), (2, 0, 1.5), (0, 2, 2.5), (1, 2, 3.5)]
+        with tempfile.TemporaryDirectory() as d:
+            gr = g.Graph.from_edges(edges, undirected=True, weighted=True)
+            gr.save(Path(d) / "graph.bin")
+            mapped = g.Graph.load(Path(d) / "graph.bin")
+            assert list(map(list, mapped)) == [[1, 2, 2], [2, 0], [0, 0, 1]]
+            assert list(mapped.weights) == [0.5, 2.5, 1.5, 3.5, 0.5, 1.5, 2.5, 3.5]
+            text = Path(d) / "edges.txt"
+            lines = (" ".join(map(str, e)) for e in edges)
+            text.write_text("# source target weight\n" + "\n".join(lines))
+            for chunk in (1, 3, 100):
+                conv = g.convert_edge_list(
+                    text,
+                    Path(d) / "conv.bin",
+                    undirected=True,
+                    weighted=True,
+                    chunk=chunk,
+                )
+                assert list(conv.offsets) == list(mapped.offsets)
+                assert list(conv.targets) == list(mapped.targets)
+                assert list(conv.weights) == list(mapped.weights)
+            conv = g.convert_edge_list(text, Path(d) / "conv.bin", n=5)
+            assert conv.weights is None
+            assert list(map(list, conv)) == [[1, 2], [2], [0], [], []]
+            assert g.breadth_first(conv) == [0, 1, 2]
+            assert list(g.frontier_breadth_first(conv)[0]) == [0, 1, 1, -1, -1]
+            # Ids above 2**53 do not round through float64 weights.
+            big = 2**53 + 1
+            gr = g.Graph.from_edges([(0, big, 0.5)], 1, weighted=True)
+            assert list(gr.targets) == [big]
+            text.write_text(f"0 {big} 1.5\n")
+            gr = g.Graph.from_file(text, 1, weighted=True)
+            assert list(gr.targets) == [big]
+            assert list(gr.weights) == [1.5]
+            (Path(d) / "bad.bin").write_bytes(b"0" * 64)
+            with pytest.raises(ValueError, match="not a graph file"):
+                g.Graph.load(Path(d) / "bad.bin")
+
+    def test_weighted_shortest_path(self):
+        """Test `weighted_shortest_path`."""
+        edges = [(0, 1, 4), (1, 2, 1), (0, 2, 7), (2, 3, 1)]
+        gr = g.Graph.from_edges(edges, n=5, undirected=True, weighted=True)
+        assert g.weighted_shortest_path(gr, 0, 3) == (6, [0, 1, 2, 3])
+        expected = (6, [3, 2, 1, 0])
+        assert g.weighted_shortest_path(gr, 3, 0, bidirectional=True) == expected
+        assert g.weighted_shortest_path(gr, 0, 4) == (math.inf, [])
+        gr = g.Graph.from_edges(edges)
+        assert g.weighted_shortest_path(gr, 0, 3) == (2, [0, 2, 3])
+
+    def test_frontier_breadth_first(self):
+        """Test `frontier_breadth_first` traversal."""
+        adj = [[1, 2, 3], [], [4], [], [], [0]]
+        dist, parent = g.frontier_breadth_first(adj)
+        assert list(dist) == [0, 1, 1, 1, 2, -1]
+        assert list(parent) == [0, 0, 0, 0, 2, -1]
+        dist, parent = g.frontier_breadth_first(g.Graph.from_adj(adj), [5, 2])
+        assert list(dist) == [1, 2, 0, 2, 1, 0]
+        assert list(parent) == [5, 0, 2, 0, 2, 5]
+        dist, _ = g.frontier_breadth_first(adj, [])
+        assert list(dist) == [-1] * 6
+
     def test_depth_first(self):
         """Test `depth_first` traversal."""
         adj = [[1, 2, 3], [], [4], [], []]
@@ -22,6 +128,25 @@ class TestGraphs(unittest.TestCase):
         """Test `circle_of_words`."""
         assert g.circle_of_words(["abc", "cde", "eda"])
         assert not g.circle_of_words(["abc", "cde", "edf"])
+        assert not g.circle_of_words(["abc", "cda", "xyx"])
+        assert g.circle_of_words(["ab", "ba", "ac", "ca", "aa"])
+        assert g.circle_of_words([])
+        words = [f"{97 + i % 26:c}-{97 + (i + 1) % 26:c}" for i in range(26 * 4000)]
+        assert g.circle_of_words(words)
+
+    def test_eulerian_path(self):
+        """Test `eulerian_path`."""
+        adj = [[1, 2], [2], [0, 3], []]
+        assert g.eulerian_path(adj) == [0, 1, 2, 0, 2, 3]
+        assert g.eulerian_path(adj, circuit=True) is None
+        adj = [[1, 1], [0, 2], [0]]
+        assert g.eulerian_path(adj, circuit=True) == [0, 1, 0, 1, 2, 0]
+        assert g.eulerian_path([[1], [0], [3], [2]]) is None
+        assert g.eulerian_path([[1, 2], [], []]) is None
+        assert g.eulerian_path([[], []]) == []
+        n = 100000
+        gr = g.Graph.from_edges([(i, (i + 1) % n) for i in range(n)])
+        assert g.eulerian_path(gr, circuit=True) == [*range(n), 0]
 
     def test_articulation_points(self):
         """Test `articulation_points`."""
@@ -173,6 +298,22 @@ class TestGraphs(unittest.TestCase):
         adj = [[1], [0, 4], [4, 3], [4, 2], [1, 2, 3]]
         assert [1, 4] == g.articulation_points_recursive(adj)
 
+    def test_biconnected(self):
+        """Test `biconnected`."""
+        adj = [[1, 2], [0, 2], [0, 1, 3], [2, 4, 5], [3, 5], [3, 4], [], [8], [7]]
+        points, bridges, components = g.biconnected(adj)
+        assert points == [2, 3]
+        assert bridges == [(2, 3), (7, 8)]
+        assert components == [[0, 1, 2], [2, 3], [3, 4, 5], [7, 8]]
+        assert g.biconnected([[1, 1], [0, 0]]) == ([], [], [[0, 1]])
+        assert g.biconnected([]) == ([], [], [])
+        # A path deeper than the recursion limit.
+        n = 100000
+        gr = g.Graph.from_edges([(i, i + 1) for i in range(n - 1)], undirected=True)
+        points, bridges, components = g.biconnected(gr)
+        assert points == list(range(1, n - 1))
+        assert len(bridges) == len(components) == n - 1
+
     def test_critical_connections(self):
         """Test `critical_connections`."""
         adj = [[1, 2], [0], [0]]
@@ -218,6 +359,29 @@ class TestGraphs(unittest.TestCase):
         scc = [[0], [1, 3, 4, 6, 7], [2], [5]]
         assert scc == g.strongly_connected_components(adj)
 
+    def test_incremental_scc(self):
+        """Test `IncrementalSCC`."""
+        scc = g.IncrementalSCC(6, [(0, 1), (1, 2), (3, 4)])
+        assert scc.components() == [[0], [1], [2], [3], [4], [5]]
+        assert not scc.add_edge(4, 0)
+        assert scc.topological_order().index(4) < scc.topological_order().index(0)
+        assert scc.add_edge(2, 0)
+        assert scc.components() == [[0, 1, 2], [3], [4], [5]]
+        assert scc.connected(0, 2)
+        assert not scc.connected(2, 3)
+        assert scc.add_edges([(1, 5), (4, 5)]) == 0
+        assert scc.add_edges([(2, 3), (5, 5)]) == 1
+        assert scc.components() == [[0, 1, 2, 3, 4], [5]]
+        assert scc.condensation() == {scc.component(3): {5}, 5: set()}
+        scc = g.IncrementalSCC(4, [(2, 0), (0, 1), (3, 2)])
+        c = scc.component
+        assert scc.topological_order() == [c(3), c(2), c(0), c(1)]
+        assert scc.condensation() == {3: {2}, 2: {0}, 0: {1}, 1: set()}
+        adj = [[], [3], [1], [9, 0, 8], [5], [4, 3], [6], [3], [5, 6], [5, 9]]
+        edges = ((a, b) for a, bs in enumerate(adj) for b in bs)
+        scc = g.IncrementalSCC(len(adj), edges)
+        assert scc.components() == g.strongly_connected_components(adj)
+
     def test_strongly_connected_components_recursive(self):
         """Test `strongly_connected_components_recursive`."""
         adj = [[1], [2, 3], [0], [4], [5], [3]]
@@ -244,10 +408,11 @@ class TestGraphs(unittest.TestCase):
 
     def test_vertex_cover_optimal(self):
         """Test `vertex_cover_optimal`."""
-        assert {1} == g.vertex_cover_optimal([[1, 2]])
-        assert {1, 2, 3} == g.vertex_cover_optimal(
-            [[1, 2], [4, 1], [2, 4], [3, 4], [5, 2], [1, 3]],
-        )
+        assert g.vertex_cover_optimal([[1, 2]]) in ({1}, {2})
+        edges = [[1, 2], [4, 1], [2, 4], [3, 4], [5, 2], [1, 3]]
+        cover = g.vertex_cover_optimal(edges)
+        assert len(cover) == 3
+        assert all(set(e) & cover for e in edges)
 
     def test_word_distance(self):
         """Test `word_distance`."""
@@ -280,6 +445,20 @@ class TestGraphs(unittest.TestCase):
             ["lkljl", "lklll", "ljlll", "ljkll"],
         ] == g.word_paths(WORDS, "lkljl", "ljkll")
 
+    def test_word_ladder(self):
+        """Test `WordLadder`."""
+        wl = g.WordLadder(["hot", "dot", "dog", "lot", "log", "cog"])
+        assert wl.buckets["*og"] == ["cog", "dog", "log"]
+        assert list(wl.neighbors("hot")) == ["dot", "lot"]
+        assert wl.distance("hit", "cog") == 5
+        assert wl.distance("hit", "cot") == 3
+        assert wl.distance("hit", "cat") == 0
+        assert wl.distance("hit", "hiss") == 0
+        ladders = wl.paths("hit", "cog")
+        assert next(ladders) == ["hit", "hot", "dot", "dog", "cog"]
+        assert list(ladders) == [["hit", "hot", "lot", "log", "cog"]]
+        assert list(wl.paths("hit", "cot")) == []
+
 
 # Test set for graph problems using a word list as adjacency list.
 WORDS = tuple(
@@ -1,8 +1,11 @@
 """Test module for the search."""
 
+import math
 import unittest
 from typing import Callable
 
+import pytest
+
 import grid as g
 from grid import parse
 
@@ -27,6 +30,7 @@ class TestGrid(unittest.TestCase):
             )
             == 45
         )
+        assert g.dijkstra([[1, 0.5], [0.5, 1]]) == 2.5
 
     def test_a_star(self):
         """Test the `a_star_grid` search function."""
@@ -43,6 +47,46 @@ class TestGrid(unittest.TestCase):
             )
             == 45
         )
+        assert g.a_star([[1, 0.5], [0.5, 1]]) == 2.5
+
+    def test_cost_grid(self):
+        """Test `CostGrid`."""
+        inf = math.inf
+        c = g.CostGrid([[1, 1, 1, 1, 1], [1, inf, inf, inf, 1], [1, 5, 1, 0, 1]])
+        assert c.shortest_path((2, 1), (2, 2)) == (1, [(2, 1), (2, 2)])
+        assert c.shortest_path((2, 0), (2, 4)) == (
+            7,
+            [(2, 0), (2, 1), (2, 2), (2, 3), (2, 4)],
+        )
+        assert c.shortest_path((0, 0), (2, 3)) == (
+            6,
+            [(0, 0), (0, 1), (0, 2), (0, 3), (0, 4), (1, 4), (2, 4), (2, 3)],
+        )
+        assert c.shortest_path((0, 0), (1, 1)) == (inf, [])
+        dist, parent = c.search([(2, 0), (2, 4)])
+        assert dist.tolist() == [
+            [2, 3, 4, 3, 2],
+            [1, inf, inf, inf, 1],
+            [0, 5, 1, 0, 0],
+        ]
+        assert parent[2, 0] == 10
+        assert c.path(parent, (2, 2)) == [(2, 4), (2, 3), (2, 2)]
+        assert c.path(parent, (1, 2)) == []
+
+        m = [[1, 9, 9], [9, 1, 9], [9, 9, 1], [9, 9, 1]]
+        d = g.CostGrid(m, diagonal=True)
+        assert d.shortest_path((0, 0), (3, 2)) == (3, [(0, 0), (1, 1), (2, 2), (3, 2)])
+        assert g.CostGrid(m).shortest_path((0, 0), (3, 2))[0] == 21
+        # The median cost sets the buckets, so a tiny cost does not make many.
+        f = g.CostGrid([[0.5, 0.25, 1e-6], [0.75, 2.5, 0.5]])
+        assert f.delta == 0.5
+        cost, path = f.shortest_path((0, 0), (1, 2))
+        assert math.isclose(cost, 0.750001)
+        assert path == [(0, 0), (0, 1), (0, 2), (1, 2)]
+        with pytest.raises(ValueError, match="negative"):
+            g.CostGrid([[1, -1]])
+        with pytest.raises(IndexError):
+            d.search([(4, 0)])
 
     def test_connect_islands(self):
         """Test `connect_islands`."""
@@ -28,12 +28,14 @@ class TestMatrixPuzzles(unittest.TestCase):
         """Test `optimum_multiplications`."""
         assert m.optimum_multiplications([2, 40, 2, 40, 5]) == 580
         assert m.optimum_multiplications([40, 20, 30, 10, 30]) == 26000
+        assert m.optimum_multiplications([10**7] * 4) == 2 * 10**21
 
     def test_balloon_coin_popping(self):
         assert m.balloon_coin_popping([]) == 0
         assert m.balloon_coin_popping([5]) == 5
         assert m.balloon_coin_popping([5, 10]) == 60
         assert m.balloon_coin_popping([3, 1, 5, 8]) == 167
+        assert m.balloon_coin_popping([10**7] * 3) == 10**21 + 10**14 + 10**7
 
     def test_optimum_brackets(self):
         """Test `optimum_brackets`."""
@@ -42,6 +44,7 @@ class TestMatrixPuzzles(unittest.TestCase):
         assert m.optimum_brackets([1, 2, 3, 4, 5]) == "ABCD"
         assert m.optimum_brackets([5, 4, 3, 2, 1]) == "A(B(CD))"
         assert m.optimum_brackets([4, 2, 3, 1, 3]) == "A(BC)D"
+        assert m.optimum_brackets([10**7, 1, 10**7, 10**7, 10**7]) == "A(BCD)"
 
     def test_max_sum_rectangle(self):
         """Test `max_sum_rectangle`."""
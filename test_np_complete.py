@@ -2,6 +2,8 @@
 
 import unittest
 
+import numpy as np
+
 import np_complete as npc
 
 
@@ -28,3 +30,33 @@ class TestNPComplete(unittest.TestCase):
         assert not npc.just_add_operators("3216", 19)
         assert npc.just_add_operators("1054", 4) == ["1*0*5+4"]
         assert not npc.just_add_operators("33", 14)
+
+    def test_vertex_cover(self):
+        """Test `vertex_cover`."""
+        assert npc.vertex_cover([]) == set()
+        assert npc.vertex_cover([(1, 1), (1, 2)]) == {1}
+        assert npc.vertex_cover([("a", "b"), ("a", "c"), ("a", "d")]) == {"a"}
+        # A 5-cycle and a star with its center in the cycle.
+        edges = [(i, (i + 1) % 5) for i in range(5)] + [(0, i) for i in range(5, 9)]
+        cover = npc.vertex_cover(edges)
+        assert len(cover) == 3
+        assert 0 in cover
+        assert all(a in cover or b in cover for a, b in edges)
+        # The Petersen graph.
+        edges = [(i, (i + 1) % 5) for i in range(5)]
+        edges += [(i, i + 5) for i in range(5)]
+        edges += [(5 + i, 5 + (i + 2) % 5) for i in range(5)]
+        assert len(npc.vertex_cover(edges)) == 6
+        assert len(npc.vertex_cover(edges, budget=0)) >= 6
+        # Random graphs with a few hundred vertices.
+        rng = np.random.default_rng(0)
+        edges = [rng.choice(300, 2, replace=False).tolist() for _ in range(450)]
+        cover = npc.vertex_cover(edges)
+        assert all(a in cover or b in cover for a, b in edges)
+        assert len(cover) <= len(npc.vertex_cover(edges, budget=0))
+
+    def test_independent_set(self):
+        """Test `independent_set`."""
+        edges = [(i, (i + 1) % 6) for i in range(6)]
+        assert npc.independent_set(range(7), edges) in ({0, 2, 4, 6}, {1, 3, 5, 6})
+        assert npc.independent_set(range(3), []) == {0, 1, 2}
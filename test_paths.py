@@ -0,0 +1,65 @@
+"""Test module for the weighted shortest path searches."""
+
+import math
+import unittest
+
+import paths as p
+
+EDGES = {0: [(1, 4), (2, 1)], 1: [(3, 1)], 2: [(1, 2), (3, 5)], 3: [], 4: [(0, 1)]}
+REVERSE = {0: [(4, 1)], 1: [(0, 4), (2, 2)], 2: [(0, 1)], 3: [(1, 1), (2, 5)], 4: []}
+
+neighbors = EDGES.__getitem__
+reverse = REVERSE.__getitem__
+
+
+class TestPaths(unittest.TestCase):
+    """Test class for the weighted shortest path searches."""
+
+    def test_path(self):
+        """Test `path`."""
+        assert p.path({0: 0, 1: 0, 2: 1}, 2) == [0, 1, 2]
+        assert p.path({0: 0}, 0) == [0]
+        assert p.path({0: 0}, 1) == []
+
+    def test_dijkstra(self):
+        """Test `dijkstra`."""
+        dist, parent = p.dijkstra(neighbors, [0])
+        assert dist == {0: 0, 1: 3, 2: 1, 3: 4}
+        assert parent == {0: 0, 1: 2, 2: 0, 3: 1}
+        dist, _ = p.dijkstra(neighbors, [2, 4])
+        assert dist == {0: 1, 1: 2, 2: 0, 3: 3, 4: 0}
+        dist, _ = p.dijkstra(neighbors, [0], target=2)
+        assert dist == {0: 0, 2: 1}
+
+    def test_shortest_path(self):
+        """Test `shortest_path`."""
+        assert p.shortest_path(neighbors, 4, 3) == (5, [4, 0, 2, 1, 3])
+        assert p.shortest_path(neighbors, 0, lambda n: n % 2) == (3, [0, 2, 1])
+        assert p.shortest_path(neighbors, 3, 0) == (math.inf, [])
+        # A* on a line with the exact remaining distance as heuristic.
+        line = lambda n: [(n + 1, 1)] if n < 100 else []
+        dist, _ = p.dijkstra(line, [0], 100, heuristic=lambda n: 100 - n)
+        assert dist[100] == 100
+        assert p.shortest_path(line, 0, 100, lambda n: 100 - n)[1] == list(range(101))
+
+    def test_bidirectional_dijkstra(self):
+        """Test `bidirectional_dijkstra`."""
+        expected = (5, [4, 0, 2, 1, 3])
+        assert p.bidirectional_dijkstra(neighbors, 4, 3, reverse) == expected
+        assert p.bidirectional_dijkstra(neighbors, 0, 2, reverse) == (1, [0, 2])
+        assert p.bidirectional_dijkstra(neighbors, 2, 2, reverse) == (0, [2])
+        assert p.bidirectional_dijkstra(neighbors, 3, 0, reverse) == (math.inf, [])
+        undirected = lambda n: [(m, 1) for m in (n - 1, n + 1) if 0 <= m < 10]
+        assert p.bidirectional_dijkstra(undirected, 7, 2) == (5, [7, 6, 5, 4, 3, 2])
+
+    def test_layered(self):
+        """Test `layered`."""
+        # Walk a line of walls, breaking at most `k` walls at cost 1 each.
+        walls = "..#.##."
+        step = lambda n: [
+            (m, 1, walls[m] == "#") for m in (n - 1, n + 1) if 0 <= m < len(walls)
+        ]
+        goal = lambda s: s[0] == len(walls) - 1
+        assert p.shortest_path(p.layered(step, 3), (0, 0), goal)[0] == 6
+        assert p.shortest_path(p.layered(step, 3), (0, 0), goal)[1][-1] == (6, 3)
+        assert p.shortest_path(p.layered(step, 2), (0, 0), goal)[0] == math.inf
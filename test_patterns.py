@@ -0,0 +1,92 @@
+"""Test module for the pattern search puzzles."""
+
+import unittest
+from io import StringIO
+
+import patterns as p
+
+
+class TestPatterns(unittest.TestCase):
+    """Test class for the pattern search puzzles."""
+
+    def test_prefix_function(self):
+        """Test `prefix_function`."""
+        assert p.prefix_function("") == []
+        assert p.prefix_function("abcd") == [0, 0, 0, 0]
+        assert p.prefix_function("aaaaa") == [0, 1, 2, 3, 4]
+        assert p.prefix_function("aabaaab") == [0, 1, 0, 1, 2, 2, 3]
+        assert p.prefix_function([1, 2, 1, 2]) == [0, 0, 1, 2]
+
+    def test_z_function(self):
+        """Test `z_function`."""
+        assert p.z_function("") == []
+        assert p.z_function("aaaaa") == [5, 4, 3, 2, 1]
+        assert p.z_function("aaabaab") == [7, 2, 1, 0, 2, 1, 0]
+        assert p.z_function("abacaba") == [7, 0, 1, 0, 3, 0, 1]
+
+    def test_kmp_search(self):
+        """Test `kmp_search`."""
+        assert list(p.kmp_search("abc", "")) == []
+        assert list(p.kmp_search("abc", "d")) == []
+        assert list(p.kmp_search("aaaa", "aa")) == [0, 1, 2]
+        assert list(p.kmp_search(iter("abababcab"), "abab")) == [0, 2]
+        assert list(p.kmp_search([3, 1, 3, 1, 3], [3, 1, 3])) == [0, 2]
+
+    def test_suffix_prefix_overlap(self):
+        """Test `suffix_prefix_overlap`."""
+        assert p.suffix_prefix_overlap("", "abc") == 0
+        assert p.suffix_prefix_overlap("xxab", "abc") == 2
+        assert p.suffix_prefix_overlap("abc", "abc") == 3
+        assert p.suffix_prefix_overlap("aaaa", "aa") == 2
+        assert p.suffix_prefix_overlap("abab", "abc") == 2
+
+    def test_find_all(self):
+        """Test `find_all`."""
+        assert list(p.find_all("abc", "")) == [0, 1, 2, 3]
+        assert list(p.find_all("abc", "d")) == []
+        assert list(p.find_all("a" * 10, "aaa")) == list(range(8))
+        assert list(p.find_all("abababab", "abab")) == [0, 2, 4]
+        assert list(p.find_all("abcabcxabc", "abc", 1)) == [3, 7]
+        text = "abaabaabaababaaabaaba" * 7
+        for pat in ("aba", "abaaba", "baab", "aab"):
+            assert list(p.find_all(text, pat)) == list(p.kmp_search(text, pat))
+
+    def test_stream_search(self):
+        """Test `stream_search`."""
+        assert list(p.stream_search(["ab", "ca", "bc"], "abc")) == [0, 3]
+        assert list(p.stream_search(["a", "a", "", "a", "a"], "aa")) == [0, 1, 2]
+        assert list(p.stream_search(["xa", "b", "c"], "abc")) == [1]
+        f = StringIO("needle in a haystack with a needle" * 3)
+        chunks = iter(lambda: f.read(5), "")
+        assert list(p.stream_search(chunks, "needle")) == [0, 28, 34, 62, 68, 96]
+
+    def test_wildcards(self):
+        """Test `Wildcards`."""
+        w = p.Wildcards(["a*", "*b", "?", "a**?c"])
+        assert w.match("a")
+        assert w.match("cb")
+        assert not w.match("")
+        assert not w.match("ca")
+        assert w.matches("abc") == ["a*", "a**?c"]
+        assert w.matches("ab") == ["a*", "*b"]
+        assert w.matches("c") == ["?"]
+        assert w.matches("cc") == []
+        w = p.Wildcards([])
+        assert not w.match("")
+        w = p.Wildcards(["*a*"], cache_size=2)
+        assert w.match("bbbbab")
+        assert len(w.delta) <= 2
+
+    def test_compile_pattern(self):
+        """Test `compile_pattern`."""
+        assert p.compile_pattern("?*a*") is p.compile_pattern("?*a*")
+        assert p.compile_pattern("?*a*").match("cart")
+        assert not p.compile_pattern("?*a*").match("ab")
+        assert p.compile_pattern("").match("")
+        assert not p.compile_pattern("").match("a")
+
+    def test_match_many(self):
+        """Test `match_many`."""
+        assert p.match_many([], "abc") == []
+        assert p.match_many(["*", "a?c", "?b?", "abd"], "abc") == ["*", "a?c", "?b?"]
+        assert p.match_many(["*", "a?c", "?b?", "abd"], "") == ["*"]
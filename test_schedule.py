@@ -1,8 +1,14 @@
 """Test module for the schedule or interval based puzzles."""
 
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import numpy as np
+import pytest
 
 import schedule as s
+import topological
 
 
 class TestSchedule(unittest.TestCase):
@@ -13,3 +19,88 @@ class TestSchedule(unittest.TestCase):
         assert s.meetings([1], [2]) == 1
         assert s.meetings([1, 3, 0, 5, 8, 5], [2, 4, 6, 7, 9, 9]) == 4
         assert s.meetings([1], [2]) == 1
+
+    def test_select_meetings(self):
+        """Test `select_meetings`."""
+        start, end = [1, 3, 0, 5, 8, 5], [2, 4, 6, 7, 9, 9]
+        assert list(s.select_meetings(start, end)) == [0, 1, 3, 4]
+        assert list(s.select_meetings([1, 2], [2, 3])) == [0]
+        assert list(s.select_meetings(np.array([]), np.array([]))) == []
+
+    def test_min_rooms(self):
+        """Test `min_rooms`."""
+        start = [900, 940, 950, 1100, 1500, 1800]
+        end = [910, 1200, 1120, 1130, 1900, 2000]
+        assert s.min_rooms(start, end) == 3
+        assert s.min_rooms([1, 2], [2, 3]) == 2
+        assert s.min_rooms([1, 3], [2, 4]) == 1
+        assert s.min_rooms([], []) == 0
+
+    def test_max_weight_meetings(self):
+        """Test `max_weight_meetings`."""
+        start, end = [1, 2, 4, 6, 5, 7], [3, 5, 6, 7, 8, 9]
+        weight = [5, 6, 5, 4, 11, 2]
+        total, picks = s.max_weight_meetings(start, end, weight)
+        assert total == 16
+        assert list(picks) == [0, 4]
+        total, picks = s.max_weight_meetings([0, 1], [1, 2], [0.5, 0.25])
+        assert total == 0.5
+        assert list(picks) == [0]
+        assert s.max_weight_meetings([], [], [])[0] == 0
+
+    def test_interval_tree(self):
+        """Test `IntervalTree`."""
+        tree = s.IntervalTree([5, 1, 8, 3, 20], [9, 4, 8, 6, 30])
+        assert len(tree) == 5
+        assert list(tree.overlaps(4, 7)) == [1, 3, 0]
+        assert list(tree.stab(8)) == [0, 2]
+        assert list(tree.overlaps(10, 19)) == []
+        assert list(tree.overlaps(0, 0)) == []
+        rng = np.random.default_rng(0)
+        start = rng.integers(0, 10**6, 10**4)
+        end = start + rng.integers(0, 10**3, 10**4)
+        tree = s.IntervalTree(start, end)
+        for t in rng.integers(0, 10**6, 10):
+            expected = np.flatnonzero((start <= t + 100) & (end >= t))
+            assert (np.sort(tree.overlaps(t, t + 100)) == expected).all()
+        assert list(s.IntervalTree([], []).stab(1)) == []
+
+    def test_run_tasks(self):
+        """Test `run_tasks`."""
+        log = []
+        task = lambda name: log.append(name) or name.upper()
+        tasks = {n: partial(task, n) for n in "abcxyz"}
+        deps = {"y": ["x"], "z": ["y"], "c": ["a"]}
+        runs = s.run_tasks(tasks, deps, workers=1)
+        # The longest chains of remaining tasks first, ties as they got ready.
+        assert log == ["x", "a", "y", "b", "c", "z"]
+        assert {t: r.result for t, r in runs.items()} == {t: t.upper() for t in tasks}
+        assert all(r.error is None and r.start <= r.end for r in runs.values())
+        log.clear()
+        s.run_tasks(tasks, deps, workers=1, costs={"b": 5})
+        assert log[0] == "b"
+        fail = lambda: 1 // 0
+        tasks |= {"x": fail}
+        with ThreadPoolExecutor(2) as ex:
+            runs = s.run_tasks(tasks, deps, executor=ex)
+        assert isinstance(runs["x"].error, ZeroDivisionError)
+        assert isinstance(runs["z"].error, s.DependencyError)
+        assert runs["z"].error.task == "x"
+        assert runs["c"].result == "C"
+        cycle = {"a": ["c"], "c": ["a"]}
+        with pytest.raises(topological.CycleError):
+            s.run_tasks(tasks, cycle)
+        with pytest.raises(ValueError, match="q"):
+            s.run_tasks(tasks, {"a": ["q"]})
+
+    def test_critical_path(self):
+        """Test `critical_path`."""
+        run = lambda d: s.TaskRun(None, None, 0, d, d)
+        runs = {"a": run(1), "b": run(5), "c": run(2), "d": run(1)}
+        deps = {"b": ["a"], "c": ["a"], "d": ["b", "c"]}
+        assert s.critical_path(runs, deps) == (7, ["a", "b", "d"])
+        assert s.critical_path({}, {}) == (0, [])
+        with pytest.raises(ValueError, match="unknown task: q"):
+            s.critical_path(runs, {"d": ["q"]})
+        with pytest.raises(ValueError, match="unknown task: q"):
+            s.critical_path(runs, {"q": ["a"]})
@@ -1,6 +1,10 @@
 """Test module for the graph based puzzles."""
 
+import tempfile
 import unittest
+from pathlib import Path
+
+import numpy as np
 
 import sets as s
 
@@ -8,6 +12,70 @@ import sets as s
 class TestSets(unittest.TestCase):
     """Test class for the set based puzzles."""
 
+    def test_disjoint(self):
+        """Test `Disjoint`."""
+        d = s.Disjoint(6)
+        assert d.union_many([(0, 1), (2, 3), (1, 0), (3, 4)]) == 3
+        assert len(d) == 6
+        assert d.count == 3
+        assert d.find(1) == d.find(0)
+        assert d.component_size(4) == 3
+        assert d.component_size(5) == 1
+        assert list(d.find_many([0, 4, 5])) == [d.find(0), d.find(2), 5]
+        assert d.components() == [[0, 1], [2, 3, 4], [5]]
+        assert d.union(1, 2) == d.find(4)
+        assert d.components() == [[0, 1, 2, 3, 4], [5]]
+        assert s.Disjoint(0).components() == []
+
+    def test_rollback_disjoint(self):
+        """Test `RollbackDisjoint`."""
+        d = s.RollbackDisjoint(5)
+        assert d.union(0, 1)
+        assert not d.union(1, 0)
+        checkpoint = d.checkpoint()
+        assert d.union(1, 2)
+        assert d.union(3, 4)
+        assert d.count == 2
+        assert d.connected(0, 2)
+        d.rollback(checkpoint)
+        assert d.count == 4
+        assert d.connected(0, 1)
+        assert not d.connected(0, 2)
+        assert not d.connected(3, 4)
+        d.rollback()
+        assert len(d) == d.count == 5
+
+    def test_dynamic_connectivity(self):
+        """Test `dynamic_connectivity`."""
+        events = [
+            ("query", 0, 1),
+            ("add", 0, 1),
+            ("add", 1, 2),
+            ("query", 0, 2),
+            ("add", 2, 1),
+            ("remove", 1, 2),
+            ("query", 2, 0),
+            ("remove", 2, 1),
+            ("query", 0, 2),
+            ("query", 1, 0),
+            ("query", 3, 3),
+        ]
+        assert s.dynamic_connectivity(4, events) == [
+            False, True, True, False, True, True
+        ]
+        assert s.dynamic_connectivity(2, [("add", 0, 1)]) == []
+
+    def test_connected_components(self):
+        """Test `connected_components`."""
+        edges = [(1, 2), (4, 3), (2, 0), (5, 5)]
+        assert list(s.connected_components(edges)) == [0, 0, 0, 3, 3, 5]
+        assert list(s.connected_components(edges, n=7)) == [0, 0, 0, 3, 3, 5, 6]
+        assert list(s.connected_components([], n=2)) == [0, 1]
+        # A long path, split into shards processed in parallel.
+        n = 1 << 17
+        edges = np.stack((np.arange(1, n), np.arange(n - 1)), axis=1)[::-1]
+        assert not s.connected_components(edges, workers=2, shards=3).any()
+
     def test_weighted_paths_in_tree(self):
         """Test `weighted_paths_in_tree`."""
         assert [1] == s.weighted_paths_in_tree([[1, 2, 1], [2, 3, 4]], [3])
@@ -56,6 +124,27 @@ class TestSets(unittest.TestCase):
             ["Kevin", "Kevin0@m.co", "Kevin3@m.co", "Kevin5@m.co"],
         ]
 
+    def test_merge_email_account_files(self):
+        """Test `merge_email_account_files`."""
+        accounts = [
+            "John,johnsmith@mail.com,john_newyork@mail.com",
+            "Mary,mary@mail.com",
+            "John,johnnybravo@mail.com",
+            "John,john00@mail.com,johnsmith@mail.com",
+            "Anne",
+            "Mary,mary@mail.com,mary2@mail.com",
+        ]
+        with tempfile.TemporaryDirectory() as d:
+            src, dst = Path(d) / "accounts.csv", Path(d) / "merged.csv"
+            src.write_text("\n".join(accounts) + "\n")
+            for chunk in (1, 2, 100):
+                assert s.merge_email_account_files(src, dst, chunk=chunk) == 3
+                assert dst.read_text().splitlines() == [
+                    "John,john00@mail.com,john_newyork@mail.com,johnsmith@mail.com",
+                    "John,johnnybravo@mail.com",
+                    "Mary,mary2@mail.com,mary@mail.com",
+                ]
+
     def test_crazy_chemist_mix(self):
         assert s.crazy_chemist_mix([[1, 2], [2, 3], [1, 3]], [[1, 2], [1, 3]]) == [
             0,
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import unittest
 
+import pytest
+
 import sorting as s
 
 
@@ -51,6 +53,22 @@ class TestSorting(unittest.TestCase):
         assert sort([9, 4, 8, 4, 5, 3, 3, 2, 1, 0]) == [0, 1, 2, 3, 3, 4, 4, 5, 8, 9]
         assert sort([9, 4, 8, 4, 5, 3, 3, 2, 4, 0]) == [0, 2, 3, 3, 4, 4, 4, 5, 8, 9]
 
+    def test_external_sort(self):
+        """Test `external_sort`."""
+        lines = [str(i * 7 % 31) for i in range(100)]
+        for chunk in (1, 7, 1000):
+            assert list(s.external_sort(lines, int, chunk)) == sorted(lines, key=int)
+        assert list(s.external_sort(["b", "a", "ab"], len, 2)) == ["b", "a", "ab"]
+        assert not list(s.external_sort([]))
+        # 34 runs merged 2 and 3 at a time in passes.
+        pairs = [f"{i % 5} {i}" for i in range(100)]
+        by_digit = sorted(pairs, key=lambda line: line[0])
+        for fan_in in (2, 3):
+            runs = s.external_sort(pairs, lambda line: line[0], 3, fan_in=fan_in)
+            assert list(runs) == by_digit
+        with pytest.raises(ValueError, match="fan_in"):
+            next(s.external_sort(pairs, fan_in=1))
+
     def test_selection_sort(self):
         self._test(s.selection)
 
@@ -2,6 +2,8 @@
 
 import unittest
 
+import pytest
+
 import strings as s
 
 
@@ -128,6 +130,25 @@ class TestStrings(unittest.TestCase):
             == 26
         )
 
+    def test_eertree(self):
+        """Test `Eertree`."""
+        t = s.Eertree()
+        assert len(t) == 0
+        assert t.occurrences() == {}
+        assert t.append("a")
+        assert t.append("a")
+        assert t.extend("ba") == 2
+        assert len(t) == 4
+        assert t.occurrences() == {"a": 3, "aa": 1, "b": 1, "aba": 1}
+        t = s.Eertree("abc")
+        assert not t.append("a")
+        assert t.occurrences() == {"a": 2, "b": 1, "c": 1}
+        t = s.Eertree("abaaaaabba")
+        assert len(t) == 10
+        assert t.occurrences()["aaaaa"] == 1
+        assert t.occurrences()["aa"] == 4
+        assert t.palindrome(t.last) == "abba"
+
     def test_palindromic_partitions(self):
         """Test the `palindromic_partitions` function."""
         assert s.palindromic_partitions("") == 0
@@ -147,6 +168,32 @@ class TestStrings(unittest.TestCase):
         assert s.palindromic_partitions("12abbacd@@dc") == 3
         assert s.palindromic_partitions("cd@dcaba12") == 3
         assert s.palindromic_partitions("cd@@dcabba12") == 3
+        assert s.palindromic_partitions("abb") == 1
+        assert s.palindromic_partitions("bacbbca") == 1
+
+    def test_palindrome_index(self):
+        """Test `PalindromeIndex`."""
+        p = s.PalindromeIndex("")
+        assert p.is_palindrome(0, 0)
+        assert p.count() == 0
+        assert p.longest() == (0, 0)
+        assert p.longest_prefix() == 0
+        assert p.min_cuts() == 0
+        p = s.PalindromeIndex("abaaaaabba")
+        assert p.is_palindrome(0, 3)
+        assert p.is_palindrome(1, 8)
+        assert p.is_palindrome(7, 9)
+        assert p.is_palindrome(4, 5)
+        assert not p.is_palindrome(0, 2)
+        assert not p.is_palindrome(5, 10)
+        assert p.count() == 24
+        assert p.longest() == (1, 8)
+        assert p.longest(0, 5) == (0, 3)
+        assert p.longest(5, 10) == (6, 10)
+        assert p.longest(8, 10) == (8, 9)
+        assert p.longest_prefix() == 3
+        assert p.min_cuts() == 2
+        assert s.PalindromeIndex("abb").min_cuts() == 1
 
     def test_subsequence_count(self):
         """Test the `subsequence_count` function."""
@@ -192,6 +239,15 @@ class TestStrings(unittest.TestCase):
         assert s.boolean_parentheses("T|F^F&T") == 5
         assert s.boolean_parentheses("T|F^F&T|F^F^F^T|T&T^T|F^T^F&F^T|T^F") == 99632640
 
+    def test_fix_palindrome(self):
+        """Test the `fix_palindrome` function."""
+        assert s.fix_palindrome("") == 0
+        assert s.fix_palindrome("aba") == 0
+        assert s.fix_palindrome("ab") == 1
+        assert s.fix_palindrome("abcd") == 3
+        assert s.fix_palindrome("aebcbda") == 2
+        assert s.fix_palindrome("geeksforgeeks") == 8
+
     def test_artistic_photo_count(self):
         """Test the `artistic_photo_count` function."""
         assert s.artistic_photo_count("APABA", 1, 2) == 1
@@ -214,6 +270,7 @@ class TestStrings(unittest.TestCase):
         assert ["ab", "ba"] == s.permutations("ab")
         assert ["abc", "acb", "bac", "bca", "cab", "cba"] == s.permutations("abc")
         assert len(s.permutations("abcd")) == 24
+        assert ["aab", "aab", "aba", "aba", "baa", "baa"] == s.permutations("aab")
 
     def test_pattern_match(self):
         """Test `pattern_match`."""
@@ -308,9 +365,14 @@ class TestStrings(unittest.TestCase):
         assert s.k_alphabet_string_with_all_substrings(5, 0) == ""
         assert s.k_alphabet_string_with_all_substrings(5, 1) == "00000"
         assert s.k_alphabet_string_with_all_substrings(2, 2) == "00110"
-        assert s.k_alphabet_string_with_all_substrings(3, 2) == "0001110100"
-        assert s.k_alphabet_string_with_all_substrings(2, 3) == "0011210220"
-        assert s.k_alphabet_string_with_all_substrings(1, 10) == "1234567890"
+        assert s.k_alphabet_string_with_all_substrings(3, 2) == "0001011100"
+        assert s.k_alphabet_string_with_all_substrings(2, 3) == "0010211220"
+        assert s.k_alphabet_string_with_all_substrings(1, 10) == "0123456789"
+        assert s.k_alphabet_string_with_all_substrings(2, 2, "ab") == "aabba"
+        for n, k in ((4, 3), (2, 12), (3, 5)):
+            o = s.k_alphabet_string_with_all_substrings(n, k)
+            assert len(o) == k**n + n - 1
+            assert len({o[i : i + n] for i in range(k**n)}) == k**n
 
     def test_longest_common_subsequence_length(self):
         """Test `longest_common_subsequence_length`."""
@@ -354,6 +416,31 @@ class TestStrings(unittest.TestCase):
             "baaa",
         ]
 
+    def test_longest_common_subsequence(self):
+        """Test `longest_common_subsequence`."""
+        assert s.longest_common_subsequence("", "bbb") == ""
+        assert s.longest_common_subsequence("aaa", "bbb") == ""
+        assert s.longest_common_subsequence("cfb", "aceba") == "cb"
+        assert s.longest_common_subsequence("abaaa", "abaaa") == "abaaa"
+        assert s.longest_common_subsequence("baabaca", "abaaa") in [
+            "aaaa",
+            "abaa",
+            "baaa",
+        ]
+        a, b = "ACCGGTCGAGTGCGCGGAAGCCGGCCGAA" * 20, "GTCGTTCGGAATGCCGTTGCTCTGTAAA" * 20
+        x = s.longest_common_subsequence(a, b)
+        assert len(x) == s.longest_common_subsequence_length(a, b)
+        assert s.longest_common_subsequence_length(x, a) == len(x)
+        assert s.longest_common_subsequence_length(x, b) == len(x)
+
+    def test_longest_common_subsequences(self):
+        """Test `longest_common_subsequences`."""
+        assert list(s.longest_common_subsequences("", "")) == [""]
+        assert list(s.longest_common_subsequences("ab", "cd")) == [""]
+        lcs = s.longest_common_subsequences("baabaca", "abaaa")
+        assert next(lcs) == "aaaa"
+        assert list(lcs) == ["abaa", "baaa"]
+
     def test_scrambled(self):
         """test_scrambled."""
         assert s.scrambled("coder", "ocder")
@@ -368,3 +455,11 @@ class TestStrings(unittest.TestCase):
         assert s.palindrome_pairs(["abc", "ba"])
         assert s.palindrome_pairs(["abc", "cba"])
         assert s.palindrome_pairs(["leekf", "leeks", "or", "keel", "abc", "bc"])
+
+    def test_alien_alphabet(self):
+        """Test `alien_alphabet`."""
+        assert s.alien_alphabet(["baa", "abcd", "abca", "cab", "cad"]) == "bdac"
+        assert s.alien_alphabet(["caa", "aaa", "aab"]) == "cab"
+        assert s.alien_alphabet(["x"]) == "x"
+        with pytest.raises(ValueError, match="cycle"):
+            s.alien_alphabet(["ab", "ba", "ac", "ca"])
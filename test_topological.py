@@ -0,0 +1,61 @@
+"""Test module for the topological orders."""
+
+import unittest
+
+import pytest
+
+import topological as t
+
+
+class TestTopological(unittest.TestCase):
+    """Test class for the topological orders."""
+
+    def test_layers(self):
+        """Test `layers`."""
+        adj = [[1, 2, 3], [], [4], [], [], [0]]
+        assert t.layers(adj) == [[5], [0], [1, 2, 3], [4]]
+        edges = {"lib": ["app", "test"], "gen": ["lib"], "test": []}
+        assert t.layers(["app", "test", "lib", "gen"], edges) == [
+            ["gen"],
+            ["lib"],
+            ["app", "test"],
+        ]
+        assert t.layers([]) == []
+        with pytest.raises(t.CycleError) as e:
+            t.layers([[1], [2], [0, 3], [], [2]])
+        assert e.value.cycle in ([0, 1, 2, 0], [1, 2, 0, 1], [2, 0, 1, 2])
+        with pytest.raises(t.CycleError) as e:
+            t.layers("ab", {"a": "a"})
+        assert e.value.cycle == ["a", "a"]
+
+    def test_order(self):
+        """Test `order`."""
+        assert t.order([[1, 2, 3], [], [4], [], [], [0]]) == [5, 0, 1, 2, 3, 4]
+        assert t.order("abc", {"c": "a", "a": "b"}) == ["c", "a", "b"]
+        with pytest.raises(ValueError, match="cycle"):
+            t.order("ab", {"a": "b", "b": "a"})
+
+    def test_reach_and_reorder(self):
+        """Test `reach` and `reorder`."""
+        out = [[1, 2], [3], [3], [0]]
+        assert t.reach(0, out.__getitem__, lambda n: n < 3) == {0: 0, 1: 0, 2: 0}
+        assert t.reach(1, out.__getitem__, lambda _: True) == {1: 1, 3: 1, 0: 3, 2: 0}
+        order = [0, 1, 2, 3, 4]
+        assert t.reorder(order, ([3, 1], [4, 0])) == [1, 3, 0, 4]
+        assert order == [3, 0, 2, 1, 4]
+
+    def test_incremental_order(self):
+        """Test `IncrementalOrder`."""
+        inc = t.IncrementalOrder(5, [(3, 2), (2, 1)])
+        assert inc.topological_order() == [0, 3, 2, 1, 4]
+        inc.add_edge(4, 3)
+        assert inc.topological_order() == [0, 4, 3, 2, 1]
+        inc.add_edge(0, 1)
+        assert inc.topological_order() == [0, 4, 3, 2, 1]
+        with pytest.raises(t.CycleError) as e:
+            inc.add_edge(1, 4)
+        assert e.value.cycle == [1, 4, 3, 2, 1]
+        assert inc.topological_order() == [0, 4, 3, 2, 1]
+        assert inc.layers() == [[0, 4], [3], [2], [1]]
+        with pytest.raises(t.CycleError):
+            inc.add_edge(0, 0)
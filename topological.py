@@ -0,0 +1,187 @@
+"""Topological orders of directed acyclic graphs (DAGs).
+
+A graph is given either by an `adj` list or a `graphs.Graph` with nodes
+`range(len(adj))`, or by any hashable `vertexes` and a dict of `edges`
+mapping a vertex to its successors.
+"""
+
+from __future__ import annotations
+
+from array import array
+from itertools import chain
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, MutableSequence, Sequence
+
+
+class CycleError(ValueError):
+    """A graph is not acyclic. The `cycle` lists its nodes, ending with the first."""
+
+    def __init__(self, cycle: list) -> None:
+        """Create the error for the `cycle` path."""
+        super().__init__("cycle: " + " -> ".join(map(str, cycle)))
+        self.cycle = cycle
+
+
+def _indexed(vertexes: Any, edges: dict | None) -> tuple[Sequence, Sequence]:
+    """Return the graph as an `adj` list of ints and the list of its vertexes."""
+    if edges is None:
+        return vertexes, range(len(vertexes))
+    kids = chain.from_iterable(edges.values())
+    names = list(dict.fromkeys(chain(vertexes, edges, kids)))
+    ids = {v: i for i, v in enumerate(names)}
+    return [[ids[c] for c in edges.get(v, ())] for v in names], names
+
+
+def _cycle(adj: Sequence[Sequence[int]], nodes: Iterable[int]) -> list[int]:
+    """Return a cycle of the `nodes` left over by Kahn's algorithm."""
+    # Each node left has a predecessor left, so walking the predecessors back
+    # from any of them closes a cycle.
+    left = set(nodes)
+    pred: dict[int, int] = {}
+    for n in left:
+        for c in adj[n]:
+            if c in left:
+                pred[c] = n
+    n = next(iter(left))
+    walk: dict[int, int] = {}
+    while n not in walk:
+        walk[n] = len(walk)
+        n = pred[n]
+    cycle = list(walk)[walk[n] :]
+    cycle.reverse()
+    return [n, *cycle[:-1], n]
+
+
+def layers(vertexes: Any, edges: dict | None = None) -> list[list]:
+    """Return the nodes in layers, each one depending only on the layers before.
+
+    The nodes of a layer do not depend on each other, so they can be processed
+    concurrently. Each layer keeps the nodes in the order given.
+    Raise `CycleError` if the graph has a cycle.
+    """
+    # Kahn's algorithm a layer at a time: the first layer are the nodes
+    # without incoming edges. Removing a layer removes the incoming edges of
+    # the nodes it points to, and those left without are the next layer.
+    adj, names = _indexed(vertexes, edges)
+    indeg = array("q", [0]) * len(adj)
+    for cs in adj:
+        for c in cs:
+            indeg[c] += 1
+    layer = [n for n in range(len(adj)) if not indeg[n]]
+    out = []
+    done = 0
+    while layer:
+        out.append(layer)
+        done += len(layer)
+        nxt = []
+        for n in layer:
+            for c in adj[n]:
+                indeg[c] -= 1
+                if not indeg[c]:
+                    nxt.append(c)
+        nxt.sort()
+        layer = nxt
+    if done < len(adj):
+        cycle = _cycle(adj, (n for n in range(len(adj)) if indeg[n]))
+        raise CycleError([names[n] for n in cycle])
+    return [[names[n] for n in layer] for layer in out]
+
+
+def order(vertexes: Any, edges: dict | None = None) -> list:
+    """Return the nodes in a topological order: each before its successors.
+
+    Raise `CycleError` if the graph has a cycle.
+    """
+    return list(chain.from_iterable(layers(vertexes, edges)))
+
+
+def reach(
+    start: int, step: Callable[[int], Iterable[int]], within: Callable[[int], bool]
+) -> dict[int, int]:
+    """Return the nodes reachable from `start`, mapped to their parents.
+
+    The search follows the successors `step(n)` of each node `n`, and visits
+    only the nodes passing `within`. The `start` is its own parent.
+    """
+    parent = {start: start}
+    stack = [start]
+    while stack:
+        n = stack.pop()
+        for c in step(n):
+            if c not in parent and within(c):
+                parent[c] = n
+                stack.append(c)
+    return parent
+
+
+def reorder(order: MutableSequence[int], groups: Iterable[Iterable[int]]) -> list[int]:
+    """Move the nodes of the `groups` one group after another within the `order`.
+
+    The nodes take over the positions `order[n]` of all the nodes, keeping their
+    relative order within each group. Return the moved nodes in the new order.
+    """
+    moved = [n for g in groups for n in sorted(g, key=order.__getitem__)]
+    for p, n in zip(sorted(map(order.__getitem__, moved)), moved, strict=True):
+        order[n] = p
+    return moved
+
+
+class IncrementalOrder:
+    """Topological order of a DAG of `n` nodes growing by edge insertions.
+
+    An edge that agrees with the order is just recorded. Otherwise, only
+    the nodes ordered between the two ends of the edge are searched
+    and reordered (Pearce-Kelly, see `reach` and `reorder`). Edges closing
+    a cycle are rejected.
+    """
+
+    def __init__(self, n: int, edges: Iterable[Sequence[int]] = ()) -> None:
+        """Create the order of `n` nodes, adding the `edges`."""
+        self.out: list[list[int]] = [[] for _ in range(n)]
+        self.inc: list[list[int]] = [[] for _ in range(n)]
+        self.order = array("q", range(n))  # position of each node
+        self.nodes = array("q", range(n))  # node at each position
+        self.add_edges(edges)
+
+    def __len__(self) -> int:
+        """Return the number of nodes."""
+        return len(self.nodes)
+
+    def add_edge(self, a: int, b: int) -> None:
+        """Add the edge from `a` to `b`, reordering the nodes if needed.
+
+        Raise `CycleError` if the edge closes a cycle. The graph is kept as is then.
+        """
+        # The nodes reachable from `b` and ordered up to `a` need to move
+        # after the nodes reaching `a` and ordered from `b`. They keep their
+        # relative order and take over the positions of both sets.
+        order = self.order
+        lo, hi = order[b], order[a]
+        if lo <= hi:
+            fwd = reach(b, self.out.__getitem__, lambda c: order[c] <= hi)
+            if a in fwd:
+                cycle = [a]
+                while cycle[-1] != b:
+                    cycle.append(fwd[cycle[-1]])
+                cycle.reverse()
+                raise CycleError([a, *cycle])
+            bwd = reach(a, self.inc.__getitem__, lambda c: order[c] >= lo)
+            for n in reorder(order, (bwd, fwd)):
+                self.nodes[order[n]] = n
+        self.out[a].append(b)
+        self.inc[b].append(a)
+
+    def add_edges(self, edges: Iterable[Sequence[int]]) -> None:
+        """Add the `edges`, see `add_edge`."""
+        for a, b in edges:
+            self.add_edge(a, b)
+
+    def topological_order(self) -> list[int]:
+        """Return the nodes in the topological order."""
+        return self.nodes.tolist()
+
+    def layers(self) -> list[list[int]]:
+        """Return the nodes in layers, see `layers`."""
+        return layers(self.out)